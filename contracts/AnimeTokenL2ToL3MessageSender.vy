@@ -44,6 +44,19 @@ INBOX: constant(address) = 0xA203252940839c8482dD4b938b4178f842E343D7
 L3_TARGET_CONTRACT: constant(address) = 0x08Fa26D7C129Ea51CCFf87109C382a532605E120
 ANIME_TOKEN: constant(address) = 0x37a645648dF29205C6261289983FB04ECD70b4B3
 
+# Ticket fees of sendToMainnetContractWithAnime and the defaults of sendWithCustomAnimeAmount (from the working tx),
+# estimate fees for the current L3 base fee with scripts/l3_fee_estimator.py instead
+DEFAULT_MAX_SUBMISSION_COST: constant(uint256) = 95 * 10**14     # ~0.0095 ETH
+DEFAULT_GAS_LIMIT: constant(uint256) = 300000                    # 300k gas
+DEFAULT_MAX_FEE_PER_GAS: constant(uint256) = 36000000            # 0.036 gwei
+DEFAULT_ANIME_TOKEN_FEE: constant(uint256) = 1001400000000000000 # ~1.0014 ANIME tokens
+# Bounds on caller supplied fees, the caps stop a mistyped fee from draining the caller
+MIN_GAS_LIMIT: constant(uint256) = 21000
+MAX_GAS_LIMIT: constant(uint256) = 5000000
+MAX_SUBMISSION_COST: constant(uint256) = 10**17                  # 0.1 ETH
+MAX_MAX_FEE_PER_GAS: constant(uint256) = 100000000000            # 100 gwei
+MAX_ANIME_TOKEN_FEE: constant(uint256) = 100 * 10**18            # 100 ANIME
+
 @external
 @payable
 def sendToMainnetContractWithAnime(_user_input_address: address):
@@ -54,10 +67,10 @@ def sendToMainnetContractWithAnime(_user_input_address: address):
     """
     # Optimized parameters based on successful mainnet transaction
     l2CallValue: uint256 = 0                       # No ETH sent to L3 call
-    max_submission_cost: uint256 = 95 * 10**14     # ~0.0095 ETH (from working tx)
-    gas_limit: uint256 = 300000                    # 300k gas (confirmed working)
-    max_fee_per_gas: uint256 = 36000000            # 0.036 gwei (from working tx)
-    token_total_fee: uint256 = 1001400000000000000 # ~1.0014 ANIME tokens
+    max_submission_cost: uint256 = DEFAULT_MAX_SUBMISSION_COST
+    gas_limit: uint256 = DEFAULT_GAS_LIMIT
+    max_fee_per_gas: uint256 = DEFAULT_MAX_FEE_PER_GAS
+    token_total_fee: uint256 = DEFAULT_ANIME_TOKEN_FEE
     
     # Check ANIME token allowance
     anime_token: IERC20 = IERC20(ANIME_TOKEN)
@@ -106,19 +119,25 @@ def sendToMainnetContractWithAnime(_user_input_address: address):
 def sendWithCustomAnimeAmount(
     _user_input_address: address,
     _anime_token_amount: uint256,
-    _max_submission_cost: uint256
+    _max_submission_cost: uint256,
+    _gas_limit: uint256 = DEFAULT_GAS_LIMIT,
+    _max_fee_per_gas: uint256 = DEFAULT_MAX_FEE_PER_GAS
 ):
     """
-    @notice Send message with custom ANIME token amount for gas
+    @notice Send message with custom ANIME token amount and ticket fees
     @dev User must approve this contract to spend ANIME tokens before calling
     @param _user_input_address The address parameter to pass to crossChainUpdate
-    @param _anime_token_amount Amount of ANIME tokens to use for L3 gas
+    @param _anime_token_amount Amount of ANIME tokens to use for L3 gas, must cover _gas_limit * _max_fee_per_gas
     @param _max_submission_cost ETH amount for submission cost
+    @param _gas_limit L3 gas limit of the crossChainUpdate call
+    @param _max_fee_per_gas Max L3 fee per gas
     """
-    # Fixed parameters based on working transaction
     l2CallValue: uint256 = 0
-    gas_limit: uint256 = 300000
-    max_fee_per_gas: uint256 = 36000000  # 0.036 gwei
+    assert _max_submission_cost > 0 and _max_submission_cost <= MAX_SUBMISSION_COST, "Invalid max submission cost"
+    assert _gas_limit >= MIN_GAS_LIMIT and _gas_limit <= MAX_GAS_LIMIT, "Invalid gas limit"
+    assert _max_fee_per_gas > 0 and _max_fee_per_gas <= MAX_MAX_FEE_PER_GAS, "Invalid max fee per gas"
+    assert _anime_token_amount >= _gas_limit * _max_fee_per_gas, "ANIME amount below the L3 gas cost"
+    assert _anime_token_amount <= MAX_ANIME_TOKEN_FEE, "ANIME amount too high"
     
     # Check ANIME token allowance and transfer
     anime_token: IERC20 = IERC20(ANIME_TOKEN)
@@ -144,8 +163,8 @@ def sendWithCustomAnimeAmount(
         _max_submission_cost,
         msg.sender,
         msg.sender,
-        gas_limit,
-        max_fee_per_gas,
+        _gas_limit,
+        _max_fee_per_gas,
         _anime_token_amount,
         call_data,
         value=msg.value
@@ -174,7 +193,7 @@ def getRequiredAnimeApproval() -> uint256:
     @notice Get the amount of ANIME tokens that need to be approved
     @return ANIME token amount for default mainnet transaction
     """
-    return 1001400000000000000  # ~1.0014 ANIME
+    return DEFAULT_ANIME_TOKEN_FEE  # ~1.0014 ANIME
 
 @external
 @view
@@ -183,7 +202,7 @@ def getMinimumETHForSubmission() -> uint256:
     @notice Get minimum ETH required for submission cost
     @return ETH amount (0.0095 ETH)
     """
-    return 95 * 10**14
+    return DEFAULT_MAX_SUBMISSION_COST
 
 @external
 @view
@@ -18,11 +18,32 @@
 # Constants for maximum array sizes
 MAX_UNVERIFIED_ART: constant(uint256) = 1000
 MAX_VERIFIED_ART: constant(uint256) = 1000
+# Owner changes are pushed to the cached owner of the first MAX_OWNER_PUSH_PIECES verified art pieces
+# (ArtPiece.refreshCachedOwner). Pieces only cache while the list is within the limit, and removals move
+# later pieces to lower indexes, so every piece with a cached owner stays inside the pushed range
+MAX_OWNER_PUSH_PIECES: constant(uint256) = 100
 GENERIC_ART_COMMISSION_HUB_CONTRACT: constant(address) = 0x1000000000000000000000000000000000000001
 
+# Summary of an art piece (matching ArtPiece)
+struct ArtPieceSummary:
+    artPiece: address
+    title: String[100]
+    description: String[400]
+    tokenURIDataFormat: String[10]
+    owner: address
+    artist: address
+    commissioner: address
+    artCommissionHub: address
+    artistVerified: bool
+    commissionerVerified: bool
+    fullyVerifiedCommission: bool
+    isPrivateOrNonCommissionPiece: bool
+    aiGenerated: bool
+
 # Interface for ArtPiece contract
 interface ArtPiece:
     def isFullyVerifiedCommission() -> bool: view
+    def getSummary() -> ArtPieceSummary: view
     def getArtist() -> address: view
     def getCommissioner() -> address: view
 
@@ -32,6 +53,7 @@ interface ArtCommissionHubOwners:
     def isAllowedToUpdateHubForAddress(_commission_hub: address, _user: address) -> bool: view
     def isApprovedArtPieceAddress(_art_piece: address) -> bool: view
     def isSystemAllowed(_address: address) -> bool: view
+    def recordVerifiedCommission(_art_piece: address): nonpayable
 
 # Single owner for the whole collection
 # Can be updated by anyone via L1/L2 QueryOwnership relay
@@ -67,6 +89,34 @@ unverifiedArtCommissionsCountByUser: public(HashMap[address, uint256])
 UNVERIFIED_ART_COMMISSIONS_PER_USER_LIMIT: constant(uint256) = 500
 unverifiedArtCommissionsRegistry: public(HashMap[address, bool])
 
+# Per-submitter quota, set by the hub owner (0 = UNVERIFIED_ART_COMMISSIONS_PER_USER_LIMIT)
+unverifiedArtCommissionsPerUserLimit: public(uint256)
+# Account charged against the quota and submission time of each unverified art piece
+unverifiedArtCommissionSubmitter: public(HashMap[address, address])
+unverifiedArtCommissionSubmittedAt: public(HashMap[address, uint256])
+
+# Resumable pruning of the unverified queue, walks from the end of the list towards index 0
+# Offset by one: 0 means no pruning pass in progress, N means index N - 1 is the next to check
+# A full batch of evictions stays well under the block gas limit (scripts/loop_cost_analyzer.py)
+MAX_PRUNE_BATCH: constant(uint256) = 100
+unverifiedPruneCursorOffsetByOne: public(uint256)
+
+# Resumable owner-change fan-out to the verified art pieces the owner sync didn't refresh, walks from the
+# first piece left by the sync towards the end of the list, each refreshed piece logs its own Transfer
+# Offset by one: 0 means no fan-out in progress, N means index N - 1 is the next to refresh
+MAX_OWNER_FAN_OUT_BATCH: constant(uint256) = 500
+# Every push needs this much gas left, well above one refresh, so a refresh never runs out of gas (and gets
+# skipped) because the caller's gas limit was too low, the whole call reverts instead
+OWNER_PUSH_GAS_RESERVE: constant(uint256) = 100000
+# Loops over pieces stop before a piece when less gas is left, one push plus storing the cursor
+OWNER_FAN_OUT_GAS_RESERVE: constant(uint256) = 150000
+# The owner sync stops pushing earlier, ArtCommissionHubOwners still moves the hub between the owner lists after it
+OWNER_SYNC_GAS_RESERVE: constant(uint256) = 300000
+ownerFanOutCursorOffsetByOne: public(uint256)
+# Bumped on every owner change before any art piece is refreshed. Pieces store the epoch they cached the hub
+# owner at and resolve the owner live once it differs, so a cached owner is never trusted past an owner change
+ownerEpoch: public(uint256)
+
 # Access lists
 whitelist: public(HashMap[address, bool])
 blacklist: public(HashMap[address, bool])
@@ -107,6 +157,16 @@ event CommissionerWhitelisted:
     commissioner: indexed(address)
     status: bool
 
+event UnverifiedCommissionsPruned:
+    pruned: uint256
+    remaining: uint256
+    passComplete: bool
+
+event OwnerFanOutProgressed:
+    refreshed: uint256
+    nextIndex: uint256
+    passComplete: bool
+
 
 @deploy
 def __init__():
@@ -179,6 +239,8 @@ def syncArtCommissionHubOwner(_chain_id: uint256, _nft_contract: address, _nft_t
         # Clear registration pending flag if it was set
         if self.registrationPending:
             self.registrationPending = False
+        if previous_owner != _owner:
+            self._pushOwnerToArtPieces()
         log OwnershipUpdated(chain_id=_chain_id, nft_contract=_nft_contract, token_id=_nft_token_id_or_generic_hub_account, previous_owner=previous_owner, owner=_owner)
         return
 
@@ -199,10 +261,96 @@ def syncArtCommissionHubOwner(_chain_id: uint256, _nft_contract: address, _nft_t
     # This handles the case where hub was initialized before NFT was registered
     if self.registrationPending and _owner != empty(address):
         self.registrationPending = False
+
+    if previous_owner != _owner:
+        self._pushOwnerToArtPieces()
     
     log OwnershipUpdated(chain_id=_chain_id, nft_contract=_nft_contract, token_id=_nft_token_id_or_generic_hub_account, previous_owner=previous_owner, owner=_owner)
 
 
+@internal
+def _pushOwnerToArtPiece(_art_piece: address):
+    # Refresh the cached owner of an art piece, a failing piece must not block verification or owner syncs.
+    # The refresh gets enough gas or the whole call reverts, a gas limit can't make it fail silently
+    assert msg.gas >= OWNER_PUSH_GAS_RESERVE, "Not enough gas to push the owner"
+    success: bool = raw_call(
+        _art_piece,
+        method_id("refreshCachedOwner()"),
+        revert_on_failure=False
+    )
+
+@internal
+def _pushOwnerToArtPieces():
+    # Invalidate every cached owner of this hub at once (ownerEpoch), then push the change to the verified art
+    # pieces while the gas allows so they log their Transfer, the rest of the list is left to continueOwnerFanOut
+    # from the first piece not refreshed. A new owner change restarts a fan-out in progress, pieces that were
+    # already refreshed log their next Transfer from the owner they announced
+    self.ownerEpoch += 1
+    length: uint256 = len(self.verifiedArtCommissions)
+    cursor: uint256 = 0
+    for i: uint256 in range(min(length, MAX_OWNER_PUSH_PIECES), bound=MAX_OWNER_PUSH_PIECES):
+        if msg.gas < OWNER_SYNC_GAS_RESERVE:
+            break
+        self._pushOwnerToArtPiece(self.verifiedArtCommissions[i])
+        cursor += 1
+    if cursor < length:
+        self.ownerFanOutCursorOffsetByOne = cursor + 1
+    else:
+        self.ownerFanOutCursorOffsetByOne = 0
+
+#
+# continueOwnerFanOut
+# -------------------
+# An owner change of the hub changes the effective owner of every verified art piece. The owner change bumps
+# ownerEpoch, so every piece resolves the new owner right away. Up to the first MAX_OWNER_PUSH_PIECES are
+# refreshed with the owner sync (as many as its gas allows), the rest in chunks through this function.
+# Each refreshed piece logs an ERC721 Transfer, so indexers follow owner changes with event filters.
+# Anyone can call it (keepers, the new owner), refreshing a piece only re-resolves its owner.
+# - A chunk refreshes at most _max_items pieces and stops early when gas runs low
+# - Pieces moved below the cursor by unverifyCommission are refreshed when they are moved
+# Example:
+# - After OwnershipUpdated, call continueOwnerFanOut(500) until passComplete
+#
+@external
+def continueOwnerFanOut(_max_items: uint256) -> uint256:
+    """
+    @notice Refreshes the owner of the next verified art pieces after an owner change, in a bounded, resumable chunk
+    @param _max_items Max art pieces to refresh in this call (capped at MAX_OWNER_FAN_OUT_BATCH)
+    @return The number of art pieces refreshed
+    """
+    cursor: uint256 = self.ownerFanOutCursorOffsetByOne
+    if cursor == 0:
+        return 0
+    cursor -= 1
+
+    length: uint256 = len(self.verifiedArtCommissions)
+    refreshed: uint256 = 0
+    for i: uint256 in range(0, min(_max_items, MAX_OWNER_FAN_OUT_BATCH), bound=MAX_OWNER_FAN_OUT_BATCH):
+        if cursor >= length or msg.gas < OWNER_FAN_OUT_GAS_RESERVE:
+            break
+        self._pushOwnerToArtPiece(self.verifiedArtCommissions[cursor])
+        cursor += 1
+        refreshed += 1
+
+    pass_complete: bool = cursor >= length
+    if pass_complete:
+        self.ownerFanOutCursorOffsetByOne = 0
+    else:
+        self.ownerFanOutCursorOffsetByOne = cursor + 1
+    log OwnerFanOutProgressed(refreshed=refreshed, nextIndex=cursor, passComplete=pass_complete)
+    return refreshed
+
+@external
+@view
+def pushesOwnerUpdates(_art_piece: address) -> bool:
+    """
+    @notice Whether owner changes of this hub are pushed to an art piece, so the piece may cache the owner
+    @param _art_piece The art piece to check
+    @return True if the piece is verified and the verified list is within MAX_OWNER_PUSH_PIECES
+    """
+    return self.verifiedArtCommissionsRegistry[_art_piece] and len(self.verifiedArtCommissions) <= MAX_OWNER_PUSH_PIECES
+
+
 # Commission Submission Overview:
 # 1. Art pieces undergo Profile verification process between the artist and commissioner Profiles
 # 2. Once both Profiles have verified, the 2nd verifier triggers submitCommission
@@ -226,12 +374,14 @@ def submitCommission(_art_piece: address):
     # assert not already submitted or blacklisted artist or commissioner
     assert not self.verifiedArtCommissionsRegistry[_art_piece], "Art piece already verified"
     assert not self.unverifiedArtCommissionsRegistry[_art_piece], "Art piece already unverified"
-    assert not self.blacklist[staticcall ArtPiece(_art_piece).getArtist()], "Artist is blacklisted"
-    assert not self.blacklist[staticcall ArtPiece(_art_piece).getCommissioner()], "Commissioner is blacklisted"
+    art_artist: address = staticcall ArtPiece(_art_piece).getArtist()
+    art_commissioner: address = staticcall ArtPiece(_art_piece).getCommissioner()
+    assert not self.blacklist[art_artist], "Artist is blacklisted"
+    assert not self.blacklist[art_commissioner], "Commissioner is blacklisted"
 
     sender_has_permission: bool = staticcall art_commission_hub_owners_interface.isAllowedToUpdateHubForAddress(self, msg.sender)
-    is_whitelisted_artist: bool = self.whitelist[staticcall ArtPiece(_art_piece).getArtist()]
-    is_whitelisted_commissioner: bool = self.whitelist[staticcall ArtPiece(_art_piece).getCommissioner()]
+    is_whitelisted_artist: bool = self.whitelist[art_artist]
+    is_whitelisted_commissioner: bool = self.whitelist[art_commissioner]
 
     # Add to verified list if sender has permission or participants are whitelisted
     if sender_has_permission or is_whitelisted_artist or is_whitelisted_commissioner:
@@ -239,20 +389,21 @@ def submitCommission(_art_piece: address):
         self.countVerifiedArtCommissions += 1
         self.verifiedArtCommissionsRegistry[_art_piece] = True
         
-        # Update latest verified art (circular buffer)
-        self.latestVerifiedArtCommissions[self.nextLatestVerifiedArtCommissionsIndex] = _art_piece
-        self.nextLatestVerifiedArtCommissionsIndex = (self.nextLatestVerifiedArtCommissionsIndex + 1) % 100
+        self._recordLatestVerified(_art_piece)
+        self._pushOwnerToArtPiece(_art_piece)
     
         log CommissionSubmitted(art_piece=_art_piece, submitter=msg.sender, verified=True)
     else:
-        # For unverified commissions, ensure user doesn't have too many
-        assert self.unverifiedArtCommissionsCountByUser[msg.sender] < 500, "Please verify commissions. Unverified for this account exceeds 500 items"
+        # Art pieces submit themselves once fully verified, charge those to the artist
+        submitter: address = msg.sender
+        if msg.sender == _art_piece:
+            submitter = art_artist
+
+        # For unverified commissions, ensure the submitter doesn't have too many
+        assert self.unverifiedArtCommissionsCountByUser[submitter] < self._unverifiedPerUserLimit(), "Please verify commissions. Unverified for this account exceeds the hub limit"
         
         # Add to unverified list
-        self.unverifiedArtCommissionsCountByUser[msg.sender] += 1
-        self.unverifiedArtCommissions.append(_art_piece)
-        self.countUnverifiedArtCommissions += 1
-        self.unverifiedArtCommissionsRegistry[_art_piece] = True
+        self._addUnverified(_art_piece, submitter)
         
         log CommissionSubmitted(art_piece=_art_piece, submitter=msg.sender, verified=False)
 
@@ -288,20 +439,10 @@ def _verifyCommission(_art_piece: address):
     
     # If found, remove from unverified list by replacing with the last item
     if found_index >= 0:
-        # Update user's unverified count
-        if self.unverifiedArtCommissionsCountByUser[msg.sender] > 0:
-            self.unverifiedArtCommissionsCountByUser[msg.sender] -= 1
-            
-        # Remove from unverified array (replace with last element and pop)
-        last_index: uint256 = len(self.unverifiedArtCommissions) - 1
-        if convert(found_index, uint256) != last_index:  # If not already the last element
-            self.unverifiedArtCommissions[convert(found_index, uint256)] = self.unverifiedArtCommissions[last_index]
-        self.unverifiedArtCommissions.pop()  # Remove last element
-        self.countUnverifiedArtCommissions -= 1
+        self._removeUnverifiedAt(convert(found_index, uint256))
     else:
-        # If not found in unverified array, just decrease the unverified count for the user
-        if self.unverifiedArtCommissionsCountByUser[msg.sender] > 0:
-            self.unverifiedArtCommissionsCountByUser[msg.sender] -= 1
+        # If not found in unverified array, just release the submitter's quota
+        self._releaseUnverifiedQuota(_art_piece)
     
     # Add to verified list
     self.verifiedArtCommissions.append(_art_piece)
@@ -311,11 +452,20 @@ def _verifyCommission(_art_piece: address):
     self.verifiedArtCommissionsRegistry[_art_piece] = True
     self.unverifiedArtCommissionsRegistry[_art_piece] = False
     
+    self._recordLatestVerified(_art_piece)
+    self._pushOwnerToArtPiece(_art_piece)
+    
+    log CommissionVerified(art_piece=_art_piece, verifier=msg.sender)
+
+@internal
+def _recordLatestVerified(_art_piece: address):
     # Update latest verified art (circular buffer)
     self.latestVerifiedArtCommissions[self.nextLatestVerifiedArtCommissionsIndex] = _art_piece
     self.nextLatestVerifiedArtCommissionsIndex = (self.nextLatestVerifiedArtCommissionsIndex + 1) % 100
     
-    log CommissionVerified(art_piece=_art_piece, verifier=msg.sender)
+    # Report to the site-wide latest verified feed
+    if self.artCommissionHubOwners != empty(address):
+        extcall ArtCommissionHubOwners(self.artCommissionHubOwners).recordVerifiedCommission(_art_piece)
 
 
 @external
@@ -346,32 +496,77 @@ def _unverifyCommission(_art_piece: address):
     if found_index >= 0:
         # Remove from verified array (replace with last element and pop)
         last_index: uint256 = len(self.verifiedArtCommissions) - 1
+        moved_art_piece: address = empty(address)
         if convert(found_index, uint256) != last_index:  # If not already the last element
-            self.verifiedArtCommissions[convert(found_index, uint256)] = self.verifiedArtCommissions[last_index]
+            moved_art_piece = self.verifiedArtCommissions[last_index]
+            self.verifiedArtCommissions[convert(found_index, uint256)] = moved_art_piece
         self.verifiedArtCommissions.pop()  # Remove last element
         self.countVerifiedArtCommissions -= 1
         
-        # Update the submitter's unverified count
-        self.unverifiedArtCommissionsCountByUser[msg.sender] += 1
-        
-        # Add to unverified list
-        self.unverifiedArtCommissions.append(_art_piece)
-        self.countUnverifiedArtCommissions += 1
+        # Add to unverified list, charged to the account that unverified it
+        self._addUnverified(_art_piece, msg.sender)
         
         # Update registry mappings
         self.verifiedArtCommissionsRegistry[_art_piece] = False
-        self.unverifiedArtCommissionsRegistry[_art_piece] = True
+
+        # The unverified piece goes back to live owner resolution, the moved piece may now be in the pushed range
+        self._pushOwnerToArtPiece(_art_piece)
+        if moved_art_piece != empty(address):
+            self._pushOwnerToArtPiece(moved_art_piece)
         
         log CommissionUnverified(art_piece=_art_piece, unverifier=msg.sender)
     else:
         # If not found in verified array, revert
         assert False, "Art piece not found in verified list"
 
+@internal
+def _addUnverified(_art_piece: address, _submitter: address):
+    self.unverifiedArtCommissionsCountByUser[_submitter] += 1
+    self.unverifiedArtCommissionSubmitter[_art_piece] = _submitter
+    self.unverifiedArtCommissionSubmittedAt[_art_piece] = block.timestamp
+    self.unverifiedArtCommissions.append(_art_piece)
+    self.countUnverifiedArtCommissions += 1
+    self.unverifiedArtCommissionsRegistry[_art_piece] = True
+
+@internal
+def _releaseUnverifiedQuota(_art_piece: address):
+    submitter: address = self.unverifiedArtCommissionSubmitter[_art_piece]
+    if self.unverifiedArtCommissionsCountByUser[submitter] > 0:
+        self.unverifiedArtCommissionsCountByUser[submitter] -= 1
+    self.unverifiedArtCommissionSubmitter[_art_piece] = empty(address)
+    self.unverifiedArtCommissionSubmittedAt[_art_piece] = 0
+
+@internal
+def _removeUnverifiedAt(_index: uint256):
+    """
+    @notice Removes the unverified art piece at _index (swap with last and pop) and releases its quota
+    """
+    art_piece: address = self.unverifiedArtCommissions[_index]
+    last_index: uint256 = len(self.unverifiedArtCommissions) - 1
+    if _index != last_index:  # If not already the last element
+        self.unverifiedArtCommissions[_index] = self.unverifiedArtCommissions[last_index]
+    self.unverifiedArtCommissions.pop()  # Remove last element
+    self.countUnverifiedArtCommissions -= 1
+    self.unverifiedArtCommissionsRegistry[art_piece] = False
+    self._releaseUnverifiedQuota(art_piece)
+
+@internal
+@view
+def _unverifiedPerUserLimit() -> uint256:
+    if self.unverifiedArtCommissionsPerUserLimit == 0:
+        return UNVERIFIED_ART_COMMISSIONS_PER_USER_LIMIT
+    return self.unverifiedArtCommissionsPerUserLimit
+
 @view
 @external
 def getUnverifiedCount(_user: address) -> uint256:
     return self.unverifiedArtCommissionsCountByUser[_user]
 
+@view
+@external
+def getUnverifiedPerUserLimit() -> uint256:
+    return self._unverifiedPerUserLimit()
+
 @view
 @external
 def isRegistrationPending() -> bool:
@@ -590,6 +785,27 @@ def getVerifiedArtPiecesByOffset(_offset: uint256, _count: uint256) -> DynArray[
     @param _count The number of art pieces to return (capped at 50)
     @return A list of verified art piece addresses
     """
+    return self._getVerifiedArtPiecesByOffset(_offset, _count)
+
+@view
+@external
+def getVerifiedArtPieceSummaries(_offset: uint256, _count: uint256) -> DynArray[ArtPieceSummary, 50]:
+    """
+    @notice Returns the metadata of a page of verified art pieces in one call
+    @dev Same paging as getVerifiedArtPiecesByOffset, so a gallery grid needs one call instead of ~10 per piece
+    @param _offset The starting index in the verified art array
+    @param _count The number of art pieces to return (capped at 50)
+    @return A list of ArtPieceSummary structs, in the same order as getVerifiedArtPiecesByOffset
+    """
+    result: DynArray[ArtPieceSummary, 50] = []
+    art_pieces: DynArray[address, 50] = self._getVerifiedArtPiecesByOffset(_offset, _count)
+    for art_piece: address in art_pieces:
+        result.append(staticcall ArtPiece(art_piece).getSummary())
+    return result
+
+@internal
+@view
+def _getVerifiedArtPiecesByOffset(_offset: uint256, _count: uint256) -> DynArray[address, 50]:
     result: DynArray[address, 50] = []
     
     # Early return if no verified art or offset is out of bounds
@@ -682,11 +898,70 @@ def updateWhitelistOrBlacklist(_address_to_list: address, _is_whitelist: bool, _
  
 @external
 def clearAllUnverifiedArtCommissions():
+    """
+    @notice Clears the unverified list in one transaction
+    @dev Bounded at 10000 items, use pruneUnverifiedArtCommissions to clear a spammed hub in chunks
+    """
     art_commission_hub_owners_interface: ArtCommissionHubOwners = ArtCommissionHubOwners(self.artCommissionHubOwners)
     assert staticcall art_commission_hub_owners_interface.isAllowedToUpdateHubForAddress(self, msg.sender), "Not allowed to update"
     for i: uint256 in range(0, self.countUnverifiedArtCommissions, bound=10000):
         if len(self.unverifiedArtCommissions) == 0:
             break
-        art_piece: address = self.unverifiedArtCommissions.pop()
-        self.unverifiedArtCommissionsRegistry[art_piece] = False
-    self.countUnverifiedArtCommissions = 0
+        self._removeUnverifiedAt(len(self.unverifiedArtCommissions) - 1)
+    self.unverifiedPruneCursorOffsetByOne = 0
+
+@external
+def setUnverifiedPerUserLimit(_limit: uint256):
+    """
+    @notice Sets how many unverified art pieces one submitter can have queued on this hub
+    @param _limit Between 1 and UNVERIFIED_ART_COMMISSIONS_PER_USER_LIMIT
+    """
+    art_commission_hub_owners_interface: ArtCommissionHubOwners = ArtCommissionHubOwners(self.artCommissionHubOwners)
+    assert staticcall art_commission_hub_owners_interface.isAllowedToUpdateHubForAddress(self, msg.sender), "Not allowed to update"
+    assert _limit > 0 and _limit <= UNVERIFIED_ART_COMMISSIONS_PER_USER_LIMIT, "Invalid limit"
+    self.unverifiedArtCommissionsPerUserLimit = _limit
+
+#
+# pruneUnverifiedArtCommissions
+# -----------------------------
+# Reclaims a spammed hub in fixed-size chunks. Each call checks at most _max_items entries,
+# continuing from where the previous call stopped, until a pass over the whole list completes.
+# - _min_age == 0: evict everything (chunked clearAllUnverifiedArtCommissions)
+# - _min_age > 0: evict only entries submitted at least _min_age seconds ago
+# Example:
+# - Evict everything older than 30 days: call pruneUnverifiedArtCommissions(500, 30 * 86400) until passComplete
+#
+@external
+def pruneUnverifiedArtCommissions(_max_items: uint256, _min_age: uint256) -> uint256:
+    """
+    @notice Evicts unverified art pieces in a bounded, resumable chunk
+    @param _max_items Max entries to check in this call (capped at MAX_PRUNE_BATCH)
+    @param _min_age Minimum age in seconds for an entry to be evicted, 0 evicts all
+    @return The number of art pieces evicted
+    """
+    art_commission_hub_owners_interface: ArtCommissionHubOwners = ArtCommissionHubOwners(self.artCommissionHubOwners)
+    assert staticcall art_commission_hub_owners_interface.isAllowedToUpdateHubForAddress(self, msg.sender), "Not allowed to update"
+
+    # Walk backwards so evicted slots are refilled with entries that were already checked
+    length: uint256 = len(self.unverifiedArtCommissions)
+    cursor: uint256 = self.unverifiedPruneCursorOffsetByOne
+    if cursor == 0 or cursor > length:
+        cursor = length
+
+    cutoff: uint256 = 0
+    if block.timestamp > _min_age:
+        cutoff = block.timestamp - _min_age
+
+    pruned: uint256 = 0
+    for i: uint256 in range(0, min(_max_items, MAX_PRUNE_BATCH), bound=MAX_PRUNE_BATCH):
+        if cursor == 0:
+            break
+        cursor -= 1
+        art_piece: address = self.unverifiedArtCommissions[cursor]
+        if _min_age == 0 or self.unverifiedArtCommissionSubmittedAt[art_piece] <= cutoff:
+            self._removeUnverifiedAt(cursor)
+            pruned += 1
+
+    self.unverifiedPruneCursorOffsetByOne = cursor
+    log UnverifiedCommissionsPruned(pruned=pruned, remaining=len(self.unverifiedArtCommissions), passComplete=cursor == 0)
+    return pruned
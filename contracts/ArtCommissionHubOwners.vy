@@ -22,10 +22,19 @@ ownerRevokedToDAO: public(bool)
 # artCommissionHubRegistry[chain_id][GENERIC_HUB_CONTRACT][convert(owner_address, uint256)] = commission_hub_address
 GENERIC_ART_COMMISSION_HUB_CONTRACT: constant(address) = 0x1000000000000000000000000000000000000001
 GENERIC_ART_COMMISSION_HUB_CHAIN_ID: constant(uint256) = 1
+MAX_GENERIC_HUB_BATCH_SIZE: constant(uint256) = 100  # Must match ProfileFactoryAndRegistry.MAX_PROFILE_BATCH_SIZE
 artCommissionHubRegistry: public(HashMap[uint256, HashMap[address, HashMap[uint256, address]]])  # chain_id -> nft_contract -> nft_token_id_or_generic_hub_account -> commission_hub
 artCommissionHubOwners: public(HashMap[uint256, HashMap[address, HashMap[uint256, address]]])  # chain_id -> nft_contract -> nft_token_id_or_generic_hub_account -> owner
 artCommissionHubLastUpdated: public(HashMap[uint256, HashMap[address, HashMap[uint256, uint256]]])  # chain_id -> nft_contract -> nft_token_id_or_generic_hub_account -> timestamp
 
+# Re-registering the owner a hub already has is skipped (no writes, no Registered event) until the last
+# update is minOwnerRefreshInterval seconds old, after that only the timestamp is refreshed
+# Bridge re-syncs of whole collections then only pay for the tokens whose owner changed
+DEFAULT_MIN_OWNER_REFRESH_INTERVAL: constant(uint256) = 86400  # 1 day
+minOwnerRefreshInterval: public(uint256)
+# A batch of first registrations (each creates a hub, ~433k gas) stays under the block gas limit
+MAX_NFT_OWNER_BATCH_SIZE: constant(uint256) = 50
+
 # We can access all ArtCommissionHubs in BigO(1) including add/delete/update/pagination if we store this celeverly...
 # Container for ArtCommissionHubs by owner [owner -> [commission_hub.address, commission_hub.address, .... ]]
 artCommissionHubsByOwner: public(HashMap[address, DynArray[address, 10**8]])  # owner -> list of commission hubs
@@ -44,6 +53,20 @@ artCommissionHubsByOwnerIndexOffsetByOne: public(HashMap[address, HashMap[addres
 # Track which commission hubs are generic (not tied to NFTs)
 isGenericHub: public(HashMap[address, bool])  # commission_hub -> is_generic
 
+# Track every commission hub created by this contract (only these can report verifications)
+isArtCommissionHub: public(HashMap[address, bool])  # commission_hub -> created here
+
+# Site-wide feed of the latest verified commissions across all hubs (circular buffer)
+# Slot for the Nth verification is N % LATEST_VERIFIED_COMMISSIONS_SIZE
+struct RecentVerification:
+    hub: address
+    artPiece: address
+    timestamp: uint256
+
+LATEST_VERIFIED_COMMISSIONS_SIZE: constant(uint256) = 500
+latestVerifiedCommissions: public(RecentVerification[LATEST_VERIFIED_COMMISSIONS_SIZE])
+latestVerifiedCommissionsCount: public(uint256)  # Total verifications ever recorded
+
 # Track which art piece code hashes are approved
 approvedArtPieceCodeHashes: public(HashMap[bytes32, bool])  # code_hash -> is_approved
 
@@ -58,6 +81,7 @@ interface ProfileFactoryAndRegistry:
     def hasProfile(_address: address) -> bool: view
     def getProfile(_address: address) -> address: view
     def createProfile(_owner: address): nonpayable
+    def createProfiles(_owners: DynArray[address, MAX_GENERIC_HUB_BATCH_SIZE], _is_artist: bool) -> DynArray[address, MAX_GENERIC_HUB_BATCH_SIZE]: nonpayable
     def linkArtCommissionHubOwnersContract(_registry: address): nonpayable
 
 event Registered:
@@ -95,6 +119,9 @@ event ProfileCreated:
 event L2OwnershipRelaySet:
     l2OwnershipRelay: address
 
+event MinOwnerRefreshIntervalSet:
+    interval: uint256
+
 event CodeHashWhitelistUpdated:
     code_hash: indexed(bytes32)
     status: bool
@@ -105,6 +132,7 @@ def __init__(_initial_l2relay: address, _initial_commission_hub_template: addres
     self.artCommissionHubTemplate = _initial_commission_hub_template
     self.owner = msg.sender
     self.profileFactoryAndRegistry = empty(address)
+    self.minOwnerRefreshInterval = DEFAULT_MIN_OWNER_REFRESH_INTERVAL
     code_hash: bytes32 = _art_piece_template.codehash
     log CodeHashWhitelistUpdated(code_hash=code_hash, status=True)
     self.approvedArtPieceCodeHashes[code_hash] = True
@@ -163,16 +191,38 @@ def _removeHubFromOwner(_owner: address, _hub: address):
     self.artCommissionHubsByOwnerIndexOffsetByOne[_owner][last_hub] = position_to_remove + 1
     self.artCommissionHubsByOwner[_owner].pop()
     self.artCommissionHubsByOwnerCount[_owner] -= 1
+    # Clear the removed hub's position (after the swap, in case it was the last hub) so it can be linked again
+    self.artCommissionHubsByOwnerIndexOffsetByOne[_owner][_hub] = 0
 
     # Emit event for tracking
     log HubUnlinkedFromOwner(owner=_owner, hub=_hub)
     
 @internal
-def _createOrUpdateCommissionHubAndOwner(_chain_id: uint256,_nft_contract: address,_nft_token_id_or_generic_hub_account: uint256, _owner: address):
-    
+def _createOrUpdateCommissionHubAndOwner(_chain_id: uint256,_nft_contract: address,_nft_token_id_or_generic_hub_account: uint256, _owner: address, _min_refresh_interval: uint256) -> bool:
+    """
+    @notice Internal function to register the owner of an NFT, creating its commission hub on first registration
+    @param _min_refresh_interval Seconds an unchanged owner registration is skipped for after the last update
+    @return False if the registration was skipped as a no-op
+    """
     current_time: uint256 = block.timestamp
     previous_owner: address = self.artCommissionHubOwners[_chain_id][_nft_contract][_nft_token_id_or_generic_hub_account]
-    
+
+    # Unchanged owner fast path: nothing to sync to the hub or the owner lists
+    if previous_owner == _owner and previous_owner != empty(address):
+        if current_time < self.artCommissionHubLastUpdated[_chain_id][_nft_contract][_nft_token_id_or_generic_hub_account] + _min_refresh_interval:
+            return False
+        self.artCommissionHubLastUpdated[_chain_id][_nft_contract][_nft_token_id_or_generic_hub_account] = current_time
+        log Registered(
+            chain_id=_chain_id,
+            nft_contract=_nft_contract,
+            nft_token_id_or_generic_hub_account=_nft_token_id_or_generic_hub_account,
+            owner=_owner,
+            commission_hub=self.artCommissionHubRegistry[_chain_id][_nft_contract][_nft_token_id_or_generic_hub_account],
+            timestamp=current_time,
+            source=msg.sender
+        )
+        return True
+
     # Update the owner 
     self.artCommissionHubOwners[_chain_id][_nft_contract][_nft_token_id_or_generic_hub_account] = _owner
     self.artCommissionHubLastUpdated[_chain_id][_nft_contract][_nft_token_id_or_generic_hub_account] = current_time
@@ -193,12 +243,13 @@ def _createOrUpdateCommissionHubAndOwner(_chain_id: uint256,_nft_contract: addre
         extcall commission_hub_instance.syncArtCommissionHubOwner(_chain_id, _nft_contract, _nft_token_id_or_generic_hub_account, _owner)
         self.artCommissionHubRegistry[_chain_id][_nft_contract][_nft_token_id_or_generic_hub_account] = commission_hub
         self.isGenericHub[commission_hub] = False
+        self.isArtCommissionHub[commission_hub] = True
         log ArtCommissionHubCreated(chain_id=_chain_id, nft_contract=_nft_contract, nft_token_id_or_generic_hub_account=_nft_token_id_or_generic_hub_account, commission_hub=commission_hub, is_generic=False)
         if _owner != empty(address):
             self._appendHubToOwner(_owner, commission_hub)
 
-    # If the owner is changing, we need to update the commission hub
-    elif previous_owner != _owner:
+    # The owner is changing (unchanged owners took the fast path), we need to update the commission hub
+    else:
         commission_hub = self.artCommissionHubRegistry[_chain_id][_nft_contract][_nft_token_id_or_generic_hub_account]
         commission_hub_instance: ArtCommissionHub = ArtCommissionHub(commission_hub)
         extcall commission_hub_instance.syncArtCommissionHubOwner(_chain_id, _nft_contract, _nft_token_id_or_generic_hub_account, _owner)
@@ -210,9 +261,6 @@ def _createOrUpdateCommissionHubAndOwner(_chain_id: uint256,_nft_contract: addre
         # Add the hub to the new owner's list
         if _owner != empty(address):
             self._appendHubToOwner(_owner, commission_hub)
-    else:
-        # Owner hasn't changed, just get the existing hub
-        commission_hub = self.artCommissionHubRegistry[_chain_id][_nft_contract][_nft_token_id_or_generic_hub_account]
     
     log Registered(
         chain_id=_chain_id,
@@ -223,6 +271,7 @@ def _createOrUpdateCommissionHubAndOwner(_chain_id: uint256,_nft_contract: addre
         timestamp=current_time,
         source=msg.sender
     )
+    return True
 
 @internal
 @view
@@ -245,7 +294,29 @@ def registerNFTOwnerFromParentChain(_chain_id: uint256, _nft_contract: address,
     # Only allow registration from system allowed addresses
     allowed: bool = (msg.sender == self.owner or msg.sender == self.l2OwnershipRelay or msg.sender == self or msg.sender == self.profileFactoryAndRegistry)
     assert allowed, "Only system allowed addresses can register artCommissionHubOwners"
-    self._createOrUpdateCommissionHubAndOwner(_chain_id, _nft_contract, _nft_token_id_or_generic_hub_account, _owner)
+    self._createOrUpdateCommissionHubAndOwner(_chain_id, _nft_contract, _nft_token_id_or_generic_hub_account, _owner, self.minOwnerRefreshInterval)
+
+@external
+def registerNFTOwnersFromParentChain(_chain_id: uint256, _nft_contract: address, _token_ids: DynArray[uint256, MAX_NFT_OWNER_BATCH_SIZE], _owners: DynArray[address, MAX_NFT_OWNER_BATCH_SIZE]) -> uint256:
+    """
+    @notice Registers the owners of many tokens of one NFT collection, for bridge re-syncs of whole collections
+    @dev Tokens whose owner is unchanged and was updated within minOwnerRefreshInterval are skipped
+    @param _chain_id The chain ID of the NFT collection
+    @param _nft_contract The NFT collection
+    @param _token_ids The token IDs
+    @param _owners The owner of each token, in the same order as _token_ids
+    @return The number of registrations that were not skipped
+    """
+    allowed: bool = (msg.sender == self.owner or msg.sender == self.l2OwnershipRelay or msg.sender == self or msg.sender == self.profileFactoryAndRegistry)
+    assert allowed, "Only system allowed addresses can register artCommissionHubOwners"
+    assert len(_token_ids) == len(_owners), "Token IDs and owners length mismatch"
+
+    min_refresh_interval: uint256 = self.minOwnerRefreshInterval
+    updated: uint256 = 0
+    for i: uint256 in range(len(_token_ids), bound=MAX_NFT_OWNER_BATCH_SIZE):
+        if self._createOrUpdateCommissionHubAndOwner(_chain_id, _nft_contract, _token_ids[i], _owners[i], min_refresh_interval):
+            updated += 1
+    return updated
 
 # Create a generic commission hub for non-NFT artCommissionHubOwners like multisigs, DAOs, or individual wallets
 @external
@@ -273,6 +344,34 @@ def createGenericCommissionHub(_owner: address) -> address:
         # Log profile creation
         log ProfileCreated(owner=_owner, profile=staticcall profile_factory_and_regsitry.getProfile(_owner))
     
+    return self._createGenericCommissionHub(_owner)
+
+@external
+def createGenericCommissionHubs(_owners: DynArray[address, MAX_GENERIC_HUB_BATCH_SIZE]) -> DynArray[address, MAX_GENERIC_HUB_BATCH_SIZE]:
+    """
+    @notice Creates generic commission hubs (and profiles where missing) for many owners in one transaction
+    @dev Used to onboard a partner community.  Owners who already have a generic hub are skipped.
+         Missing profiles are created with a single ProfileFactoryAndRegistry.createProfiles call
+         (which emits ProfileCreated) instead of one hasProfile/createProfile round trip per owner.
+    @param _owners The addresses that will own the new commission hubs
+    @return The addresses of the newly created commission hubs, in the same order as _owners
+    """
+    assert msg.sender == self.owner, "Only the owner can batch create generic commission hubs"
+    assert self.profileFactoryAndRegistry != empty(address), "Profile-Factory-And-Registry not set"
+
+    # Profiles for owners who already have one are skipped by the factory
+    profile_factory_and_regsitry: ProfileFactoryAndRegistry = ProfileFactoryAndRegistry(self.profileFactoryAndRegistry)
+    extcall profile_factory_and_regsitry.createProfiles(_owners, False)
+
+    created_hubs: DynArray[address, MAX_GENERIC_HUB_BATCH_SIZE] = []
+    for hub_owner: address in _owners:
+        if self.artCommissionHubRegistry[GENERIC_ART_COMMISSION_HUB_CHAIN_ID][GENERIC_ART_COMMISSION_HUB_CONTRACT][convert(hub_owner, uint256)] != empty(address):
+            continue
+        created_hubs.append(self._createGenericCommissionHub(hub_owner))
+    return created_hubs
+
+@internal
+def _createGenericCommissionHub(_owner: address) -> address:
     _nft_token_id_or_generic_hub_account: uint256 = convert(_owner, uint256)
 
     # Create a new commission hub
@@ -300,6 +399,7 @@ def createGenericCommissionHub(_owner: address) -> address:
     self.artCommissionHubOwners[GENERIC_ART_COMMISSION_HUB_CHAIN_ID][GENERIC_ART_COMMISSION_HUB_CONTRACT][_nft_token_id_or_generic_hub_account] = _owner
     self.artCommissionHubLastUpdated[GENERIC_ART_COMMISSION_HUB_CHAIN_ID][GENERIC_ART_COMMISSION_HUB_CONTRACT][_nft_token_id_or_generic_hub_account] = block.timestamp
     self.isGenericHub[commission_hub] = True
+    self.isArtCommissionHub[commission_hub] = True
     self._appendHubToOwner(_owner, commission_hub)
     log GenericCommissionHubCreated(owner=_owner, commission_hub=commission_hub)
     return commission_hub
@@ -360,6 +460,13 @@ def setL2OwnershipRelay(_new_l2relay: address):
     self.l2OwnershipRelay = _new_l2relay
     log L2OwnershipRelaySet(l2OwnershipRelay=_new_l2relay)
 
+# Set how long an unchanged owner re-registration is skipped for (0 refreshes the timestamp every time)
+@external
+def setMinOwnerRefreshInterval(_interval: uint256):
+    assert msg.sender == self.owner, "Only owner can set the minimum owner refresh interval"
+    self.minOwnerRefreshInterval = _interval
+    log MinOwnerRefreshIntervalSet(interval=_interval)
+
 # IMPORTANT: Deployment Order Requirements
 # This function MUST be called after both contracts are deployed in this order:
 # 1. Deploy ProfileFactoryAndRegistry
@@ -451,6 +558,57 @@ def getCommissionHubsByOwnerWithOffset(_owner: address, _offset: uint256, _count
 def getCommissionHubCountByOwner(_owner: address) -> uint256:
     return self.artCommissionHubsByOwnerCount[_owner]
 
+# recordVerifiedCommission
+# -------------------------
+# Called by a commission hub whenever an art piece lands in its verified list.
+# Keeps a global circular buffer so the homepage feed is one call instead of polling every hub.
+#
+@external
+def recordVerifiedCommission(_art_piece: address):
+    """
+    @notice Records a verified commission in the site-wide latest verified feed
+    @dev Calls from contracts that are not hubs created here are ignored so a hub can always report
+    @param _art_piece The art piece that was verified
+    """
+    if not self.isArtCommissionHub[msg.sender]:
+        return
+    count: uint256 = self.latestVerifiedCommissionsCount
+    self.latestVerifiedCommissions[count % LATEST_VERIFIED_COMMISSIONS_SIZE] = RecentVerification(
+        hub=msg.sender,
+        artPiece=_art_piece,
+        timestamp=block.timestamp
+    )
+    self.latestVerifiedCommissionsCount = count + 1
+
+# getLatestVerifiedCommissions
+# -------------------------
+# Returns the site-wide latest verified commissions, newest first
+# Example:
+# - Homepage feed: getLatestVerifiedCommissions(0, 20), next page getLatestVerifiedCommissions(20, 20)
+#
+@view
+@external
+def getLatestVerifiedCommissions(_offset: uint256, _count: uint256) -> DynArray[RecentVerification, 50]:
+    """
+    @notice Returns a page of the latest verified commissions across all hubs in reverse chronological order
+    @dev Only the last LATEST_VERIFIED_COMMISSIONS_SIZE verifications are kept
+    @param _offset Number of newest items to skip
+    @param _count Number of items to return (capped at 50)
+    @return A list of up to 50 (hub, artPiece, timestamp) entries
+    """
+    result: DynArray[RecentVerification, 50] = []
+    total: uint256 = self.latestVerifiedCommissionsCount
+    available_items: uint256 = min(total, LATEST_VERIFIED_COMMISSIONS_SIZE)
+    if _offset >= available_items:
+        return result
+    
+    count: uint256 = min(min(_count, available_items - _offset), 50)
+    newest_index: uint256 = total - 1 - _offset
+    for i: uint256 in range(0, count, bound=50):
+        result.append(self.latestVerifiedCommissions[(newest_index - i) % LATEST_VERIFIED_COMMISSIONS_SIZE])
+    
+    return result
+
 # Get random commission hubs for an owner
 @view
 @external
@@ -46,6 +46,11 @@ event EditionMinted:
     amount: uint256
     payment: uint256
 
+event EditionAirdropped:
+    operator: indexed(address)
+    recipientCount: uint256
+    amount: uint256
+
 event PriceUpdated:
     oldPrice: uint256
     newPrice: uint256
@@ -90,6 +95,9 @@ saleType: public(uint256)
 saleStartTime: public(uint256)
 phases: public(DynArray[PhaseConfig, 5])
 currentPhase: public(uint256)
+# Cached phase schedule so a mint only does one comparison unless a phase boundary is crossed
+# Threshold of the next phase (phases[currentPhase]), max_value(uint256) when there is no next phase
+nextPhaseThreshold: public(uint256)
 
 # Hard Stop Configuration
 timeCapHardStop: public(uint256)    # Timestamp after which minting stops (0 = disabled)
@@ -110,6 +118,7 @@ struct PhaseConfig:
 MAX_ROYALTY_PERCENT: constant(uint256) = 10000  # Allow up to 100.00% (10000 basis points)
 MAX_PHASES: constant(uint256) = 5
 TOKEN_ID: constant(uint256) = 1  # Always use token ID 1
+MAX_AIRDROP_RECIPIENTS: constant(uint256) = 500
 
 # Interfaces
 interface IERC20:
@@ -128,7 +137,8 @@ interface ArtPiece:
     def getDescription() -> String[400]: view
     def getArtist() -> address: view
     def getCommissioner() -> address: view
-    def tokenURI(_tokenId: uint256) -> String[2500]: view
+    def tokenURI(_tokenId: uint256) -> String[82269]: view
+    def tokenURIJson() -> String[2500]: view
     def tokenURI_data_format() -> String[10]: view
 
 interface ArtSales1155:
@@ -206,19 +216,23 @@ def createEdition(
     self.saleStartTime = 0
     self.phases = _phases
     self.currentPhase = 0
+    self.nextPhaseThreshold = max_value(uint256)
+    if len(_phases) > 0:
+        self.nextPhaseThreshold = _phases[0].threshold
     
     # Set hard stops
     self.timeCapHardStop = _time_cap_hard_stop
     self.mintCapHardStop = _mint_cap_hard_stop
     
-    # Emit URI event
+    # Emit URI event for pieces with a stored JSON, composed URIs (up to 82KB) are only served by uri()
     art_piece_contract: ArtPiece = ArtPiece(self.artPiece)
-    uri_value: String[2500] = staticcall art_piece_contract.tokenURI(1)
-    log URI(value=uri_value, id=TOKEN_ID)
+    uri_value: String[2500] = staticcall art_piece_contract.tokenURIJson()
+    if len(uri_value) > 0:
+        log URI(value=uri_value, id=TOKEN_ID)
 
 @external
-def startSale():
-    """Start the sale for this edition"""
+def startSale() -> uint256:
+    """Start the sale for this edition, returns the sale type"""
     assert msg.sender == self.owner or msg.sender == self.artSales1155, "Only owner or ArtSales1155"
     assert self.basePrice > 0, "Edition does not exist"
     assert self.isPaused, "Sale already active"
@@ -226,7 +240,9 @@ def startSale():
     self.isPaused = False
     self.saleStartTime = block.timestamp
     
-    log SaleStarted(saleType=self.saleType)
+    sale_type: uint256 = self.saleType
+    log SaleStarted(saleType=sale_type)
+    return sale_type
 
 @external
 def pauseSale():
@@ -259,73 +275,78 @@ def _checkHardStops(_amount: uint256):
     if self.mintCapHardStop > 0:
         assert self.currentSupply + _amount <= self.mintCapHardStop, "Mint cap hard stop reached - minting ended"
 
+@view
 @internal
-def _updatePriceForPhases():
-    """Update price based on current phase"""
+def _phaseProgress() -> uint256:
+    """Quantity sold for QUANTITY_PHASES, current time for TIME_PHASES, 0 for non-phased sales"""
     if self.saleType == SALE_TYPE_QUANTITY_PHASES:
-        # Find the highest applicable phase based on quantity
-        new_phase: uint256 = 0  # 0 = using base price, 1+ = using phases[new_phase-1]
-        for i: uint256 in range(len(self.phases), bound=MAX_PHASES):
-            if self.currentSupply >= self.phases[i].threshold:
-                new_phase = i + 1  # Convert to 1-based indexing
-        
-        # Update if we've moved to a new phase
-        if new_phase != self.currentPhase:
-            old_phase: uint256 = self.currentPhase
-            old_price: uint256 = self.currentPrice
-            self.currentPhase = new_phase
-            if new_phase == 0:
-                self.currentPrice = self.basePrice
-            else:
-                self.currentPrice = self.phases[new_phase - 1].price
-            log PhaseChanged(newPhase=new_phase, newPrice=self.currentPrice)
-            log PriceUpdated(oldPrice=old_price, newPrice=self.currentPrice)
-                
+        return self.currentSupply
     elif self.saleType == SALE_TYPE_TIME_PHASES:
-        # Find the highest applicable phase based on time
-        current_time: uint256 = block.timestamp
-        new_phase: uint256 = 0  # 0 = using base price, 1+ = using phases[new_phase-1]
-        for i: uint256 in range(len(self.phases), bound=MAX_PHASES):
-            if current_time >= self.phases[i].threshold:
-                new_phase = i + 1  # Convert to 1-based indexing
-        
-        # Update if we've moved to a new phase
-        if new_phase != self.currentPhase:
-            old_phase: uint256 = self.currentPhase
-            old_price: uint256 = self.currentPrice
-            self.currentPhase = new_phase
-            if new_phase == 0:
-                self.currentPrice = self.basePrice
-            else:
-                self.currentPrice = self.phases[new_phase - 1].price
-            log PhaseChanged(newPhase=new_phase, newPrice=self.currentPrice)
-            log PriceUpdated(oldPrice=old_price, newPrice=self.currentPrice)
+        return block.timestamp
+    return 0
+
+@view
+@internal
+def _resolvePhase(_progress: uint256) -> (uint256, uint256, uint256):
+    """
+    Walk forward from the current phase to the highest phase reached by _progress
+    Returns (phase, price, next_phase_threshold) where phase 0 = base price, 1+ = phases[phase-1]
+    """
+    phase: uint256 = self.currentPhase
+    price: uint256 = self.currentPrice
+    next_threshold: uint256 = max_value(uint256)
+    phase_count: uint256 = len(self.phases)
+    
+    for i: uint256 in range(MAX_PHASES):
+        if phase >= phase_count:
+            break
+        next_phase: PhaseConfig = self.phases[phase]
+        if _progress < next_phase.threshold:
+            next_threshold = next_phase.threshold
+            break
+        phase += 1
+        price = next_phase.price
+    
+    return (phase, price, next_threshold)
+
+@internal
+def _updatePriceForPhases():
+    """Update price based on current phase"""
+    # Quantity sold and time only ever increase, so until the next threshold is reached
+    # the cached currentPhase / currentPrice are still correct
+    progress: uint256 = self._phaseProgress()
+    if progress < self.nextPhaseThreshold:
+        return
+    
+    # Crossed (at least) one phase boundary
+    new_phase: uint256 = 0
+    new_price: uint256 = 0
+    next_threshold: uint256 = 0
+    (new_phase, new_price, next_threshold) = self._resolvePhase(progress)
+    self.nextPhaseThreshold = next_threshold
+    
+    # Update if we've moved to a new phase
+    if new_phase != self.currentPhase:
+        old_price: uint256 = self.currentPrice
+        self.currentPhase = new_phase
+        self.currentPrice = new_price
+        log PhaseChanged(newPhase=new_phase, newPrice=new_price)
+        log PriceUpdated(oldPrice=old_price, newPrice=new_price)
 
 @view
 @internal
 def _getCurrentPrice() -> uint256:
     """Get current price, checking for phase updates"""
-    if len(self.phases) == 0:
+    progress: uint256 = self._phaseProgress()
+    if progress < self.nextPhaseThreshold:
         return self.currentPrice
     
-    # For time-based phases, check if price should update
-    if self.saleType == SALE_TYPE_TIME_PHASES:
-        current_time: uint256 = block.timestamp
-        for i: uint256 in range(len(self.phases), bound=MAX_PHASES):
-            phase_index: uint256 = len(self.phases) - 1 - i
-            if current_time >= self.phases[phase_index].threshold:
-                return self.phases[phase_index].price
-        return self.basePrice
-    
-    # For quantity-based phases
-    elif self.saleType == SALE_TYPE_QUANTITY_PHASES:
-        for i: uint256 in range(len(self.phases), bound=MAX_PHASES):
-            phase_index: uint256 = len(self.phases) - 1 - i
-            if self.currentSupply >= self.phases[phase_index].threshold:
-                return self.phases[phase_index].price
-        return self.basePrice
-    
-    return self.currentPrice
+    # A phase boundary was crossed since the last mint (ex: time phase started), resolve it without writing
+    new_phase: uint256 = 0
+    new_price: uint256 = 0
+    next_threshold: uint256 = 0
+    (new_phase, new_price, next_threshold) = self._resolvePhase(progress)
+    return new_price
 
 @external
 @payable
@@ -346,7 +367,7 @@ def mint(_amount: uint256):
     self._updatePriceForPhases()
     
     # Get current price (may have been updated)
-    current_price: uint256 = self._getCurrentPrice()
+    current_price: uint256 = self.currentPrice
     total_cost: uint256 = current_price * _amount
     assert msg.value >= total_cost, "Insufficient ETH payment"
     
@@ -382,7 +403,7 @@ def mintERC20(_amount: uint256):
     self._updatePriceForPhases()
     
     # Get current price (may have been updated)
-    current_price: uint256 = self._getCurrentPrice()
+    current_price: uint256 = self.currentPrice
     total_cost: uint256 = current_price * _amount
     
     # Transfer ERC20 tokens
@@ -423,7 +444,7 @@ def mintWithPermit(
     self._updatePriceForPhases()
     
     # Get current price (may have been updated)
-    current_price: uint256 = self._getCurrentPrice()
+    current_price: uint256 = self.currentPrice
     total_cost: uint256 = current_price * _amount
     
     # Use permit
@@ -443,10 +464,45 @@ def mintWithPermit(
     log TransferSingle(operator=msg.sender, sender=empty(address), receiver=msg.sender, id=TOKEN_ID, value=_amount)
     log EditionMinted(minter=msg.sender, amount=_amount, payment=total_cost)
 
+@external
+def airdrop(_recipients: DynArray[address, MAX_AIRDROP_RECIPIENTS], _amounts: DynArray[uint256, MAX_AIRDROP_RECIPIENTS]):
+    """
+    Owner mints editions to many recipients in one transaction (ex: gifting editions to commissioners)
+    Supply, hard stops and phase pricing are checked and updated once for the whole batch
+    Works while the sale is paused so editions can be gifted before a public sale starts
+    """
+    assert msg.sender == self.owner or msg.sender == self.artSales1155, "Only owner or ArtSales1155"
+    assert self.basePrice > 0, "Edition does not exist"
+    assert len(_recipients) == len(_amounts), "Length mismatch"
+    
+    total_amount: uint256 = 0
+    for amount: uint256 in _amounts:
+        total_amount += amount
+    
+    # Check hard stops first - these override all other logic
+    self._checkHardStops(total_amount)
+    
+    # Check supply limit for capped sales
+    if self.saleType == SALE_TYPE_CAPPED:
+        assert self.currentSupply + total_amount <= self.maxSupply, "Exceeds max supply"
+    
+    # Mint tokens, one TransferSingle per recipient as required by ERC1155
+    for i: uint256 in range(len(_recipients), bound=MAX_AIRDROP_RECIPIENTS):
+        recipient: address = _recipients[i]
+        assert recipient != empty(address), "Invalid recipient"
+        self.balances[recipient] += _amounts[i]
+        log TransferSingle(operator=msg.sender, sender=empty(address), receiver=recipient, id=TOKEN_ID, value=_amounts[i])
+    
+    # Update supply and move quantity phases forward once for the whole batch
+    self.currentSupply += total_amount
+    self._updatePriceForPhases()
+    
+    log EditionAirdropped(operator=msg.sender, recipientCount=len(_recipients), amount=total_amount)
+
 @external
 def setCurrentPrice(_new_price: uint256):
     """Manually set price (only for non-phased sales)"""
-    assert msg.sender == self.owner, "Only owner"
+    assert msg.sender == self.owner or msg.sender == self.artSales1155, "Only owner or ArtSales1155"
     assert self.saleType == SALE_TYPE_FOREVER or self.saleType == SALE_TYPE_CAPPED, "Cannot manually set price for phased sales"
     
     old_price: uint256 = self.currentPrice
@@ -581,7 +637,7 @@ def isApprovedForAll(_owner: address, _operator: address) -> bool:
 
 @view
 @external
-def uri(_id: uint256) -> String[2500]:
+def uri(_id: uint256) -> String[82269]:
     assert _id == TOKEN_ID, "Invalid token ID"
     assert self.basePrice > 0, "Token does not exist"
     
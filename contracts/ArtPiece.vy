@@ -13,9 +13,26 @@
 # Has a list of artists that have commissioned the piece
 # Implements ERC721 for a single token NFT
 
+# All non-image metadata of an art piece, returned by getSummary (ArtCommissionHub uses the same layout)
+struct ArtPieceSummary:
+    artPiece: address
+    title: String[100]
+    description: String[400]
+    tokenURIDataFormat: String[10]
+    owner: address
+    artist: address
+    commissioner: address
+    artCommissionHub: address
+    artistVerified: bool
+    commissionerVerified: bool
+    fullyVerifiedCommission: bool
+    isPrivateOrNonCommissionPiece: bool
+    aiGenerated: bool
+
 # Interface for ArtCommissionHub
 interface ArtCommissionHub:
     def owner() -> address: view
+    def ownerEpoch() -> uint256: view
     def submitCommission(art_piece: address) -> bool: nonpayable
 
 # Interface for ArtPieceLicense
@@ -36,6 +53,10 @@ interface ProfileFactoryAndRegistry:
     def getProfile(_user: address) -> address: view
     def hasProfile(_user: address) -> bool: view
 
+# Interface for calling this contract's own composed tokenURI in a separate call frame
+interface ArtPieceMetadata:
+    def getComposedTokenURI() -> String[MAX_TOKEN_URI_LENGTH]: view
+
 # ERC721 Events
 event Transfer:
     sender: indexed(address)
@@ -102,6 +123,17 @@ INTERFACE_ID_ERC165: constant(bytes4) = 0x01ffc9a7
 TOKEN_ID: constant(uint256) = 1 # Single token constant (this NFT has only one token)
 IS_ON_CHAIN: public(constant(bool)) = True  # Constant to indicate this art piece is on-chain
 
+# tokenURI composed at read time when no tokenURIJson was stored
+# The largest composed JSON is {"name":"<800>","description":"<800>","image":"data:image/<10>;base64,<60000>"}
+MAX_COMPOSED_JSON_LENGTH: constant(uint256) = 61680  # 2570 chunks of 24 bytes
+MAX_BASE64_LENGTH: constant(uint256) = 82240  # 2570 words of 32 characters
+MAX_TOKEN_URI_LENGTH: constant(uint256) = 82269  # "data:application/json;base64," + MAX_BASE64_LENGTH
+# Byte lane masks for encoding 24 bytes into 32 base64 characters per step
+BYTE_LANES: constant(uint256) = max_value(uint256) // 255  # 0x01 in every byte
+SEXTET_LANES: constant(uint256) = (max_value(uint256) // (2**32 - 1)) * 63  # 0x0000003f in every 4 bytes
+HALF_LANES_48: constant(uint256) = (2**48 - 1) * (1 + 2**128)  # low 48 bits of both 128-bit halves
+HALF_LANES_24: constant(uint256) = (2**24 - 1) * (max_value(uint256) // (2**64 - 1))  # low 24 bits of every 64 bits
+
 # ArtPiece variables
 tokenURI_data: Bytes[45000]  # Changed from imageData to tokenURI_data
 tokenURI_data_format: public(String[10])  # Format of the tokenURI_data   
@@ -136,6 +168,18 @@ submissionSuccessful: public(bool)  # Flag to track if submission to hub was suc
 # This is handled in a totally different contract tied 1 to 1 with each ArtPiece
 artPieceLicense: public(address)
 
+# Effective owner kept up to date by the owner source instead of resolved with an external call on every read
+# Empty when the owner is resolved live (the hub does not push owner changes to this piece)
+# ArtPieceLicense.setLicenseOwner and ArtCommissionHub owner syncs / verification changes call refreshCachedOwner
+cachedEffectiveOwner: public(address)
+# Hub owner epoch (ArtCommissionHub.ownerEpoch) a hub owner was cached at, offset by one: 0 means the cached
+# owner doesn't come from the hub. An owner change bumps the hub's epoch, so the cache is resolved live until
+# the piece is refreshed
+cachedOwnerEpochOffsetByOne: public(uint256)
+# Receiver of the last Transfer event, owner changes through the hub or license are logged as a Transfer
+# from this address when the piece is refreshed (ArtCommissionHub fans owner changes out to its pieces)
+announcedOwner: public(address)
+
 # Create minimal proxy to ArtPiece
 @deploy
 def __init__():
@@ -187,6 +231,7 @@ def initialize(
     @param _artist_input Address of the artist
     @param _commission_hub Address of the commission hub (if any, empty address if none)
     @param _ai_generated Flag indicating if the artwork was AI generated
+    @param _token_uri_json Optional metadata JSON returned by tokenURI, leave empty to have tokenURI composed from the stored fields
     """
     assert not self.initialized, "Already initialized"
 
@@ -218,9 +263,9 @@ def initialize(
     # Set ERC721 metadata
     self.name = "ArtPiece"
     self.symbol = "ART"
-    
-    # Emit Transfer event for minting the single token
-    log Transfer(sender=empty(address), receiver=_commissioner_input, tokenId=TOKEN_ID)
+
+    # The first refresh emits the Transfer event for minting the single token to the effective owner
+    self._refreshCachedOwner()
 
 # ERC721 Standard Functions
 @external
@@ -302,14 +347,122 @@ def supportsInterface(_interfaceId: bytes4) -> bool:
 
 @external
 @view
-def tokenURI(_tokenId: uint256) -> String[2500]:  # Updated return type
+def tokenURI(_tokenId: uint256) -> String[MAX_TOKEN_URI_LENGTH]:
     """
     @notice Get the URI for a token
+    @dev Returns the stored tokenURIJson when one was given at initialize, otherwise composes
+         a data:application/json;base64 URI from the title, description and tokenURI_data
     @param _tokenId The token ID
     @return The token URI
     """
     assert _tokenId == TOKEN_ID, "This NFT collection only has a single id: 1"
-    return self.tokenURIJson
+    if len(self.tokenURIJson) > 0:
+        return self.tokenURIJson
+    # The composition buffers take ~350KB of memory, called through self so that reading a
+    # stored JSON doesn't pay the memory expansion for them
+    return staticcall ArtPieceMetadata(self).getComposedTokenURI()
+
+@external
+@view
+def getComposedTokenURI() -> String[MAX_TOKEN_URI_LENGTH]:
+    """
+    @notice Build the OpenSea-style metadata URI from the stored fields
+    @dev tokenURI_data that already is a JSON data URI is returned as is, other data URIs and
+         arweave URLs are used as the image, raw image bytes are base64 encoded into a data URI
+    @return data:application/json;base64 URI with name, description and image
+    """
+    data: Bytes[45000] = self.tokenURI_data
+    if len(data) >= 21 and slice(data, 0, 21) == b"data:application/json":
+        return convert(data, String[45000])
+
+    image: String[60029] = ""
+    if (len(data) >= 5 and slice(data, 0, 5) == b"data:") or self.tokenURI_data_format == "arweave":
+        image = convert(data, String[45000])
+    else:
+        image = concat("data:image/", self.tokenURI_data_format, ";base64,", convert(self._base64(data), String[60000]))
+
+    json: String[MAX_COMPOSED_JSON_LENGTH] = concat(
+        "{\"name\":\"", self._jsonEscape(self.title),
+        "\",\"description\":\"", self._jsonEscape(self.description),
+        "\",\"image\":\"", image, "\"}"
+    )
+    return concat("data:application/json;base64,", self._base64(convert(json, Bytes[MAX_COMPOSED_JSON_LENGTH])))
+
+@internal
+@pure
+def _jsonEscape(_value: String[400]) -> String[800]:
+    """
+    @notice Escape a string for use inside a JSON string literal
+    @dev Quotes and backslashes get a backslash, control characters become spaces
+    @param _value The string to escape
+    @return The escaped string
+    """
+    raw: Bytes[400] = convert(_value, Bytes[400])
+    words: DynArray[bytes32, 25] = []
+    word: uint256 = 0
+    length: uint256 = 0
+    for i: uint256 in range(400):
+        if i >= len(raw):
+            break
+        char: uint256 = convert(slice(raw, i, 1), uint256)
+        if char < 32:
+            char = 32
+        escaped: bool = char == 34 or char == 92  # " and \
+        for k: uint256 in range(2):
+            if k == 0 and not escaped:
+                continue
+            word = (word << 8) | (92 if k == 0 else char)
+            length += 1
+            if length % 32 == 0:
+                words.append(convert(word, bytes32))
+                word = 0
+    if length % 32 != 0:
+        words.append(convert(word << (8 * (32 - length % 32)), bytes32))
+    # abi_encode puts the offset and length words before the array items
+    return convert(slice(abi_encode(words), 64, length), String[800])
+
+@internal
+@pure
+def _base64(_data: Bytes[MAX_COMPOSED_JSON_LENGTH]) -> String[MAX_BASE64_LENGTH]:
+    """
+    @notice Standard base64 encoding with padding
+    @dev Encodes 24 input bytes into one 32 character word per step, every character in its own
+         byte lane, and joins the words once at the end instead of concatenating per character
+    @param _data The bytes to encode
+    @return The base64 encoded string
+    """
+    data_length: uint256 = len(_data)
+    # Zero padded so extract32 can read past the end of the last chunk
+    padded: Bytes[MAX_COMPOSED_JSON_LENGTH + 32] = concat(_data, empty(bytes32))
+    words: DynArray[bytes32, MAX_BASE64_LENGTH // 32] = []
+    for i: uint256 in range(MAX_BASE64_LENGTH // 32):
+        start: uint256 = i * 24
+        if start >= data_length:
+            break
+        chunk: uint256 = convert(extract32(padded, start), uint256) >> 64
+
+        # Spread the eight 3-byte groups into 4-byte lanes (halves, then quarters, then eighths)
+        lanes: uint256 = (chunk & (2**96 - 1)) | ((chunk >> 96) << 128)
+        lanes = (lanes & HALF_LANES_48) | (((lanes >> 48) & HALF_LANES_48) << 64)
+        lanes = (lanes & HALF_LANES_24) | (((lanes >> 24) & HALF_LANES_24) << 32)
+        # Spread the four 6-bit values of every group into byte lanes
+        lanes = ((lanes & (SEXTET_LANES << 18)) << 6) | ((lanes & (SEXTET_LANES << 12)) << 4) | ((lanes & (SEXTET_LANES << 6)) << 2) | (lanes & SEXTET_LANES)
+
+        # Map 0-63 to A-Z a-z 0-9 + / in every lane: a lane's bit 7 after adding 128 - n is set when the value is >= n
+        at_least_26: uint256 = ((lanes + BYTE_LANES * 102) >> 7) & BYTE_LANES
+        at_least_52: uint256 = ((lanes + BYTE_LANES * 76) >> 7) & BYTE_LANES
+        at_least_62: uint256 = ((lanes + BYTE_LANES * 66) >> 7) & BYTE_LANES
+        at_least_63: uint256 = ((lanes + BYTE_LANES * 65) >> 7) & BYTE_LANES
+        lanes = lanes + BYTE_LANES * 65 + at_least_26 * 6 + at_least_63 * 3 - at_least_52 * 75 - at_least_62 * 15
+
+        # "=" padding after the last encoded character of the final chunk
+        chunk_length: uint256 = min(24, data_length - start)
+        if chunk_length < 24:
+            padding_bits: uint256 = (32 - (chunk_length * 4 + 2) // 3) * 8
+            lanes = ((lanes >> padding_bits) << padding_bits) | ((BYTE_LANES * 61) & ((1 << padding_bits) - 1))
+        words.append(convert(lanes, bytes32))
+    # abi_encode puts the offset and length words before the array items
+    return convert(slice(abi_encode(words), 64, (data_length + 2) // 3 * 4), String[MAX_BASE64_LENGTH])
 
 @external
 @view
@@ -350,6 +503,23 @@ def getDescription() -> String[400]:
 @internal
 @view
 def _getEffectiveOwner() -> address:
+    """
+    @notice Internal function to get the effective owner, from the cache when the owner source pushes updates
+    @return The effective owner address
+    """
+    cached_owner: address = self.cachedEffectiveOwner
+    if cached_owner != empty(address):
+        epoch_offset: uint256 = self.cachedOwnerEpochOffsetByOne
+        if epoch_offset == 0:
+            return cached_owner
+        # A cached hub owner is only trusted while the hub has not changed owner since
+        if staticcall ArtCommissionHub(self.artCommissionHubAddress).ownerEpoch() + 1 == epoch_offset:
+            return cached_owner
+    return self._resolveEffectiveOwner()
+
+@internal
+@view
+def _resolveEffectiveOwner() -> address:
     """
     @notice Internal function to determine the effective owner based on verification and hub status
     @return The effective owner address
@@ -366,6 +536,61 @@ def _getEffectiveOwner() -> address:
     # Before verification, return the original uploader
     return self.originalUploader
 
+@internal
+@view
+def _staticCallReturns(_target: address, _calldata: Bytes[36], _expected: bytes32) -> bool:
+    """
+    @notice Internal function to check the result of a view call that may not exist on the target
+    @return True if the call succeeded and returned _expected
+    """
+    success: bool = False
+    response: Bytes[32] = b""
+    success, response = raw_call(_target, _calldata, max_outsize=32, is_static_call=True, revert_on_failure=False)
+    return success and len(response) == 32 and convert(response, bytes32) == _expected
+
+@internal
+def _refreshCachedOwner() -> address:
+    """
+    @notice Internal function to re-resolve the effective owner and cache it if its source pushes updates
+    @dev The original uploader is always cached, a license owner only if the license was issued for this piece
+         (ArtPieceLicense pushes to its artPiece) and a hub owner only if the hub pushes owner changes to this piece,
+         with the hub's owner epoch so an owner change invalidates it before the push arrives. A changed owner is logged as an ERC721 Transfer from the previously announced owner
+    @return The effective owner address
+    """
+    owner: address = self._resolveEffectiveOwner()
+    previous_owner: address = self.announcedOwner
+    if owner != previous_owner:
+        self.announcedOwner = owner
+        log Transfer(sender=previous_owner, receiver=owner, tokenId=TOKEN_ID)
+    cacheable: bool = True
+    epoch_offset: uint256 = 0
+    if self.artPieceLicense != empty(address):
+        cacheable = self._staticCallReturns(self.artPieceLicense, method_id("artPiece()"), convert(self, bytes32))
+    elif self.artCommissionHubAddress != empty(address) and self.fullyVerifiedCommission:
+        cacheable = self._staticCallReturns(
+            self.artCommissionHubAddress,
+            concat(method_id("pushesOwnerUpdates(address)"), convert(self, bytes32)),
+            convert(True, bytes32)
+        )
+        if cacheable:
+            epoch_offset = staticcall ArtCommissionHub(self.artCommissionHubAddress).ownerEpoch() + 1
+    if cacheable:
+        self.cachedEffectiveOwner = owner
+    else:
+        self.cachedEffectiveOwner = empty(address)
+    self.cachedOwnerEpochOffsetByOne = epoch_offset
+    return owner
+
+@external
+def refreshCachedOwner() -> address:
+    """
+    @notice Re-resolve the effective owner, update the cached owner and log a Transfer if the owner changed
+    @dev Called by the owner sources (ArtPieceLicense, ArtCommissionHub) when the owner changes,
+         anyone can call it as the owner is always re-resolved from the sources
+    @return The effective owner address
+    """
+    return self._refreshCachedOwner()
+
 @external
 @view
 def getOwner() -> address:
@@ -431,6 +656,7 @@ def addArtCommissionHubDetails(_art_commission_hub_address: address, _commission
             self.commissionerVerified = True
             self.fullyVerifiedCommission = True
             self.isPrivateOrNonCommissionPiece = True
+    self._refreshCachedOwner()
 
 # We need to have a connected artCommissionHub before verification
 @external
@@ -480,7 +706,7 @@ def verifyAsCommissioner():
 
 # After completeVerification:
 # If attached to a hub, ownership will now be determined by the hub owner
-# No need to update any internal state since _getEffectiveOwner() will handle this
+# The cached owner is refreshed, the hub pushes later owner changes
 @internal
 def _completeVerification():
     """
@@ -531,6 +757,9 @@ def _completeVerification():
                 commission_hub=self.artCommissionHubAddress
             )
     
+    # Ownership moves to the hub owner, cached only if the hub accepted the piece as verified
+    self._refreshCachedOwner()
+
     # Emit verification complete event
     log CommissionfullyVerified(art_piece=self, artist=self.artist, commissioner=self.commissioner)
 
@@ -640,6 +869,30 @@ def getAIGenerated() -> bool:
     """
     return self.aiGenerated
 
+@external
+@view
+def getSummary() -> ArtPieceSummary:
+    """
+    @notice Get all non-image metadata of the artwork in one call
+    @dev Use getTokenURIData() for the image, it is left out to keep the summary small
+    @return An ArtPieceSummary struct
+    """
+    return ArtPieceSummary(
+        artPiece=self,
+        title=self.title,
+        description=self.description,
+        tokenURIDataFormat=self.tokenURI_data_format,
+        owner=self._getEffectiveOwner(),
+        artist=self.artist,
+        commissioner=self.commissioner,
+        artCommissionHub=self.artCommissionHubAddress,
+        artistVerified=self.artistVerified,
+        commissionerVerified=self.commissionerVerified,
+        fullyVerifiedCommission=self.fullyVerifiedCommission,
+        isPrivateOrNonCommissionPiece=self.isPrivateOrNonCommissionPiece,
+        aiGenerated=self.aiGenerated
+    )
+
 @external
 def attachToArtCommissionHub(_commission_hub: address):
     self._attachToArtCommissionHub(_commission_hub)
@@ -759,5 +1012,6 @@ def setArtPieceLicense(_license_address: address):
     assert msg.sender == current_owner or msg.sender == self.artist or msg.sender == self.commissioner, "Only owner, artist, or commissioner can set license"
     
     self.artPieceLicense = _license_address
+    self._refreshCachedOwner()
 
 
@@ -11,6 +11,10 @@
 # ArtPieceLicense contract - handles licensing and rights management for ArtPiece
 # This contract can override ownership determination for rights management purposes
 
+# Gas the license keeps for pushing an owner change to its ArtPiece (ArtPiece.refreshCachedOwner), well above
+# one refresh, so a low gas limit reverts the change instead of leaving a stale cached owner
+OWNER_PUSH_GAS_RESERVE: constant(uint256) = 150000
+
 # State variables
 artPiece: public(address)  # The ArtPiece this license is attached to
 licenseOwner: public(address)  # The owner according to the license
@@ -55,3 +59,11 @@ def setLicenseOwner(_new_owner: address):
     assert msg.sender == self.licenseOwner, "Only current license owner can change ownership"
     
     self.licenseOwner = _new_owner
+
+    # Push the change to the ArtPiece's cached owner, don't block the license change if the piece can't take it
+    assert msg.gas >= OWNER_PUSH_GAS_RESERVE, "Not enough gas to push the owner"
+    success: bool = raw_call(
+        self.artPiece,
+        method_id("refreshCachedOwner()"),
+        revert_on_failure=False
+    )
@@ -42,6 +42,9 @@ SALE_TYPE_CAPPED: constant(uint256) = 1       # Stop after maxSupply reached
 SALE_TYPE_QUANTITY_PHASES: constant(uint256) = 2  # Price increases based on quantity sold
 SALE_TYPE_TIME_PHASES: constant(uint256) = 3      # Price increases based on time
 
+# Max editions per batch sale operation (start/pause/resume/reprice)
+MAX_SALE_BATCH_SIZE: constant(uint256) = 200
+
 # Phase Configuration (matching ArtEdition1155)
 struct PhaseConfig:
     threshold: uint256  # Quantity threshold for QUANTITY_PHASES, timestamp for TIME_PHASES
@@ -57,6 +60,9 @@ event SalePaused:
     erc1155: indexed(address)
 event SaleResumed:
     erc1155: indexed(address)
+event SalePriceUpdated:
+    erc1155: indexed(address)
+    price: uint256
 event EditionCreated:
     erc1155: indexed(address)
     artPiece: indexed(address)
@@ -70,9 +76,10 @@ interface ProfileFactoryAndRegistry:
 interface ArtEdition1155:
     def initialize(_art_sales_1155: address, _art_piece: address, _name: String[100], _symbol: String[10], _payment_currency: address): nonpayable
     def createEdition(_mint_price: uint256, _max_supply: uint256, _royalty_percent: uint256, _sale_type: uint256, _phases: DynArray[PhaseConfig, 5], _time_cap_hard_stop: uint256, _mint_cap_hard_stop: uint256): nonpayable
-    def startSale(): nonpayable
+    def startSale() -> uint256: nonpayable
     def pauseSale(): nonpayable
     def resumeSale(): nonpayable
+    def setCurrentPrice(_new_price: uint256): nonpayable
     def getSaleInfo() -> (uint256, uint256, uint256, uint256, bool, uint256): view
     def getPhases() -> DynArray[PhaseConfig, 5]: view
 
@@ -594,16 +601,7 @@ def startSaleForEdition(_edition_address: address):
     Only the owner can call this.
     """
     assert msg.sender == self.owner, "Only owner can start sales"
-    assert self.artistErc1155sToSellExistsAndPositionOffsetByOne[_edition_address] != 0, "Edition not managed by this contract"
-    
-    edition: ArtEdition1155 = ArtEdition1155(_edition_address)
-    extcall edition.startSale()
-    
-    # Get sale info to emit event
-    sale_info: (uint256, uint256, uint256, uint256, bool, uint256) = staticcall edition.getSaleInfo()
-    sale_type: uint256 = sale_info[0]
-    
-    log SaleStarted(erc1155=_edition_address, saleType=sale_type)
+    self._startSale(_edition_address)
 
 @external
 def pauseSaleForEdition(_edition_address: address):
@@ -612,12 +610,7 @@ def pauseSaleForEdition(_edition_address: address):
     Only the owner can call this.
     """
     assert msg.sender == self.owner, "Only owner can pause sales"
-    assert self.artistErc1155sToSellExistsAndPositionOffsetByOne[_edition_address] != 0, "Edition not managed by this contract"
-    
-    edition: ArtEdition1155 = ArtEdition1155(_edition_address)
-    extcall edition.pauseSale()
-    
-    log SalePaused(erc1155=_edition_address)
+    self._pauseSale(_edition_address)
 
 @external
 def resumeSaleForEdition(_edition_address: address):
@@ -626,69 +619,105 @@ def resumeSaleForEdition(_edition_address: address):
     Only the owner can call this.
     """
     assert msg.sender == self.owner, "Only owner can resume sales"
-    assert self.artistErc1155sToSellExistsAndPositionOffsetByOne[_edition_address] != 0, "Edition not managed by this contract"
-    
-    edition: ArtEdition1155 = ArtEdition1155(_edition_address)
-    extcall edition.resumeSale()
-    
-    log SaleResumed(erc1155=_edition_address)
+    self._resumeSale(_edition_address)
 
 @external
-def batchStartSales(_edition_addresses: DynArray[address, 10]):
+def setCurrentPriceForEdition(_edition_address: address, _price: uint256):
     """
-    Start sales for multiple editions at once.
-    Much simpler now - no token IDs needed since each edition only has token ID 1.
+    Manually set the price of an edition (only for non-phased sales).
+    Only the owner can call this.
+    """
+    assert msg.sender == self.owner, "Only owner can set prices"
+    self._setCurrentPrice(_edition_address, _price)
+
+@external
+def batchStartSales(_edition_addresses: DynArray[address, MAX_SALE_BATCH_SIZE]):
+    """
+    Start sales for multiple editions at once, e.g. for a timed drop.
+    Ownership is checked once for the whole batch; any edition that is not managed
+    by this contract or is already active reverts the batch.
     """
     assert msg.sender == self.owner, "Only owner can start sales"
-    assert len(_edition_addresses) <= 10, "Too many items in batch"
     
-    for i: uint256 in range(len(_edition_addresses), bound=10):
-        edition_address: address = _edition_addresses[i]
-        assert self.artistErc1155sToSellExistsAndPositionOffsetByOne[edition_address] != 0, "Edition not managed by this contract"
-        
-        edition: ArtEdition1155 = ArtEdition1155(edition_address)
-        extcall edition.startSale()
-        
-        # Get sale info to emit event
-        sale_info: (uint256, uint256, uint256, uint256, bool, uint256) = staticcall edition.getSaleInfo()
-        sale_type: uint256 = sale_info[0]
-        
-        log SaleStarted(erc1155=edition_address, saleType=sale_type)
+    for edition_address: address in _edition_addresses:
+        self._startSale(edition_address)
 
 @external
-def batchPauseSales(_edition_addresses: DynArray[address, 10]):
+def batchPauseSales(_edition_addresses: DynArray[address, MAX_SALE_BATCH_SIZE]):
     """
     Pause sales for multiple editions at once.
-    Much simpler now - no token IDs needed since each edition only has token ID 1.
     """
     assert msg.sender == self.owner, "Only owner can pause sales"
-    assert len(_edition_addresses) <= 10, "Too many items in batch"
     
-    for i: uint256 in range(len(_edition_addresses), bound=10):
-        edition_address: address = _edition_addresses[i]
-        assert self.artistErc1155sToSellExistsAndPositionOffsetByOne[edition_address] != 0, "Edition not managed by this contract"
-        
-        edition: ArtEdition1155 = ArtEdition1155(edition_address)
-        extcall edition.pauseSale()
-        
-        log SalePaused(erc1155=edition_address)
+    for edition_address: address in _edition_addresses:
+        self._pauseSale(edition_address)
 
 @external
-def batchResumeSales(_edition_addresses: DynArray[address, 10]):
+def batchResumeSales(_edition_addresses: DynArray[address, MAX_SALE_BATCH_SIZE]):
     """
     Resume sales for multiple editions at once.
     """
     assert msg.sender == self.owner, "Only owner can resume sales"
-    assert len(_edition_addresses) <= 10, "Too many items in batch"
     
-    for i: uint256 in range(len(_edition_addresses), bound=10):
-        edition_address: address = _edition_addresses[i]
-        assert self.artistErc1155sToSellExistsAndPositionOffsetByOne[edition_address] != 0, "Edition not managed by this contract"
-        
-        edition: ArtEdition1155 = ArtEdition1155(edition_address)
-        extcall edition.resumeSale()
-        
-        log SaleResumed(erc1155=edition_address)
+    for edition_address: address in _edition_addresses:
+        self._resumeSale(edition_address)
+
+@external
+def batchSetCurrentPrices(_edition_addresses: DynArray[address, MAX_SALE_BATCH_SIZE], _prices: DynArray[uint256, MAX_SALE_BATCH_SIZE]):
+    """
+    Reprice multiple editions at once (only for non-phased sales).
+    _prices[i] is the new price for _edition_addresses[i].
+    """
+    assert msg.sender == self.owner, "Only owner can set prices"
+    assert len(_edition_addresses) == len(_prices), "Length mismatch"
+    
+    for i: uint256 in range(len(_edition_addresses), bound=MAX_SALE_BATCH_SIZE):
+        self._setCurrentPrice(_edition_addresses[i], _prices[i])
+
+@internal
+def _startSale(_edition_address: address):
+    """
+    Start the sale for a managed edition. Caller must have checked ownership.
+    """
+    assert self.artistErc1155sToSellExistsAndPositionOffsetByOne[_edition_address] != 0, "Edition not managed by this contract"
+    
+    # The edition returns its sale type so no extra getSaleInfo call is needed for the event
+    sale_type: uint256 = extcall ArtEdition1155(_edition_address).startSale()
+    
+    log SaleStarted(erc1155=_edition_address, saleType=sale_type)
+
+@internal
+def _pauseSale(_edition_address: address):
+    """
+    Pause the sale for a managed edition. Caller must have checked ownership.
+    """
+    assert self.artistErc1155sToSellExistsAndPositionOffsetByOne[_edition_address] != 0, "Edition not managed by this contract"
+    
+    extcall ArtEdition1155(_edition_address).pauseSale()
+    
+    log SalePaused(erc1155=_edition_address)
+
+@internal
+def _resumeSale(_edition_address: address):
+    """
+    Resume the sale for a managed edition. Caller must have checked ownership.
+    """
+    assert self.artistErc1155sToSellExistsAndPositionOffsetByOne[_edition_address] != 0, "Edition not managed by this contract"
+    
+    extcall ArtEdition1155(_edition_address).resumeSale()
+    
+    log SaleResumed(erc1155=_edition_address)
+
+@internal
+def _setCurrentPrice(_edition_address: address, _price: uint256):
+    """
+    Set the price of a managed edition. Caller must have checked ownership.
+    """
+    assert self.artistErc1155sToSellExistsAndPositionOffsetByOne[_edition_address] != 0, "Edition not managed by this contract"
+    
+    extcall ArtEdition1155(_edition_address).setCurrentPrice(_price)
+    
+    log SalePriceUpdated(erc1155=_edition_address, price=_price)
 
 # ================================================================================================
 # VIEW FUNCTIONS FOR SALES MANAGEMENT
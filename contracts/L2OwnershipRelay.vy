@@ -32,6 +32,19 @@ ARBSYS: constant(address) = 0x0000000000000000000000000000000000000064
 # L3 Inbox address for L2->L3 transactions
 L3_INBOX: constant(address) = 0xA203252940839c8482dD4b938b4178f842E343D7
 
+# Retryable ticket fees for relayToL3, callers pass fees estimated for the current L3 base fee
+# (scripts/l3_fee_estimator.py). The default gas limit covers a first registration that creates the hub
+# (~433k gas), an owner change of a hub with verified art pieces needs estimated fees
+DEFAULT_MAX_SUBMISSION_COST: constant(uint256) = 10**16  # 0.01 ETH
+DEFAULT_L3_GAS_LIMIT: constant(uint256) = 600000
+DEFAULT_L3_MAX_FEE_PER_GAS: constant(uint256) = 2000000000  # 2 gwei
+# Bounds on caller supplied fees: a ticket below MIN_L3_GAS_LIMIT can't register an owner on L3,
+# the caps stop a mistyped fee from draining the caller
+MIN_L3_GAS_LIMIT: constant(uint256) = 100000
+MAX_L3_GAS_LIMIT: constant(uint256) = 5000000
+MAX_SUBMISSION_COST: constant(uint256) = 10**17  # 0.1 ETH
+MAX_L3_MAX_FEE_PER_GAS: constant(uint256) = 100000000000  # 100 gwei
+
 event NFTRegistered:
     chain_id: indexed(uint256)
     nft_contract: indexed(address)
@@ -112,13 +125,29 @@ def revokeOwner():
 
 @external
 @payable
-def relayToL3(_chain_id: uint256, _nft_contract: address, _token_id: uint256, _owner: address):
+def relayToL3(
+    _chain_id: uint256,
+    _nft_contract: address,
+    _token_id: uint256,
+    _owner: address,
+    _max_submission_cost: uint256 = DEFAULT_MAX_SUBMISSION_COST,
+    _gas_limit: uint256 = DEFAULT_L3_GAS_LIMIT,
+    _max_fee_per_gas: uint256 = DEFAULT_L3_MAX_FEE_PER_GAS
+):
     """
-    Relay NFT ownership from L2 to Animechain L3 using retryable tickets
-    This function will be used to forward NFT ownership data to Animechain through the L3 inbox
+    @notice Relay NFT ownership from L2 to Animechain L3 using retryable tickets
+            This function will be used to forward NFT ownership data to Animechain through the L3 inbox
+    @param _max_submission_cost Max submission cost of the ticket, at most MAX_SUBMISSION_COST
+    @param _gas_limit L3 gas limit of the registration, between MIN_L3_GAS_LIMIT and MAX_L3_GAS_LIMIT
+    @param _max_fee_per_gas Max L3 fee per gas, at most MAX_L3_MAX_FEE_PER_GAS
+    @dev msg.value must cover _max_submission_cost + _gas_limit * _max_fee_per_gas, the excess is refunded on L3
     """
     # Make sure we have a valid L3 contract set
     assert self.l3Contract != empty(address), "L3 contract not set"
+    assert _max_submission_cost > 0 and _max_submission_cost <= MAX_SUBMISSION_COST, "Invalid max submission cost"
+    assert _gas_limit >= MIN_L3_GAS_LIMIT and _gas_limit <= MAX_L3_GAS_LIMIT, "Invalid L3 gas limit"
+    assert _max_fee_per_gas > 0 and _max_fee_per_gas <= MAX_L3_MAX_FEE_PER_GAS, "Invalid L3 max fee per gas"
+    assert msg.value >= _max_submission_cost + _gas_limit * _max_fee_per_gas, "Insufficient value for retryable ticket fees"
     
     # We trust the caller, but log the relay event
     log RelayToL3Initiated(chain_id=_chain_id, nft_contract=_nft_contract, token_id=_token_id, owner=_owner)
@@ -135,22 +164,18 @@ def relayToL3(_chain_id: uint256, _nft_contract: address, _token_id: uint256, _o
     # Build the call data for the L3 contract
     calldata: Bytes[132] = concat(selector, chain_id_bytes, nft_contract_bytes, token_id_bytes, owner_bytes)
     
-    # Default values for retryable ticket
     l2CallValue: uint256 = 0  # Usually 0 unless sending ETH to L3
-    maxSubmissionCost: uint256 = 10**16  # Fixed amount (0.01 ETH) for submission cost
-    gasLimit: uint256 = 300000  # Default gas limit for L3 call (can be adjusted)
-    maxFeePerGas: uint256 = 2000000000  # 2 gwei default (can be adjusted)
     
     # Create retryable ticket to L3
     l3_inbox: L3Inbox = L3Inbox(L3_INBOX)
     ticket_id: uint256 = extcall l3_inbox.createRetryableTicket(
         self.l3Contract,
         l2CallValue,
-        maxSubmissionCost,
+        _max_submission_cost,
         msg.sender,
         msg.sender,
-        gasLimit,
-        maxFeePerGas,
+        _gas_limit,
+        _max_fee_per_gas,
         0,  # totalTokenFeeAmount
         calldata,
         value=msg.value
@@ -36,6 +36,16 @@ event TokenWithdrawn:
 # Constants for standardized pagination and unified array capacities
 PAGE_SIZE: constant(uint256) = 20
 MAX_ITEMS: constant(uint256) = 10**8  # unified max length for all item lists (adjusted if needed to original limits)
+MAX_LINK_BATCH_SIZE: constant(uint256) = 100  # max art pieces per linkArtPiecesAsMyCommissions call
+
+# Per-piece outcomes of linking a commission (each failure matches a CommissionFailedLink reason)
+LINK_RESULT_LINKED: constant(uint256) = 0
+LINK_RESULT_ALREADY_ADDED: constant(uint256) = 1           # "Commission already added"
+LINK_RESULT_NOT_A_COMMISSION: constant(uint256) = 2        # "Not a commission art piece"
+LINK_RESULT_BLACKLISTED: constant(uint256) = 3             # "Artist or commissioner is on blacklist"
+LINK_RESULT_NOT_WHITELISTED: constant(uint256) = 4         # "Artist or commissioner is not whitelisted"
+LINK_RESULT_UNVERIFIED_DISALLOWED: constant(uint256) = 5   # "Unverified commissions are disallowed by this Profile."
+LINK_RESULT_ALREADY_UNVERIFIED: constant(uint256) = 6      # "Commission already added, but unverified.  Please verify."
 
 # Owner of the profile (user address)
 deployer: public(address)
@@ -86,6 +96,23 @@ struct PhaseConfig:
     threshold: uint256  # Quantity threshold for QUANTITY_PHASES, timestamp for TIME_PHASES
     price: uint256
 
+# Everything the frontend needs to render a profile page, returned by getProfileSummary
+struct ProfileSummary:
+    owner: address
+    isArtist: bool
+    allowUnverifiedCommissions: bool
+    profileImage: address
+    profileSocial: address
+    artSales1155: address
+    myArtCount: uint256
+    myCommissionCount: uint256
+    myUnverifiedCommissionCount: uint256
+    commissionHubCount: uint256
+    latestArtPieces: DynArray[address, 50]  # newest first
+    latestCommissions: DynArray[address, 50]  # newest first
+    latestUnverifiedCommissions: DynArray[address, 50]  # newest first
+    latestCommissionHubs: DynArray[address, 50]  # newest first
+
 # Interface for ProfileFactoryAndRegistry
 interface ProfileFactoryAndRegistry:
     def artCommissionHubOwners() -> address: view
@@ -263,10 +290,8 @@ def linkArtPieceAsMyCommission(_art_piece: address) -> bool:
     """
     # Get the art piece details to check permissions
     art_piece: ArtPiece = ArtPiece(_art_piece)
-    effective_owner: address = staticcall art_piece.getOwner()
     art_artist: address = staticcall art_piece.getArtist()
     commissioner: address = staticcall art_piece.getCommissioner()
-    is_potential_commission: bool = commissioner != art_artist
     
     # Define clear permission categories
     is_profile_owner: bool = msg.sender == self.owner
@@ -276,86 +301,112 @@ def linkArtPieceAsMyCommission(_art_piece: address) -> bool:
     # Check if caller is a valid profile representing one of the parties
     is_valid_profile_caller: bool = False
     if msg.sender != self.owner and msg.sender != self.profileFactoryAndRegistry and msg.sender != _art_piece:
-        # Only check profile validity for non-system/non-art-piece callers
-        # Verify this is a valid profile contract from our factory
-        profile_factory: ProfileFactoryAndRegistry = ProfileFactoryAndRegistry(self.profileFactoryAndRegistry)
-        artist_profile: address = staticcall profile_factory.getProfile(art_artist)
-        commissioner_profile: address = staticcall profile_factory.getProfile(commissioner)
-        
-        # Allow calls from the official profiles of the artist or commissioner
-        is_valid_profile_caller = (msg.sender == artist_profile or msg.sender == commissioner_profile)
+        # Only the official profiles of the artist or commissioner (from our factory) are valid
+        is_valid_profile_caller = self._isPartyProfile(msg.sender, art_artist, commissioner)
     
     # Require at least one valid permission
     assert is_profile_owner or is_system or is_art_piece_self or is_valid_profile_caller, "No permission to add commission"
 
+    return self._linkArtPiece(_art_piece, art_artist, commissioner, is_valid_profile_caller) == LINK_RESULT_LINKED
+
+#
+# linkArtPiecesAsMyCommissions
+# -------------
+# Batch form of linkArtPieceAsMyCommission, e.g. for migrating a back-catalog of commissions to a new profile.
+# Permission is resolved once for the whole batch, so only the profile owner and the system can call it.
+# A piece that cannot be linked does not revert the batch, its outcome is returned (and logged with CommissionFailedLink).
+#
+@external
+def linkArtPiecesAsMyCommissions(_art_pieces: DynArray[address, MAX_LINK_BATCH_SIZE]) -> DynArray[uint256, MAX_LINK_BATCH_SIZE]:
+    """
+    @notice Links many art pieces to this profile in one call, like linkArtPieceAsMyCommission
+    @dev Access control - profile owner or ProfileFactoryAndRegistry
+    @param _art_pieces The addresses of the art pieces to link
+    @return One LINK_RESULT_* code per art piece, in input order
+    """
+    assert msg.sender == self.owner or msg.sender == self.profileFactoryAndRegistry, "No permission to add commission"
+
+    results: DynArray[uint256, MAX_LINK_BATCH_SIZE] = []
+    for piece: address in _art_pieces:
+        art_piece: ArtPiece = ArtPiece(piece)
+        results.append(self._linkArtPiece(piece, staticcall art_piece.getArtist(), staticcall art_piece.getCommissioner(), False))
+    return results
+
+@internal
+def _linkArtPiece(_art_piece: address, _art_artist: address, _commissioner: address, _require_whitelist: bool) -> uint256:
+    """
+    @notice Links an art piece to myCommissions or myUnverifiedCommissions, caller permission must already be checked
+    @dev Failures are logged with CommissionFailedLink and returned as a LINK_RESULT_* code instead of reverting
+    @param _require_whitelist True when the caller is another party's profile, which needs to be whitelisted
+    """
     if self.myCommissionExistsAndPositionOffsetByOne[_art_piece] != 0:
         log CommissionFailedLink(profile=self, art_piece=_art_piece, reason="Commission already added")
-        return False
+        return LINK_RESULT_ALREADY_ADDED
 
-    if not is_potential_commission:
+    if _commissioner == _art_artist:
         log CommissionFailedLink(profile=self, art_piece=_art_piece, reason="Not a commission art piece")
-        return False
+        return LINK_RESULT_NOT_A_COMMISSION
     
     # If artist/commissioner are blacklisted by THIS profile, reject the commission
-    if (self.blacklist[commissioner] or self.blacklist[art_artist]):
+    if (self.blacklist[_commissioner] or self.blacklist[_art_artist]):
         log CommissionFailedLink(profile=self, art_piece=_art_piece, reason="Artist or commissioner is on blacklist")
-        return False
+        return LINK_RESULT_BLACKLISTED
+
+    is_whitelisted: bool = self.whitelist[_commissioner] or self.whitelist[_art_artist]
 
     # For profile callers (not owner/system/art piece), require whitelisting
-    if is_valid_profile_caller and not (self.whitelist[commissioner] or self.whitelist[art_artist]):
+    if _require_whitelist and not is_whitelisted:
         log CommissionFailedLink(profile=self, art_piece=_art_piece, reason="Artist or commissioner is not whitelisted")
-        return False
+        return LINK_RESULT_NOT_WHITELISTED
     
     # Add to myArt collection if the profile owner is the commissioner
-    if self.owner == commissioner and self.myArtExistsAndPositionOffsetByOne[_art_piece] == 0:
+    if self.owner == _commissioner and self.myArtExistsAndPositionOffsetByOne[_art_piece] == 0:
         self.myArt.append(_art_piece)
         self.myArtCount += 1
         self.myArtExistsAndPositionOffsetByOne[_art_piece] = self.myArtCount
     
-    # Determine if this should be added to verified or myUnverified list
-    # Commissions are now verified only when both parties verify them
-    is_verified_by_both: bool = False
-    if is_potential_commission:
-        is_verified_by_both = staticcall art_piece.isFullyVerifiedCommission()
-    
-    # Check if we should add to verified list due to whitelisting
-    should_add_to_verified: bool = is_verified_by_both
-    if is_potential_commission and not is_verified_by_both:
-        # If the artist or commissioner is whitelisted by this profile, add to verified list
-        if self.whitelist[commissioner] or self.whitelist[art_artist]:
-            should_add_to_verified = True
+    # Commissions are verified only when both parties verify them,
+    # or when the artist or commissioner is whitelisted by this profile
+    should_add_to_verified: bool = is_whitelisted or staticcall ArtPiece(_art_piece).isFullyVerifiedCommission()
     
     # Add to verified list
     if should_add_to_verified:
-        self._addToVerifiedList(_art_piece)
+        self._addToVerifiedList(_art_piece, _art_artist)
 
     # Add to myUnverified list
     else:
         if not self.allowUnverifiedCommissions:
             log CommissionFailedLink(profile=self, art_piece=_art_piece, reason="Unverified commissions are disallowed by this Profile.")
-            return False
+            return LINK_RESULT_UNVERIFIED_DISALLOWED
         if self.myUnverifiedCommissionsExistsAndPositionOffsetByOne[_art_piece] != 0:
             log CommissionFailedLink(profile=self, art_piece=_art_piece, reason="Commission already added, but unverified.  Please verify.")
-            return False
-        self._addToUnverifiedList(_art_piece)
+            return LINK_RESULT_ALREADY_UNVERIFIED
+        self._addToUnverifiedList(_art_piece, _art_artist)
 
-    return True
+    return LINK_RESULT_LINKED
 
 @internal
-def _addToUnverifiedList(_art_piece: address):
-    art_piece: ArtPiece = ArtPiece(_art_piece)
+@view
+def _isPartyProfile(_caller: address, _art_artist: address, _commissioner: address) -> bool:
+    """
+    @notice Whether _caller is the registered profile of the artist or the commissioner
+    """
+    profile_factory: ProfileFactoryAndRegistry = ProfileFactoryAndRegistry(self.profileFactoryAndRegistry)
+    return _caller == staticcall profile_factory.getProfile(_art_artist) or _caller == staticcall profile_factory.getProfile(_commissioner)
+
+@internal
+def _addToUnverifiedList(_art_piece: address, _art_artist: address):
     self.myUnverifiedCommissions.append(_art_piece)
     self.myUnverifiedCommissionCount += 1
-    self.myCommissionRole[_art_piece] = (self.owner == staticcall art_piece.getArtist())
+    self.myCommissionRole[_art_piece] = (self.owner == _art_artist)
     self.myUnverifiedCommissionsExistsAndPositionOffsetByOne[_art_piece] = self.myUnverifiedCommissionCount
     log CommissionLinked(profile=self, art_piece=_art_piece)
 
 @internal
-def _addToVerifiedList(_art_piece: address):
-    art_piece: ArtPiece = ArtPiece(_art_piece)
+def _addToVerifiedList(_art_piece: address, _art_artist: address):
     self.myCommissions.append(_art_piece)
     self.myCommissionCount += 1
-    self.myCommissionRole[_art_piece] = (self.owner == staticcall art_piece.getArtist())
+    self.myCommissionRole[_art_piece] = (self.owner == _art_artist)
     self.myCommissionExistsAndPositionOffsetByOne[_art_piece] = self.myCommissionCount
     log CommissionLinked(profile=self, art_piece=_art_piece)
 
@@ -409,17 +460,12 @@ def verifyArtLinkedToMyCommission(_art_piece: address):
             self.myArtCount += 1
             self.myArtExistsAndPositionOffsetByOne[_art_piece] = self.myArtCount
         
-        # Check if it's in the myUnverified list
-        found_myUnverified: bool = False
+        # Check if it's in the myUnverified list (position map is offset by 1, 0 when absent)
+        myUnverified_position: uint256 = self.myUnverifiedCommissionsExistsAndPositionOffsetByOne[_art_piece]
+        found_myUnverified: bool = myUnverified_position != 0
         myUnverified_index: uint256 = 0
-        
-        for i: uint256 in range(0, len(self.myUnverifiedCommissions), bound=1000):
-            if i >= len(self.myUnverifiedCommissions):
-                break
-            if self.myUnverifiedCommissions[i] == _art_piece:
-                myUnverified_index = i
-                found_myUnverified = True
-                break
+        if found_myUnverified:
+            myUnverified_index = myUnverified_position - 1
         
         if found_myUnverified:
             # Remove from myUnverified list and update mappings
@@ -506,13 +552,8 @@ def removeArtLinkToMyCommission(_my_commission: address):
     # Check if caller is a valid profile representing one of the parties
     is_valid_profile_caller: bool = False
     if msg.sender != self.owner and msg.sender != self.profileFactoryAndRegistry and msg.sender != _my_commission:
-        # Verify this is a valid profile contract from our factory
-        profile_factory: ProfileFactoryAndRegistry = ProfileFactoryAndRegistry(self.profileFactoryAndRegistry)
-        artist_profile: address = staticcall profile_factory.getProfile(art_artist)
-        commissioner_profile: address = staticcall profile_factory.getProfile(commissioner)
-        
-        # Allow calls from the official profiles of the artist or commissioner
-        is_valid_profile_caller = (msg.sender == artist_profile or msg.sender == commissioner_profile)
+        # Only the official profiles of the artist or commissioner (from our factory) are valid
+        is_valid_profile_caller = self._isPartyProfile(msg.sender, art_artist, commissioner)
     
     # Require at least one valid permission
     assert is_profile_owner or is_system or is_art_piece_self or is_valid_profile_caller, "No permission to remove commission"
@@ -539,6 +580,55 @@ def removeArtLinkToMyCommission(_my_commission: address):
         self.myCommissionExistsAndPositionOffsetByOne[_my_commission] = 0
 
 
+@internal
+@pure
+def _pageRange(_length: uint256, _offset: uint256, _count: uint256, _reverse: bool) -> (uint256, uint256):
+    """
+    @notice Shared offset pagination math for the list getters
+    @dev Forward: _offset is the starting index. Reverse: _offset is items to skip from the end.
+    @return (first index to read, number of items capped at 50), walking backwards from the first index when _reverse
+    """
+    if _offset >= _length:
+        return (0, 0)  # Offset beyond array bounds
+    count: uint256 = min(min(_count, _length - _offset), 50)
+    if _reverse:
+        return (_length - 1 - _offset, count)
+    return (_offset, count)
+
+@internal
+@view
+def _getCommissionsByOffset(_offset: uint256, _count: uint256, reverse: bool) -> DynArray[address, 50]:
+    result: DynArray[address, 50] = []
+    start: uint256 = 0
+    count: uint256 = 0
+    start, count = self._pageRange(self.myCommissionCount, _offset, _count, reverse)
+    for i: uint256 in range(0, count, bound=50):
+        result.append(self.myCommissions[start - i if reverse else start + i])
+    return result
+
+@internal
+@view
+def _getUnverifiedCommissionsByOffset(_offset: uint256, _count: uint256, reverse: bool) -> DynArray[address, 50]:
+    result: DynArray[address, 50] = []
+    start: uint256 = 0
+    count: uint256 = 0
+    start, count = self._pageRange(self.myUnverifiedCommissionCount, _offset, _count, reverse)
+    for i: uint256 in range(0, count, bound=50):
+        result.append(self.myUnverifiedCommissions[start - i if reverse else start + i])
+    return result
+
+@internal
+@view
+def _getArtPiecesByOffset(_offset: uint256, _count: uint256, reverse: bool) -> DynArray[address, 50]:
+    result: DynArray[address, 50] = []
+    start: uint256 = 0
+    count: uint256 = 0
+    start, count = self._pageRange(self.myArtCount, _offset, _count, reverse)
+    for i: uint256 in range(0, count, bound=50):
+        result.append(self.myArt[start - i if reverse else start + i])
+    return result
+
+
 ## get Commissions
 #
 # getCommissionsByOffset
@@ -561,38 +651,7 @@ def getCommissionsByOffset(_offset: uint256, _count: uint256, reverse: bool) ->
     @param reverse Direction: False = forward (oldest first), True = reverse (newest first)
     @return A list of up to 50 commission addresses
     """
-    result: DynArray[address, 50] = []
-    array_length: uint256 = self.myCommissionCount
-    
-    # Handle empty array
-    if array_length == 0:
-        return result
-    
-    if not reverse:
-        # FORWARD PAGINATION: _offset is starting index
-        if _offset >= array_length:
-            return result  # Offset beyond array bounds
-        
-        available_items: uint256 = array_length - _offset
-        count: uint256 = min(min(_count, available_items), 50)
-        
-        for i: uint256 in range(0, count, bound=50):
-            result.append(self.myCommissions[_offset + i])
-    else:
-        # REVERSE PAGINATION: _offset is items to skip from end
-        if _offset >= array_length:
-            return result  # Skip more items than exist
-            
-        # Calculate starting index (skip _offset items from the end)
-        start_index: uint256 = array_length - 1 - _offset
-        available_items: uint256 = start_index + 1  # Items available going backwards
-        count: uint256 = min(min(_count, available_items), 50)
-        
-        for i: uint256 in range(0, count, bound=50):
-            index: uint256 = start_index - i
-            result.append(self.myCommissions[index])
-    
-    return result
+    return self._getCommissionsByOffset(_offset, _count, reverse)
 
 
 ## Unverified Commissions
@@ -617,38 +676,7 @@ def getUnverifiedCommissionsByOffset(_offset: uint256, _count: uint256, reverse:
     @param reverse Direction: False = forward (oldest first), True = reverse (newest first)
     @return A list of up to 50 unverified commission addresses
     """
-    result: DynArray[address, 50] = []
-    array_length: uint256 = self.myUnverifiedCommissionCount
-    
-    # Handle empty array
-    if array_length == 0:
-        return result
-    
-    if not reverse:
-        # FORWARD PAGINATION: _offset is starting index
-        if _offset >= array_length:
-            return result  # Offset beyond array bounds
-        
-        available_items: uint256 = array_length - _offset
-        count: uint256 = min(min(_count, available_items), 50)
-        
-        for i: uint256 in range(0, count, bound=50):
-            result.append(self.myUnverifiedCommissions[_offset + i])
-    else:
-        # REVERSE PAGINATION: _offset is items to skip from end
-        if _offset >= array_length:
-            return result  # Skip more items than exist
-            
-        # Calculate starting index (skip _offset items from the end)
-        start_index: uint256 = array_length - 1 - _offset
-        available_items: uint256 = start_index + 1  # Items available going backwards
-        count: uint256 = min(min(_count, available_items), 50)
-        
-        for i: uint256 in range(0, count, bound=50):
-            index: uint256 = start_index - i
-            result.append(self.myUnverifiedCommissions[index])
-    
-    return result
+    return self._getUnverifiedCommissionsByOffset(_offset, _count, reverse)
 
 
 @external
@@ -955,38 +983,7 @@ def getArtPiecesByOffset(_offset: uint256, _count: uint256, reverse: bool) -> Dy
     @param reverse Direction: False = forward (oldest first), True = reverse (newest first)
     @return A list of up to 50 art piece addresses
     """
-    result: DynArray[address, 50] = []
-    array_length: uint256 = self.myArtCount
-    
-    # Handle empty array
-    if array_length == 0:
-        return result
-    
-    if not reverse:
-        # FORWARD PAGINATION: _offset is starting index
-        if _offset >= array_length:
-            return result  # Offset beyond array bounds
-        
-        available_items: uint256 = array_length - _offset
-        count: uint256 = min(min(_count, available_items), 50)
-        
-        for i: uint256 in range(0, count, bound=50):
-            result.append(self.myArt[_offset + i])
-    else:
-        # REVERSE PAGINATION: _offset is items to skip from end
-        if _offset >= array_length:
-            return result  # Skip more items than exist
-            
-        # Calculate starting index (skip _offset items from the end)
-        start_index: uint256 = array_length - 1 - _offset
-        available_items: uint256 = start_index + 1  # Items available going backwards
-        count: uint256 = min(min(_count, available_items), 50)
-        
-        for i: uint256 in range(0, count, bound=50):
-            index: uint256 = start_index - i
-            result.append(self.myArt[index])
-    
-    return result
+    return self._getArtPiecesByOffset(_offset, _count, reverse)
 
 @view
 @external
@@ -1061,13 +1058,8 @@ def updateCommissionVerificationStatus(_commission_art_piece: address):
     # Check if sender is a valid profile representing one of the parties
     is_valid_profile_caller: bool = False
     if msg.sender != self.owner and msg.sender != art_artist and msg.sender != commissioner and not is_hub_owner:
-        # Verify this is a valid profile contract from our factory
-        profile_factory: ProfileFactoryAndRegistry = ProfileFactoryAndRegistry(self.profileFactoryAndRegistry)
-        artist_profile: address = staticcall profile_factory.getProfile(art_artist)
-        commissioner_profile: address = staticcall profile_factory.getProfile(commissioner)
-        
-        # Allow calls from the official profiles of the artist or commissioner
-        is_valid_profile_caller = (msg.sender == artist_profile or msg.sender == commissioner_profile)
+        # Only the official profiles of the artist or commissioner (from our factory) are valid
+        is_valid_profile_caller = self._isPartyProfile(msg.sender, art_artist, commissioner)
     
     # Verify the sender has permission to update verification status
     assert is_profile_owner or is_art_creator or is_hub_owner or is_valid_profile_caller, "No permission to update verification status"
@@ -1088,17 +1080,12 @@ def updateCommissionVerificationStatus(_commission_art_piece: address):
             self.myArtCount += 1
             self.myArtExistsAndPositionOffsetByOne[_commission_art_piece] = self.myArtCount
         
-        # Check if it's in the myUnverified list
-        found_myUnverified: bool = False
+        # Check if it's in the myUnverified list (position map is offset by 1, 0 when absent)
+        myUnverified_position: uint256 = self.myUnverifiedCommissionsExistsAndPositionOffsetByOne[_commission_art_piece]
+        found_myUnverified: bool = myUnverified_position != 0
         myUnverified_index: uint256 = 0
-        
-        for i: uint256 in range(0, len(self.myUnverifiedCommissions), bound=1000):
-            if i >= len(self.myUnverifiedCommissions):
-                break
-            if self.myUnverifiedCommissions[i] == _commission_art_piece:
-                myUnverified_index = i
-                found_myUnverified = True
-                break
+        if found_myUnverified:
+            myUnverified_index = myUnverified_position - 1
         
         if found_myUnverified:
             # Remove from myUnverified list and update mappings
@@ -1181,6 +1168,48 @@ def getCommissionHubCount() -> uint256:
     registry: ArtCommissionHubOwners = ArtCommissionHubOwners(registry_addr)
     return staticcall registry.getCommissionHubCountByOwner(self.owner)
 
+#
+# getProfileSummary
+# -----------------
+# Returns all counters, flags and the newest page of every list in one call.
+# Use case:
+# - The frontend renders a profile page with a single RPC round-trip instead of a dozen.
+# Example:
+# - summary = profile.getProfileSummary(5) -> latest 5 art pieces, commissions, unverified commissions and hubs
+#
+@view
+@external
+def getProfileSummary(_page_size: uint256) -> ProfileSummary:
+    """
+    @notice Returns the profile's counters, flags and the first (newest first) page of each list
+    @param _page_size Number of items per list (capped at 50)
+    @return A ProfileSummary struct
+    """
+    summary: ProfileSummary = ProfileSummary(
+        owner=self.owner,
+        isArtist=self.isArtist,
+        allowUnverifiedCommissions=self.allowUnverifiedCommissions,
+        profileImage=self.profileImage,
+        profileSocial=self.profileSocial,
+        artSales1155=self.artSales1155,
+        myArtCount=self.myArtCount,
+        myCommissionCount=self.myCommissionCount,
+        myUnverifiedCommissionCount=self.myUnverifiedCommissionCount,
+        commissionHubCount=0,
+        latestArtPieces=self._getArtPiecesByOffset(0, _page_size, True),
+        latestCommissions=self._getCommissionsByOffset(0, _page_size, True),
+        latestUnverifiedCommissions=self._getUnverifiedCommissionsByOffset(0, _page_size, True),
+        latestCommissionHubs=[]
+    )
+    
+    registry_addr: address = self._getArtCommissionHubOwners()
+    if registry_addr != empty(address):
+        registry: ArtCommissionHubOwners = ArtCommissionHubOwners(registry_addr)
+        summary.commissionHubCount = staticcall registry.getCommissionHubCountByOwner(self.owner)
+        summary.latestCommissionHubs = staticcall registry.getCommissionHubsByOwnerWithOffset(self.owner, 0, _page_size, True)
+    
+    return summary
+
 @external
 def createArtEdition(
     _art_piece: address,
@@ -73,6 +73,9 @@ activeUsersWithCommissionsRegistry: public(HashMap[address, bool])  # Maps user
 GENERIC_ART_COMMISSION_HUB_CONTRACT: constant(address) = 0x1000000000000000000000000000000000000001
 GENERIC_ART_COMMISSION_HUB_CHAIN_ID: constant(uint256) = 1
 
+# Max profiles created in a single createProfiles batch (partner community onboarding)
+MAX_PROFILE_BATCH_SIZE: constant(uint256) = 100
+
 # Events
 event ProfileCreated:
     user: indexed(address)
@@ -138,6 +141,15 @@ def _addNewUserAndProfileAndSocial(_user: address, _profile: address, _social: a
     self.userAddressToProfileSocial[_user] = _social
     self.allUserProfilesCount += 1
     
+@internal
+def _deployProfileAndSocial(_user: address, _is_artist: bool) -> (address, address):
+    # Clone and initialize the profile and profile social for a user (does not register them)
+    profile: address = create_minimal_proxy_to(self.profileTemplate, revert_on_failure=True)
+    social: address = create_minimal_proxy_to(self.profileSocialTemplate, revert_on_failure=True)
+    extcall Profile(profile).initialize(_user, social, self, _is_artist)
+    extcall ProfileSocial(social).initialize(_user, profile, self)
+    return (profile, social)
+
 # Its true, anyone can create a profile for anyone else!
 # returns the profile and profile social addresses
 @internal
@@ -146,30 +158,14 @@ def _createProfile(_new_profile_address: address, _is_artist: bool = False) -> (
     assert _new_profile_address != empty(address), "Invalid profile address"
     caller_profile: address = self.userAddressToProfile[_new_profile_address]
     caller_profile_social: address = self.userAddressToProfileSocial[_new_profile_address]
-    
-    caller_profile_instance: Profile = Profile(empty(address))
-    caller_profile_social_instance: ProfileSocial = ProfileSocial(empty(address))
 
     if caller_profile == empty(address):
-        # Create a new profile for the caller
-        caller_profile = create_minimal_proxy_to(self.profileTemplate, revert_on_failure=True)
-        caller_profile_instance = Profile(caller_profile)
-        
-        # Create a new profile social contract for the caller
-        caller_social: address = create_minimal_proxy_to(self.profileSocialTemplate, revert_on_failure=True)
-        caller_profile_social_instance = ProfileSocial(caller_social)
-        
-        # Initialize the profile with the caller as the owner
-        extcall caller_profile_instance.initialize(_new_profile_address, caller_social, self, _is_artist)
-        extcall caller_profile_social_instance.initialize(_new_profile_address, caller_profile, self)
-        
-        self._addNewUserAndProfileAndSocial(_new_profile_address, caller_profile, caller_social)        
-        log ProfileCreated(user=_new_profile_address, profile=caller_profile, social=caller_social)
-    else:
-        caller_profile_instance = Profile(caller_profile)
-        caller_profile_social_instance = ProfileSocial(caller_profile_social)
+        # Create a new profile and profile social for the caller, with the caller as the owner
+        (caller_profile, caller_profile_social) = self._deployProfileAndSocial(_new_profile_address, _is_artist)
+        self._addNewUserAndProfileAndSocial(_new_profile_address, caller_profile, caller_profile_social)
+        log ProfileCreated(user=_new_profile_address, profile=caller_profile, social=caller_profile_social)
 
-    return (caller_profile_instance.address, caller_profile_social_instance.address)
+    return (caller_profile, caller_profile_social)
 
 # Optionally on behalf of another user
 @external
@@ -179,6 +175,41 @@ def createProfile(_owner: address = empty(address), _is_artist: bool = False):
         owner = msg.sender
     self._createProfile(owner, _is_artist)
 
+@external
+def createProfiles(_owners: DynArray[address, MAX_PROFILE_BATCH_SIZE], _is_artist: bool = False) -> DynArray[address, MAX_PROFILE_BATCH_SIZE]:
+    """
+    @notice Creates profiles for many users in one transaction (ex: onboarding a partner community)
+    @dev Users who already have a profile (or appear twice in the batch) are skipped.
+         allUserProfilesCount is read and written once for the whole batch instead of once per user.
+    @param _owners The addresses to create profiles for
+    @param _is_artist Whether the new profiles are artist profiles
+    @return The addresses of the newly created profiles, in the same order as _owners
+    """
+    created_profiles: DynArray[address, MAX_PROFILE_BATCH_SIZE] = []
+    user_count: uint256 = self.allUserProfilesCount
+
+    for user: address in _owners:
+        assert user != empty(address), "Invalid profile address"
+        if self.userAddressToProfile[user] != empty(address):
+            continue
+
+        profile: address = empty(address)
+        social: address = empty(address)
+        (profile, social) = self._deployProfileAndSocial(user, _is_artist)
+
+        # Same bookkeeping as _addNewUserAndProfileAndSocial, with the count kept in memory
+        self.latestUsers[user_count % 100] = user
+        self.allUserProfiles.append(user)
+        self.userAddressToProfile[user] = profile
+        self.userAddressToProfileSocial[user] = social
+        user_count += 1
+
+        log ProfileCreated(user=user, profile=profile, social=social)
+        created_profiles.append(profile)
+
+    self.allUserProfilesCount = user_count
+    return created_profiles
+
 @external
 @nonreentrant
 def createNewArtPieceAndRegisterProfileAndAttachToHub(
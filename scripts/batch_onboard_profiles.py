@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# Script to onboard a partner community from a CSV of addresses
+#
+# Creates profiles (and optionally generic commission hubs) in batches using
+#   ProfileFactoryAndRegistry.createProfiles
+#   ArtCommissionHubOwners.createGenericCommissionHubs
+# Batches are sized from a gas estimate so each transaction stays under --gas-budget.
+#
+# Usage:
+#   python scripts/batch_onboard_profiles.py --csv partners.csv --network testnet
+#   python scripts/batch_onboard_profiles.py --csv partners.csv --network testnet --with-hubs
+
+import argparse
+import csv
+import os
+import sys
+from pathlib import Path
+
+from ape import accounts, networks, project
+from ape_accounts import import_account_from_private_key
+from dotenv import load_dotenv
+from web3 import Web3
+
+sys.path.append(str(Path(__file__).parent))
+from contract_config_writer import get_contract_address
+
+# Must match MAX_PROFILE_BATCH_SIZE / MAX_GENERIC_HUB_BATCH_SIZE in the contracts
+MAX_BATCH_SIZE = 100
+# Default gas budget per batch transaction (leaves headroom under a 30M block gas limit)
+DEFAULT_GAS_BUDGET = 15_000_000
+# Number of users used to estimate the per-user gas cost
+PROBE_BATCH_SIZE = 5
+# Safety margin applied on top of the estimated per-user gas
+GAS_MARGIN = 1.2
+
+GENERIC_ART_COMMISSION_HUB_CONTRACT = "0x1000000000000000000000000000000000000001"
+GENERIC_ART_COMMISSION_HUB_CHAIN_ID = 1
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+NETWORKS = {
+    "local": {"choice": "ethereum:local:test", "config_network": "testnet", "account": None},
+    "testnet": {"choice": "arbitrum:sepolia:alchemy", "config_network": "testnet", "account": "deployer"},
+    "mainnet": {"choice": "ethereum:animechain", "config_network": "mainnet", "account": "animechain_deployer"},
+}
+
+
+def read_addresses(csv_path):
+    """
+    Read addresses from a CSV file.
+
+    Uses the 'address' column if there is a header row, otherwise the first column.
+    Invalid rows are reported and skipped, duplicates are removed (first occurrence wins).
+
+    Returns:
+        list: Checksummed addresses in file order
+    """
+    addresses = []
+    seen = set()
+    with open(csv_path, newline="") as f:
+        rows = list(csv.reader(f))
+
+    if not rows:
+        return addresses
+
+    column = 0
+    header = [cell.strip().lower() for cell in rows[0]]
+    if "address" in header:
+        column = header.index("address")
+        rows = rows[1:]
+
+    for line_number, row in enumerate(rows, start=1):
+        if len(row) <= column or not row[column].strip():
+            continue
+        value = row[column].strip()
+        if not Web3.is_address(value):
+            print(f"WARNING: Skipping invalid address on row {line_number}: {value}")
+            continue
+        address = Web3.to_checksum_address(value)
+        if address == ZERO_ADDRESS or address in seen:
+            continue
+        seen.add(address)
+        addresses.append(address)
+
+    return addresses
+
+
+def chunk_addresses(addresses, batch_size):
+    """Split addresses into consecutive batches of at most batch_size."""
+    return [addresses[i:i + batch_size] for i in range(0, len(addresses), batch_size)]
+
+
+def batch_size_for_budget(per_user_gas, gas_budget):
+    """Number of users that fit in one transaction for the given gas budget."""
+    if per_user_gas <= 0:
+        return MAX_BATCH_SIZE
+    return max(1, min(MAX_BATCH_SIZE, int(gas_budget // (per_user_gas * GAS_MARGIN))))
+
+
+def load_sender(network):
+    """Load the account used to send the onboarding transactions."""
+    account_alias = NETWORKS[network]["account"]
+    if account_alias is None:
+        return accounts.test_accounts[0]
+
+    dotenv_path = Path(__file__).parent.parent / '.env'
+    load_dotenv(dotenv_path=dotenv_path)
+    private_key = os.environ.get("PRIVATE_KEY", "").strip()
+    passphrase = os.environ.get("DEPLOYER_PASSPHRASE", "").strip()
+    if not private_key or not passphrase:
+        raise ValueError("PRIVATE_KEY and DEPLOYER_PASSPHRASE must be set in .env")
+
+    try:
+        sender = accounts.load(account_alias)
+    except Exception:
+        sender = import_account_from_private_key(account_alias, passphrase, private_key)
+    sender.set_autosign(True, passphrase=passphrase)
+    return sender
+
+
+def needs_onboarding(address, profile_factory, art_commission_hub_owners):
+    """Whether the batch call would create anything for this address."""
+    if art_commission_hub_owners is None:
+        return not profile_factory.hasProfile(address)
+    hub = art_commission_hub_owners.getArtCommissionHubByOwner(
+        GENERIC_ART_COMMISSION_HUB_CHAIN_ID,
+        GENERIC_ART_COMMISSION_HUB_CONTRACT,
+        int(address, 16),
+    )
+    return hub == ZERO_ADDRESS
+
+
+def onboard(addresses, profile_factory, art_commission_hub_owners, sender, gas_budget, is_artist=False, dry_run=False):
+    """
+    Create profiles (or generic hubs + profiles) for all addresses in gas-sized batches.
+
+    Returns:
+        int: Number of users onboarded
+    """
+    if art_commission_hub_owners is None:
+        batch_method = profile_factory.createProfiles
+        batch_args = lambda batch: (batch, is_artist)
+        created_event = "ProfileCreated"
+    else:
+        batch_method = art_commission_hub_owners.createGenericCommissionHubs
+        batch_args = lambda batch: (batch,)
+        created_event = "GenericCommissionHubCreated"
+
+    pending = [a for a in addresses if needs_onboarding(a, profile_factory, art_commission_hub_owners)]
+    print(f"{len(addresses) - len(pending)} of {len(addresses)} addresses are already onboarded, skipping them")
+    if not pending:
+        return 0
+
+    # Estimate the per-user cost from a small probe batch
+    probe = pending[:PROBE_BATCH_SIZE]
+    probe_gas = batch_method.estimate_gas_cost(*batch_args(probe), sender=sender)
+    per_user_gas = probe_gas / len(probe)
+    batch_size = batch_size_for_budget(per_user_gas, gas_budget)
+    print(f"Estimated {int(per_user_gas):,} gas per user, using batches of {batch_size} (budget {gas_budget:,} gas)")
+
+    onboarded = 0
+    remaining = pending
+    while remaining:
+        batch = remaining[:batch_size]
+        estimate = batch_method.estimate_gas_cost(*batch_args(batch), sender=sender)
+        if estimate > gas_budget and len(batch) > 1:
+            # Per-user cost is not perfectly linear (cold storage, artist sales contracts), shrink and retry
+            batch_size = max(1, len(batch) // 2)
+            print(f"Batch of {len(batch)} estimated at {estimate:,} gas, shrinking to {batch_size}")
+            continue
+
+        if dry_run:
+            print(f"[dry run] Would onboard {len(batch)} users ({estimate:,} gas)")
+            onboarded += len(batch)
+        else:
+            receipt = batch_method(*batch_args(batch), sender=sender, gas_limit=int(estimate * GAS_MARGIN))
+            created = [e for e in receipt.events if e.event_name == created_event]
+            onboarded += len(created)
+            print(f"Onboarded {len(created)} users in tx {receipt.txn_hash} (gas used {receipt.gas_used:,})")
+
+        remaining = remaining[len(batch):]
+
+    return onboarded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch create profiles (and optionally generic commission hubs) from a CSV of addresses")
+    parser.add_argument('--csv', required=True, help='CSV file with an "address" column (or addresses in the first column)')
+    parser.add_argument('--network', choices=list(NETWORKS.keys()), default='testnet', help='Network to use')
+    parser.add_argument('--with-hubs', action='store_true', help='Also create generic commission hubs (requires ArtCommissionHubOwners owner)')
+    parser.add_argument('--artist', action='store_true', help='Create artist profiles (profiles only, ignored with --with-hubs)')
+    parser.add_argument('--gas-budget', type=int, default=DEFAULT_GAS_BUDGET, help='Max gas per batch transaction')
+    parser.add_argument('--profile-factory', help='ProfileFactoryAndRegistry address (defaults to contract_config.json)')
+    parser.add_argument('--hub-owners', help='ArtCommissionHubOwners address (defaults to contract_config.json)')
+    parser.add_argument('--dry-run', action='store_true', help='Only estimate gas and print the batches')
+    args = parser.parse_args()
+
+    addresses = read_addresses(args.csv)
+    print(f"Read {len(addresses)} unique addresses from {args.csv}")
+    if not addresses:
+        return
+
+    network = NETWORKS[args.network]
+    with networks.parse_network_choice(network["choice"]):
+        profile_factory_address = args.profile_factory or get_contract_address(network["config_network"], "profileFactoryAndRegistry")
+        if not profile_factory_address:
+            print("ERROR: ProfileFactoryAndRegistry address not found")
+            sys.exit(1)
+        profile_factory = project.ProfileFactoryAndRegistry.at(profile_factory_address)
+
+        art_commission_hub_owners = None
+        if args.with_hubs:
+            hub_owners_address = args.hub_owners or get_contract_address(network["config_network"], "l3")
+            if not hub_owners_address:
+                print("ERROR: ArtCommissionHubOwners address not found")
+                sys.exit(1)
+            art_commission_hub_owners = project.ArtCommissionHubOwners.at(hub_owners_address)
+
+        sender = load_sender(args.network)
+        print(f"Using account: {sender.address}")
+
+        onboarded = onboard(
+            addresses,
+            profile_factory,
+            art_commission_hub_owners,
+            sender,
+            args.gas_budget,
+            is_artist=args.artist,
+            dry_run=args.dry_run,
+        )
+        print(f"Done, onboarded {onboarded} users")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# Gas benchmark: ArtEdition1155.airdrop vs gifting editions with repeated single mints
+#
+# The single-mint baseline is what an artist has to do without airdrop:
+#   mint(amount) to themselves, then safeTransferFrom to the recipient (2 transactions per recipient)
+#
+# Usage:
+#   python scripts/benchmark_edition_airdrop.py
+#   python scripts/benchmark_edition_airdrop.py --sizes 10 100 500
+
+import argparse
+import sys
+from pathlib import Path
+
+from ape import accounts, networks
+
+sys.path.append(str(Path(__file__).parent))
+from benchmark_utils import LOCAL_NETWORK, create_edition, deploy_local_system, print_gas_table, random_addresses
+
+DEFAULT_SIZES = [10, 100, 500]
+MINT_PRICE = 10**15
+
+
+def benchmark_single_mints(system, artist, recipients):
+    """
+    Gift one edition to each recipient with mint + safeTransferFrom, return total gas used.
+    Receipts include the intrinsic 21000 gas of every transaction.
+    """
+    edition = create_edition(system, artist, price=MINT_PRICE)
+    total_gas = 0
+    for recipient in recipients:
+        receipt = edition.mint(1, value=MINT_PRICE, sender=artist)
+        total_gas += receipt.gas_used
+        receipt = edition.safeTransferFrom(artist.address, recipient, 1, 1, b"", sender=artist)
+        total_gas += receipt.gas_used
+    return total_gas
+
+
+def benchmark_airdrop(system, artist, recipients):
+    """Gift one edition to each recipient with a single airdrop, return total gas used."""
+    edition = create_edition(system, artist, price=MINT_PRICE)
+    receipt = edition.airdrop(recipients, [1] * len(recipients), sender=artist)
+    return receipt.gas_used
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ArtEdition1155 airdrop gas against repeated single mints")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Recipient counts to benchmark')
+    args = parser.parse_args()
+
+    rows = []
+    with networks.parse_network_choice(LOCAL_NETWORK):
+        system = deploy_local_system()
+        artist = accounts.test_accounts[1]
+
+        for seed, size in enumerate(args.sizes):
+            # Fresh recipients for each run so every balance write is a cold zero -> non-zero SSTORE
+            single_gas = benchmark_single_mints(system, artist, random_addresses(size, seed=2 * seed + 1))
+            airdrop_gas = benchmark_airdrop(system, artist, random_addresses(size, seed=2 * seed + 2))
+            rows.append([
+                size,
+                single_gas,
+                single_gas / size,
+                airdrop_gas,
+                airdrop_gas / size,
+                f"{100 * (1 - airdrop_gas / single_gas):.1f}%",
+            ])
+            print(f"Benchmarked {size} recipients")
+
+    print_gas_table(
+        "ArtEdition1155 gifting: mint + transfer per recipient vs one airdrop",
+        ["recipients", "single total", "single/recipient", "airdrop total", "airdrop/recipient", "saved"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# Gas benchmark: ArtPiece owner reads with a pushed (cached) owner vs live resolution
+#
+# Before: the owner is resolved on every read with an external call to the hub (or license).
+# After: the hub / license pushes owner changes to ArtPiece.refreshCachedOwner and reads are one SLOAD
+# (a cached hub owner also reads the hub's owner epoch, so it is never trusted past an owner change).
+# The same piece is measured in both states: a verified commission sitting in the hub's unverified
+# list resolves live, once the hub owner verifies it the hub pushes and it is cached. License owned
+# pieces are compared with a license issued for another piece (resolved live).
+#
+# transferFrom is not measured: it always reverts ("Transfers disabled for hub-attached art pieces")
+# without resolving the owner. The write-side price of the cache is measured instead: the gas of a
+# hub owner sync that pushes to N verified pieces.
+#
+# Usage:
+#   python scripts/benchmark_owner_cache.py
+#   python scripts/benchmark_owner_cache.py --hub-sizes 1 10 100
+
+import argparse
+import sys
+from pathlib import Path
+
+from ape import accounts, networks, project
+
+sys.path.append(str(Path(__file__).parent))
+from benchmark_utils import LOCAL_NETWORK, TEST_TOKEN_URI_DATA, TEST_TOKEN_URI_DATA_FORMAT, deploy_local_system, print_gas_table
+
+DEFAULT_HUB_SIZES = [1, 10, 50]
+NFT_CONTRACT = "0x2000000000000000000000000000000000000002"
+OWNER_READS = [
+    ("ownerOf", lambda owner: [1]),
+    ("balanceOf", lambda owner: [owner]),
+    ("getOwner", lambda owner: []),
+]
+
+
+def read_gas(art_piece, method, args, sender):
+    """
+    Gas of a view method sent as a transaction (includes the 21000 intrinsic gas).
+    The local test provider pads eth_estimateGas, receipts give the exact figure.
+    """
+    return getattr(art_piece, method).transact(*args, sender=sender).gas_used
+
+
+def measure_reads(art_piece, owner, sender):
+    return {name: read_gas(art_piece, name, args(owner), sender) for name, args in OWNER_READS}
+
+
+def create_verified_commission(system, hub, artist, commissioner):
+    """Art piece attached to hub and verified by artist and commissioner (lands in the hub's unverified list)."""
+    deployer = system["deployer"]
+    art_piece = project.ArtPiece.deploy(sender=deployer)
+    art_piece.initialize(
+        TEST_TOKEN_URI_DATA, TEST_TOKEN_URI_DATA_FORMAT, "Benchmark Commission", "Created by a benchmark script",
+        commissioner.address, artist.address, hub.address, False,
+        artist.address, system["profile_factory_and_registry"].address,
+        sender=deployer
+    )
+    art_piece.verifyAsArtist(sender=artist)
+    art_piece.verifyAsCommissioner(sender=commissioner)
+    return art_piece
+
+
+def register_nft_hub(system, token_id, owner):
+    owners = system["art_commission_hub_owners"]
+    owners.registerNFTOwnerFromParentChain(1, NFT_CONTRACT, token_id, owner.address, sender=system["deployer"])
+    return project.ArtCommissionHub.at(owners.getArtCommissionHubByOwner(1, NFT_CONTRACT, token_id))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ArtPiece owner reads with and without the pushed owner cache")
+    parser.add_argument('--hub-sizes', type=int, nargs='+', default=DEFAULT_HUB_SIZES, help='Verified pieces per hub for the owner sync benchmark')
+    args = parser.parse_args()
+
+    read_rows = []
+    sync_rows = []
+    with networks.parse_network_choice(LOCAL_NETWORK):
+        system = deploy_local_system()
+        deployer = system["deployer"]
+        artist, commissioner, hub_owner, new_owner = accounts.test_accounts[1:5]
+        for account in (artist, commissioner, hub_owner):
+            system["profile_factory_and_registry"].createProfile(account.address, sender=deployer)
+        # Approves the ArtPiece code hash, so directly deployed pieces can submit to hubs
+        system["art_commission_hub_owners"].setApprovedArtPiece(system["art_piece_template"].address, True, sender=deployer)
+
+        # Hub owned piece: live while unverified in the hub, cached once the hub verifies it
+        hub = register_nft_hub(system, 1, hub_owner)
+        art_piece = create_verified_commission(system, hub, artist, commissioner)
+        live = measure_reads(art_piece, hub_owner.address, deployer)
+        hub.verifyCommission(art_piece.address, sender=hub_owner)
+        assert art_piece.cachedEffectiveOwner() == hub_owner.address
+        cached = measure_reads(art_piece, hub_owner.address, deployer)
+        read_rows += [["hub owner", name, live[name], cached[name], live[name] - cached[name]] for name, _ in OWNER_READS]
+
+        # License owned piece: a license for another piece is resolved live, its own license is cached
+        other_license = project.ArtPieceLicense.deploy(sender=deployer)
+        other_license.initialize(hub.address, hub_owner.address, sender=deployer)
+        art_piece.setArtPieceLicense(other_license.address, sender=artist)
+        live = measure_reads(art_piece, hub_owner.address, deployer)
+        own_license = project.ArtPieceLicense.deploy(sender=deployer)
+        own_license.initialize(art_piece.address, hub_owner.address, sender=deployer)
+        art_piece.setArtPieceLicense(own_license.address, sender=artist)
+        cached = measure_reads(art_piece, hub_owner.address, deployer)
+        read_rows += [["license owner", name, live[name], cached[name], live[name] - cached[name]] for name, _ in OWNER_READS]
+
+        # Owner sync cost with pushes to every verified piece of the hub
+        for token_id, size in enumerate(args.hub_sizes, start=2):
+            hub = register_nft_hub(system, token_id, hub_owner)
+            for _ in range(size):
+                art_piece = create_verified_commission(system, hub, artist, commissioner)
+                hub.verifyCommission(art_piece.address, sender=hub_owner)
+            receipt = system["art_commission_hub_owners"].registerNFTOwnerFromParentChain(
+                1, NFT_CONTRACT, token_id, new_owner.address, sender=deployer
+            )
+            sync_rows.append([size, receipt.gas_used, receipt.gas_used / size])
+            print(f"Benchmarked owner sync for {size} verified pieces")
+
+    print_gas_table(
+        "ArtPiece owner reads: live resolution vs pushed owner cache",
+        ["owner source", "call", "live gas", "cached gas", "saved"],
+        read_rows,
+    )
+    print_gas_table(
+        "Hub owner sync (registerNFTOwnerFromParentChain) pushing to verified pieces",
+        ["verified pieces", "sync gas", "gas/piece"],
+        sync_rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# Gas benchmark: bridge re-sync of a whole NFT collection where most owners are unchanged
+#
+# Registers --tokens tokens of one collection (creating their commission hubs), then replays a
+# re-sync of every token where --changed-percent of the owners changed. The replay is measured
+# through registerNFTOwnersFromParentChain in batches of --batch-size with:
+#   - minOwnerRefreshInterval = 0: every unchanged token refreshes its timestamp and logs Registered,
+#     the closest to the previous behavior (which also rewrote the owner slot)
+#   - the default interval: unchanged tokens take the no-op fast path
+# and per token through registerNFTOwnerFromParentChain (one relayed message per token) for a sample
+# of unchanged and changed tokens. Both replays start from the same chain snapshot.
+#
+# Creating 10k hubs takes a few minutes on the local test network, use --tokens for quicker runs.
+#
+# Usage:
+#   python scripts/benchmark_owner_resync.py
+#   python scripts/benchmark_owner_resync.py --tokens 1000 --changed-percent 5 --batch-size 50
+
+import argparse
+import sys
+from pathlib import Path
+
+from ape import accounts, chain, networks
+
+sys.path.append(str(Path(__file__).parent))
+from benchmark_utils import LOCAL_NETWORK, deploy_local_system, print_gas_table
+
+DEFAULT_TOKENS = 10_000
+DEFAULT_CHANGED_PERCENT = 5
+# Must not exceed MAX_NFT_OWNER_BATCH_SIZE in ArtCommissionHubOwners
+DEFAULT_BATCH_SIZE = 50
+# First registrations create a hub per token (~360k gas each), keep those batches under the block gas limit
+CREATE_BATCH_SIZE = 50
+SINGLE_CALL_SAMPLE = 20
+CHAIN_ID = 1
+NFT_CONTRACT = "0x2000000000000000000000000000000000000002"
+
+
+def batches(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def register_batches(art_commission_hub_owners, token_ids, owners, batch_size, sender):
+    """Register owners in batches, return the total gas used."""
+    gas_used = 0
+    for ids, batch_owners in zip(batches(token_ids, batch_size), batches(owners, batch_size)):
+        receipt = art_commission_hub_owners.registerNFTOwnersFromParentChain(CHAIN_ID, NFT_CONTRACT, ids, batch_owners, sender=sender)
+        gas_used += receipt.gas_used
+    return gas_used
+
+
+def single_call_gas(art_commission_hub_owners, token_ids, owners, sender):
+    """Average gas of one registerNFTOwnerFromParentChain per token."""
+    total = 0
+    for token_id, owner in zip(token_ids, owners):
+        total += art_commission_hub_owners.registerNFTOwnerFromParentChain(CHAIN_ID, NFT_CONTRACT, token_id, owner, sender=sender).gas_used
+    return total / len(token_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark a collection owner re-sync with mostly unchanged owners")
+    parser.add_argument('--tokens', type=int, default=DEFAULT_TOKENS, help='Tokens in the collection')
+    parser.add_argument('--changed-percent', type=float, default=DEFAULT_CHANGED_PERCENT, help='Percent of tokens whose owner changed')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Tokens per registerNFTOwnersFromParentChain call')
+    args = parser.parse_args()
+
+    batch_rows = []
+    single_rows = []
+    with networks.parse_network_choice(LOCAL_NETWORK):
+        system = deploy_local_system()
+        deployer = system["deployer"]
+        art_commission_hub_owners = system["art_commission_hub_owners"]
+        holders = [account.address for account in accounts.test_accounts[1:9]]
+        default_interval = art_commission_hub_owners.minOwnerRefreshInterval()
+
+        token_ids = list(range(1, args.tokens + 1))
+        owners = [holders[token_id % len(holders)] for token_id in token_ids]
+        register_batches(art_commission_hub_owners, token_ids, owners, CREATE_BATCH_SIZE, deployer)
+        print(f"Registered {args.tokens:,} tokens")
+
+        # Spread the changed tokens evenly over the collection
+        changed_every = max(1, round(100 / args.changed_percent)) if args.changed_percent > 0 else args.tokens + 1
+        changed = {token_id for token_id in token_ids if token_id % changed_every == 0}
+        resync_owners = [
+            holders[(token_id + 1) % len(holders)] if token_id in changed else owner
+            for token_id, owner in zip(token_ids, owners)
+        ]
+        unchanged_sample = [token_id for token_id in token_ids if token_id not in changed][:SINGLE_CALL_SAMPLE]
+        changed_sample = sorted(changed)[:SINGLE_CALL_SAMPLE]
+
+        for name, interval in (("interval 0 (refresh every token)", 0), (f"interval {default_interval}s (fast path)", default_interval)):
+            snapshot = chain.snapshot()
+            art_commission_hub_owners.setMinOwnerRefreshInterval(interval, sender=deployer)
+            gas_used = register_batches(art_commission_hub_owners, token_ids, resync_owners, args.batch_size, deployer)
+            batch_rows.append([name, args.tokens, len(changed), gas_used, gas_used / args.tokens])
+            chain.restore(snapshot)
+
+            snapshot = chain.snapshot()
+            art_commission_hub_owners.setMinOwnerRefreshInterval(interval, sender=deployer)
+            unchanged_gas = single_call_gas(art_commission_hub_owners, unchanged_sample, [resync_owners[t - 1] for t in unchanged_sample], deployer)
+            changed_gas = single_call_gas(art_commission_hub_owners, changed_sample, [resync_owners[t - 1] for t in changed_sample], deployer) if changed_sample else 0
+            single_rows.append([name, unchanged_gas, changed_gas])
+            chain.restore(snapshot)
+            print(f"Replayed the re-sync with {name}")
+
+    print_gas_table(
+        f"Collection re-sync through registerNFTOwnersFromParentChain (batches of {args.batch_size})",
+        ["mode", "tokens", "changed", "total gas", "gas/token"],
+        batch_rows,
+    )
+    print_gas_table(
+        "One registerNFTOwnerFromParentChain per token (average)",
+        ["mode", "unchanged owner gas", "changed owner gas"],
+        single_rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
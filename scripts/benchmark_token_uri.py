@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# Gas benchmark: ArtPiece with a stored tokenURIJson vs tokenURI composed at read time
+#
+# Creation: Profile.createArtPiece with the OpenSea JSON the upload form builds (and with a full
+# 2500 byte JSON) against an empty _token_uri_json, for the same image.
+# Reading: gas of tokenURI(1) sent as a transaction for both modes and several raw image sizes (the
+# local test provider pads eth_estimateGas, receipts give the exact figure, including the 21000
+# intrinsic gas). Reads are free for eth_call users but show how far a composed URI is from the
+# node's eth_call gas cap.
+# Creating a piece with the full 45000 byte image takes more than the 30M gas block limit of the
+# local test network, so the default sizes stop at 20000 bytes.
+#
+# Usage:
+#   python scripts/benchmark_token_uri.py
+#   python scripts/benchmark_token_uri.py --image-sizes 1000 5000 20000
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from ape import accounts, networks, project
+
+sys.path.append(str(Path(__file__).parent))
+from benchmark_utils import LOCAL_NETWORK, ZERO_ADDRESS, create_artist, deploy_local_system, print_gas_table
+
+DEFAULT_IMAGE_SIZES = [1000, 10000, 20000]
+MAX_TOKEN_URI_JSON_LENGTH = 2500
+TITLE = "Benchmark Art"
+DESCRIPTION = "Created by a benchmark script"
+
+
+def frontend_token_uri_json(image_reference, length=None):
+    """
+    The JSON formatOpenSeaMetadataAsJSON (src/utils/openSeaMetadataFormatter.ts) builds on upload,
+    padded through the description when a length is given.
+    """
+    metadata = {
+        "name": TITLE,
+        "description": DESCRIPTION,
+        "image": image_reference,
+        "attributes": [
+            {"trait_type": "Format", "value": "webp"},
+            {"trait_type": "AI Generated", "value": "No"},
+        ],
+        "properties": {"files": [], "category": "image"},
+    }
+    token_uri_json = json.dumps(metadata, indent=2)
+    if length is not None:
+        metadata["description"] += " " * (length - len(token_uri_json))
+        token_uri_json = json.dumps(metadata, indent=2)
+    return token_uri_json
+
+
+def benchmark_image(size):
+    """Deterministic raw image bytes of the given size."""
+    return bytes((i * 131 + 7) % 256 for i in range(size))
+
+
+def create_piece(system, artist_profile, artist, image, token_uri_json):
+    """Create an art piece with the 11 argument createArtPiece, return (art piece, gas used)."""
+    receipt = artist_profile.createArtPiece(
+        system["art_piece_template"].address,
+        image,
+        "webp",
+        TITLE,
+        DESCRIPTION,
+        True,
+        artist.address,
+        False,
+        ZERO_ADDRESS,
+        False,
+        token_uri_json,
+        sender=artist
+    )
+    art_piece = project.ArtPiece.at(artist_profile.getArtPiecesByOffset(0, 1, True)[0])
+    return art_piece, receipt.gas_used
+
+
+def token_uri_read_gas(art_piece, sender):
+    """Gas of tokenURI(1) sent as a transaction (includes the 21000 intrinsic gas)."""
+    return art_piece.tokenURI.transact(1, sender=sender).gas_used
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark stored vs composed ArtPiece tokenURI gas")
+    parser.add_argument('--image-sizes', type=int, nargs='+', default=DEFAULT_IMAGE_SIZES, help='Raw image sizes in bytes')
+    args = parser.parse_args()
+
+    creation_rows = []
+    read_rows = []
+    with networks.parse_network_choice(LOCAL_NETWORK):
+        system = deploy_local_system()
+        artist = accounts.test_accounts[1]
+        artist_profile, _ = create_artist(system, artist)
+
+        for size in args.image_sizes:
+            image = benchmark_image(size)
+            variants = [
+                ("composed", ""),
+                ("upload form JSON", frontend_token_uri_json("https://arweave.net/" + "x" * 43)),
+                ("max JSON", frontend_token_uri_json("https://arweave.net/" + "x" * 43, MAX_TOKEN_URI_JSON_LENGTH)),
+            ]
+            composed_gas = None
+            for name, token_uri_json in variants:
+                art_piece, gas_used = create_piece(system, artist_profile, artist, image, token_uri_json)
+                composed_gas = composed_gas if composed_gas is not None else gas_used
+                creation_rows.append([size, name, len(token_uri_json), gas_used, gas_used - composed_gas])
+                read_rows.append([size, name, len(art_piece.tokenURI(1)), token_uri_read_gas(art_piece, artist)])
+            print(f"Benchmarked {size} byte image")
+
+    print_gas_table(
+        "ArtPiece creation: stored tokenURIJson vs composed tokenURI",
+        ["image bytes", "mode", "json bytes", "createArtPiece gas", "extra vs composed"],
+        creation_rows,
+    )
+    print_gas_table(
+        "ArtPiece.tokenURI(1) read gas (sent as a transaction)",
+        ["image bytes", "mode", "uri length", "tokenURI gas"],
+        read_rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
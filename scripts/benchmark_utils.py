@@ -0,0 +1,149 @@
+# Shared helpers for the gas benchmark scripts (scripts/benchmark_*.py)
+#
+# Benchmarks run against the local ape test network so they need no .env or funded accounts:
+#   python scripts/benchmark_edition_airdrop.py
+
+from ape import accounts, project
+
+LOCAL_NETWORK = "ethereum:local:test"
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+TEST_TOKEN_URI_DATA = b"data:application/json;base64,eyJuYW1lIjoiQmVuY2htYXJrIn0="
+TEST_TOKEN_URI_DATA_FORMAT = "avif"
+
+
+def deploy_local_system(deployer=None):
+    """
+    Deploy templates, ProfileFactoryAndRegistry and ArtCommissionHubOwners and link them,
+    the same way the test fixtures do.
+
+    Returns:
+        dict: Deployed contracts keyed like the test fixtures
+    """
+    deployer = deployer or accounts.test_accounts[0]
+
+    profile_template = project.Profile.deploy(sender=deployer)
+    profile_social_template = project.ProfileSocial.deploy(sender=deployer)
+    commission_hub_template = project.ArtCommissionHub.deploy(sender=deployer)
+    art_edition_1155_template = project.ArtEdition1155.deploy(sender=deployer)
+    art_sales_1155_template = project.ArtSales1155.deploy(sender=deployer)
+    art_piece_template = project.ArtPiece.deploy(sender=deployer)
+
+    profile_factory_and_registry = project.ProfileFactoryAndRegistry.deploy(
+        profile_template.address, profile_social_template.address, commission_hub_template.address,
+        art_edition_1155_template.address, art_sales_1155_template.address,
+        sender=deployer
+    )
+    art_commission_hub_owners = project.ArtCommissionHubOwners.deploy(
+        deployer.address,  # L2OwnershipRelay (deployer for local benchmarks)
+        commission_hub_template.address,
+        art_piece_template.address,
+        sender=deployer
+    )
+    profile_factory_and_registry.linkArtCommissionHubOwnersContract(art_commission_hub_owners.address, sender=deployer)
+    art_commission_hub_owners.linkProfileFactoryAndRegistry(profile_factory_and_registry.address, sender=deployer)
+
+    return {
+        "deployer": deployer,
+        "profile_template": profile_template,
+        "profile_social_template": profile_social_template,
+        "commission_hub_template": commission_hub_template,
+        "art_edition_1155_template": art_edition_1155_template,
+        "art_sales_1155_template": art_sales_1155_template,
+        "art_piece_template": art_piece_template,
+        "profile_factory_and_registry": profile_factory_and_registry,
+        "art_commission_hub_owners": art_commission_hub_owners,
+    }
+
+
+def create_artist(system, artist):
+    """Create an artist profile (which auto-creates its ArtSales1155) and return (profile, art_sales)."""
+    profile_factory_and_registry = system["profile_factory_and_registry"]
+    if not profile_factory_and_registry.hasProfile(artist.address):
+        profile_factory_and_registry.createProfile(artist.address, True, sender=artist)
+    profile = project.Profile.at(profile_factory_and_registry.getProfile(artist.address))
+    if not profile.isArtist():
+        profile.setIsArtist(True, sender=artist)
+    return profile, project.ArtSales1155.at(profile.artSales1155())
+
+
+def create_art_piece(system, artist_profile, artist, title="Benchmark Art", commission_hub=ZERO_ADDRESS):
+    """Create a private (artist == commissioner) art piece on the artist's profile and return it."""
+    artist_profile.createArtPiece(
+        system["art_piece_template"].address,
+        TEST_TOKEN_URI_DATA,
+        TEST_TOKEN_URI_DATA_FORMAT,
+        title,
+        "Created by a benchmark script",
+        True,
+        artist.address,
+        False,
+        commission_hub,
+        False,
+        sender=artist
+    )
+    return project.ArtPiece.at(artist_profile.getArtPiecesByOffset(0, 1, True)[0])
+
+
+def create_verified_commission(system, commission_hub, artist, commissioner, title="Benchmark Commission"):
+    """
+    Create an art piece attached to commission_hub and verify it as artist and commissioner, the way the
+    tests do. Artist and commissioner need profiles, the artist must be whitelisted on the hub.
+    """
+    deployer = system["deployer"]
+    art_piece = project.ArtPiece.deploy(sender=deployer)
+    art_piece.initialize(
+        TEST_TOKEN_URI_DATA,
+        TEST_TOKEN_URI_DATA_FORMAT,
+        title,
+        "Created by a benchmark script",
+        commissioner.address,
+        artist.address,
+        commission_hub.address,
+        False,
+        artist.address,  # original uploader
+        system["profile_factory_and_registry"].address,
+        sender=deployer
+    )
+    system["art_commission_hub_owners"].setApprovedArtPiece(art_piece.address, True, sender=deployer)
+    art_piece.verifyAsArtist(sender=artist)
+    art_piece.verifyAsCommissioner(sender=commissioner)
+    return art_piece
+
+
+def create_edition(system, artist, price=10**15, max_supply=10**6, sale_type=1, phases=None):
+    """Create an ArtEdition1155 for a fresh art piece, start its sale and return it."""
+    artist_profile, art_sales = create_artist(system, artist)
+    art_piece = create_art_piece(system, artist_profile, artist)
+    art_sales.createEditionFromArtPiece(
+        art_piece.address, "Benchmark Edition", "BENCH", price, max_supply, 250,
+        ZERO_ADDRESS, sale_type, phases or [],
+        sender=artist
+    )
+    edition = project.ArtEdition1155.at(art_sales.getArtistErc1155AtIndex(art_sales.artistErc1155sToSellCount() - 1))
+    edition.updateProceedsAddress(artist.address, sender=artist)
+    edition.startSale(sender=artist)
+    return edition
+
+
+def random_addresses(count, seed=1):
+    """Deterministic list of distinct non-zero addresses that have never been touched."""
+    return [f"0x{(seed << 128) + i + 1:040x}" for i in range(count)]
+
+
+def print_gas_table(title, headers, rows):
+    """Print a fixed-width table of benchmark results."""
+    widths = [max(len(str(h)), *(len(_format_cell(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    print(f"\n=== {title} ===")
+    print("  ".join(str(h).rjust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(_format_cell(c).rjust(w) for c, w in zip(row, widths)))
+
+
+def _format_cell(value):
+    if isinstance(value, float):
+        return f"{value:,.1f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return str(value)
@@ -1,11 +1,43 @@
+import argparse
 import json
 import os
 import re
 import subprocess
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
 
+sys.path.append(str(Path(__file__).parent))
+from loop_cost_analyzer import analyze_contracts, print_summary, write_report
+
+# Contracts only deployed by tests, left out of compact builds
+TEST_ONLY_PREFIXES = ("ZZ_", "Mock")
+TEST_ONLY_CONTRACTS = {"SimpleERC721"}
+# ABI entries kept by tree shaking even if src/ doesn't mention them (deploys need the constructor)
+ALWAYS_KEPT_ABI_TYPES = {"constructor", "fallback", "receive"}
+SOURCE_EXTENSIONS = {".ts", ".tsx", ".js", ".jsx"}
+IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_$][A-Za-z0-9_$]*")
+
+def is_test_only_contract(contract_name: str) -> bool:
+    """Whether a contract is only used by tests (ZZ_ and Mock contracts, the test ERC721)."""
+    return contract_name.startswith(TEST_ONLY_PREFIXES) or contract_name in TEST_ONLY_CONTRACTS
+
+def find_referenced_names(src_dir="../src", exclude=("assets/abis", "utils/abiLoader.ts")) -> set:
+    """Every identifier in the frontend sources, i.e. the ABI function and event names the app can use."""
+    src_dir_abs = (Path(__file__).parent / src_dir).resolve()
+    names = set()
+    for path in src_dir_abs.rglob("*"):
+        relative_path = path.relative_to(src_dir_abs).as_posix()
+        if path.suffix not in SOURCE_EXTENSIONS or any(relative_path.startswith(prefix) for prefix in exclude):
+            continue
+        names.update(IDENTIFIER_PATTERN.findall(path.read_text(encoding="utf-8")))
+    return names
+
+def tree_shake_abi(abi: List[Dict[str, Any]], referenced_names: set) -> List[Dict[str, Any]]:
+    """Reduce an ABI to the functions and events referenced by name (plus constructor, fallback and receive)."""
+    return [item for item in abi if item.get("type") in ALWAYS_KEPT_ABI_TYPES or item.get("name") in referenced_names]
+
 def get_vyper_contracts(contracts_dir="../contracts") -> List[Path]:
     """Get all Vyper contract files from the contracts directory."""
     contracts_dir_path = Path(__file__).parent / contracts_dir
@@ -24,8 +56,10 @@ def compile_contracts() -> bool:
         print(f"[{datetime.now()}] stderr: {e.stderr}")
         return False
 
-def extract_abis_to_folder(build_file="../.build/__local__.json", output_dir="../src/assets/abis") -> Dict[str, str]:
+def extract_abis_to_folder(build_file="../.build/__local__.json", output_dir="../src/assets/abis", compact=False, referenced_names=None) -> Dict[str, str]:
     """Extract ABIs from the build file and save them as JSON files to the output directory.
+    compact writes minified JSON and leaves out (and removes) test-only contracts; with referenced_names
+    each ABI is tree shaken to the functions and events the frontend references.
     Returns a dictionary of contract names to file paths."""
     # Get absolute paths relative to the script location
     script_dir = Path(__file__).parent
@@ -55,14 +89,28 @@ def extract_abis_to_folder(build_file="../.build/__local__.json", output_dir="..
     
     # Iterate over each contract in 'contractTypes'
     for contract_name, contract_data in contract_types.items():
+        # Define the output file path with .json extension
+        output_file = output_dir_abs / f"{contract_name}.json"
+        if compact and is_test_only_contract(contract_name):
+            # Don't leave an ABI from a previous full build behind
+            if output_file.exists():
+                output_file.unlink()
+                print(f"[{datetime.now()}] Removed test-only ABI '{output_file}'")
+            continue
         # Get the ABI, default to None if not present
         abi = contract_data.get("abi")
         if abi:
-            # Define the output file path with .json extension
-            output_file = output_dir_abs / f"{contract_name}.json"
-            # Write the ABI to a JSON file with indentation for readability
+            if referenced_names is not None:
+                full_size = len(abi)
+                abi = tree_shake_abi(abi, referenced_names)
+                print(f"[{datetime.now()}] Tree shaken '{contract_name}' ABI to {len(abi)} of {full_size} entries")
             with open(output_file, "w") as abi_file:
-                json.dump(abi, abi_file, indent=2)
+                if compact:
+                    # Minified, the frontend bundles these as is
+                    json.dump(abi, abi_file, separators=(",", ":"))
+                else:
+                    # Write the ABI to a JSON file with indentation for readability
+                    json.dump(abi, abi_file, indent=2)
             print(f"[{datetime.now()}] Saved ABI for '{contract_name}' to '{output_file}'")
             # Store the relative path for abiLoader.ts
             contract_files[contract_name] = f"../assets/abis/{contract_name}.json"
@@ -71,8 +119,10 @@ def extract_abis_to_folder(build_file="../.build/__local__.json", output_dir="..
     
     return contract_files
 
-def update_abi_loader(contract_files: Dict[str, str], abi_loader_path="../src/utils/abiLoader.ts"):
-    """Update the abiLoader.ts file with the latest contract imports and mappings."""
+def update_abi_loader(contract_files: Dict[str, str], abi_loader_path="../src/utils/abiLoader.ts", lazy=False):
+    """Update the abiLoader.ts file with the latest contract imports and mappings.
+    lazy generates a loader that imports each ABI on first use (a separate chunk per ABI) instead of
+    importing all of them statically; both loaders have the same API."""
     script_dir = Path(__file__).parent
     abi_loader_abs = (script_dir / abi_loader_path).resolve()
     
@@ -80,25 +130,72 @@ def update_abi_loader(contract_files: Dict[str, str], abi_loader_path="../src/ut
         print(f"[{datetime.now()}] abiLoader.ts file not found at '{abi_loader_abs}'")
         return
     
-    # Read the current file
-    with open(abi_loader_abs, "r") as f:
-        content = f.read()
-    
     # Create new imports and mapping
     import_lines = []
     mapping_lines = []
     
     for contract_name, file_path in sorted(contract_files.items()):
-        import_var = f"{contract_name}ABI"
-        import_lines.append(f"import {import_var} from '{file_path}';")
-        mapping_lines.append(f"  '{contract_name}': {import_var},")
+        if lazy:
+            mapping_lines.append(f"  '{contract_name}': () => import('{file_path}').then(module => module.default),")
+        else:
+            import_var = f"{contract_name}ABI"
+            import_lines.append(f"import {import_var} from '{file_path}';")
+            mapping_lines.append(f"  '{contract_name}': {import_var},")
     
     # Build the new content
     imports_block = "\n".join(import_lines)
     mapping_block = "\n".join(mapping_lines)
     
-    # Create the new file content
-    new_content = f"""// Import ABIs statically to make them available in the app
+    if lazy:
+        header = f"""// ABIs are imported on first use, each one is a separate chunk of the bundle
+// Generated by scripts/compile_and_extract_abis.py --lazy-loader
+const abiImporters: {{ [key: string]: () => Promise<any> }} = {{
+{mapping_block}
+}};
+
+// Map of ABI names to the ABIs loaded so far
+const abiMap: {{ [key: string]: any }} = {{}};
+
+const abiNames = Object.keys(abiImporters);
+
+/**
+ * Load an ABI by name, importing it on first use
+ * @param abiName Name of the ABI to load
+ * @returns The ABI object or null if not found
+ */
+export const loadABIAsync = async (abiName: string): Promise<any> => {{
+  if (!abiName || !abiImporters[abiName]) {{
+    console.error(`ABI '${{abiName}}' not found`);
+    return null;
+  }}
+  
+  if (!abiMap[abiName]) {{
+    abiMap[abiName] = await abiImporters[abiName]();
+  }}
+  return abiMap[abiName];
+}};
+
+/**
+ * Load an already imported ABI by name (see loadABIAsync and preloadABIs)
+ * @param abiName Name of the ABI to load
+ * @returns The ABI object or null if not found or not imported yet
+ */
+export const loadABI = (abiName: string): any => {{
+  if (!abiName || !abiImporters[abiName]) {{
+    console.error(`ABI '${{abiName}}' not found`);
+    return null;
+  }}
+  
+  if (!abiMap[abiName]) {{
+    console.error(`ABI '${{abiName}}' is not loaded yet, use loadABIAsync or preloadABIs first`);
+    return null;
+  }}
+  
+  return abiMap[abiName];
+}};
+"""
+    else:
+        header = f"""// Import ABIs statically to make them available in the app
 {imports_block}
 
 // Map of ABI names to their actual content
@@ -106,13 +203,7 @@ const abiMap: {{ [key: string]: any }} = {{
 {mapping_block}
 }};
 
-/**
- * Get the list of available ABI names
- * @returns Array of available ABI names
- */
-export const getAvailableABIs = (): string[] => {{
-  return Object.keys(abiMap);
-}};
+const abiNames = Object.keys(abiMap);
 
 /**
  * Load an ABI by name
@@ -128,6 +219,32 @@ export const loadABI = (abiName: string): any => {{
   return abiMap[abiName];
 }};
 
+/**
+ * Load an ABI by name (same API as the lazy loader, the ABIs are already imported)
+ * @param abiName Name of the ABI to load
+ * @returns The ABI object or null if not found
+ */
+export const loadABIAsync = async (abiName: string): Promise<any> => loadABI(abiName);
+"""
+    
+    # Create the new file content
+    new_content = header + f"""
+/**
+ * Get the list of available ABI names
+ * @returns Array of available ABI names
+ */
+export const getAvailableABIs = (): string[] => {{
+  return [...abiNames];
+}};
+
+/**
+ * Load the ABIs a screen needs ahead of synchronous loadABI / getMethodNames calls
+ * @param names Names of the ABIs to load
+ */
+export const preloadABIs = async (names: string[]): Promise<void> => {{
+  await Promise.all(names.map(loadABIAsync));
+}};
+
 /**
  * Get the human-readable method names from an ABI
  * @param abiName Name of the ABI to analyze
@@ -145,7 +262,7 @@ export const getMethodNames = (abiName: string): string[] => {{
 /**
  * Find ABIs that have a specific method
  * @param methodName Method name to search for
- * @returns Array of ABI names that contain the method
+ * @returns Array of (loaded) ABI names that contain the method
  */
 export const findABIsWithMethod = (methodName: string): string[] => {{
   return Object.keys(abiMap).filter(abiName => {{
@@ -159,6 +276,8 @@ export const findABIsWithMethod = (methodName: string): string[] => {{
 export default {{
   getAvailableABIs,
   loadABI,
+  loadABIAsync,
+  preloadABIs,
   getMethodNames,
   findABIsWithMethod
 }}; 
@@ -168,10 +287,15 @@ export default {{
     with open(abi_loader_abs, "w") as f:
         f.write(new_content)
     
-    print(f"[{datetime.now()}] Updated abiLoader.ts with {len(contract_files)} contracts")
+    print(f"[{datetime.now()}] Updated abiLoader.ts with {len(contract_files)} contracts ({'lazy' if lazy else 'static'} imports)")
 
 def main():
     """Main function to run the ABI extraction process."""
+    parser = argparse.ArgumentParser(description="Compile contracts, extract ABIs for the frontend and update abiLoader.ts")
+    parser.add_argument('--compact', action='store_true', help='Minified ABIs without the test-only contracts')
+    parser.add_argument('--tree-shake', action='store_true', help='Only keep the functions and events referenced in src/')
+    parser.add_argument('--lazy-loader', action='store_true', help='Generate an abiLoader.ts that imports ABIs on first use')
+    args = parser.parse_args()
     
     # 1. Get all Vyper contracts
     contracts = get_vyper_contracts()
@@ -189,7 +313,8 @@ def main():
     
     # 3. Extract ABIs to the abis folder
     try:
-        contract_files = extract_abis_to_folder()
+        referenced_names = find_referenced_names() if args.tree_shake else None
+        contract_files = extract_abis_to_folder(compact=args.compact, referenced_names=referenced_names)
         if not contract_files:
             print(f"[{datetime.now()}] No ABIs were extracted, aborting.")
             return
@@ -199,7 +324,7 @@ def main():
     
     # 4. Update abiLoader.ts with the latest contracts
     try:
-        update_abi_loader(contract_files)
+        update_abi_loader(contract_files, lazy=args.lazy_loader)
     except Exception as e:
         print(f"[{datetime.now()}] Error updating abiLoader.ts: {e}")
         return
@@ -210,10 +335,19 @@ def main():
     print(f"[{datetime.now()}] Found contracts: {', '.join(sorted(contract_files.keys()))}")
     
     # Check for any discrepancies
-    missing_contracts = [name for name in contract_names if name not in contract_files]
+    missing_contracts = [name for name in contract_names if name not in contract_files and not (args.compact and is_test_only_contract(name))]
     if missing_contracts:
         print(f"[{datetime.now()}] WARNING: The following contracts were found but their ABIs were not extracted: {', '.join(missing_contracts)}")
         print(f"[{datetime.now()}] This could be due to compilation errors or other issues.")
 
+    # 6. Report functions whose worst-case loop gas can exceed the block gas limit
+    try:
+        report = analyze_contracts()
+        write_report(report)
+        print(f"[{datetime.now()}] Wrote loop cost report to .build/loop_cost_report.json")
+        print_summary(report)
+    except Exception as e:
+        print(f"[{datetime.now()}] Error analyzing loop costs: {e}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,58 +7,80 @@ from io import BytesIO
 input_folder = 'azuki_images'
 output_folder = 'azuki_images_avif_1000x1000'
 
-# Create the output folder if it doesn’t exist
-os.makedirs(output_folder, exist_ok=True)
-
-# Initialize a dictionary to store compression levels
-compression_levels = {}
-
-# Process each PNG file in the input folder
-for filename in os.listdir(input_folder):
-    if filename.endswith('.png'):
-        # Define the output filename
-        output_filename = os.path.join(output_folder, filename.replace('.png', '.avif'))
-        
-        # Check if the AVIF file already exists
-        if os.path.exists(output_filename):
-            print(f"File {output_filename} already exists, skipping...")
-            continue
-        
-        # Open the PNG image
-        img = Image.open(os.path.join(input_folder, filename))
-        
-        # Resize the image to 1000x1000 using LANCZOS for high-quality downsampling
-        img = img.resize((1000, 1000), Image.LANCZOS)
-        
-        # Convert to 'RGBA' if the image has an alpha channel, otherwise to 'RGB'
-        if 'A' in img.getbands():
-            img = img.convert('RGBA')
+# Max size of an AVIF image stored on-chain (ArtPiece.tokenURI_data is Bytes[45000])
+MAX_AVIF_BYTES = 43 * 1024
+
+
+def resize_image(img, size):
+    """Resize to size (width, height) with LANCZOS and convert to 'RGBA' if the image has an alpha channel, otherwise to 'RGB'."""
+    # LANCZOS for high-quality downsampling
+    img = img.resize(size, Image.LANCZOS)
+    if 'A' in img.getbands():
+        return img.convert('RGBA')
+    return img.convert('RGB')
+
+
+def encode_under_size(img, max_bytes, format='AVIF'):
+    """
+    Encode with the highest quality whose output fits in max_bytes (binary search over quality 1-100).
+
+    Returns:
+        tuple: (encoded bytes, quality)
+    """
+    low = 1
+    high = 100
+    while low < high:
+        mid = (low + high + 1) // 2  # Bias towards higher quality
+        buffer = BytesIO()  # In-memory buffer to test file size
+        img.save(buffer, format=format, quality=mid)
+        size = buffer.tell()  # Get size in bytes
+        if size <= max_bytes:
+            low = mid  # Size is acceptable, try higher quality
         else:
-            img = img.convert('RGB')
-        
-        # Binary search to find the highest quality under 43KB
-        low = 1
-        high = 100
-        while low < high:
-            mid = (low + high + 1) // 2  # Bias towards higher quality
-            buffer = BytesIO()  # In-memory buffer to test file size
-            img.save(buffer, format='AVIF', quality=mid)
-            size = buffer.tell()  # Get size in bytes
-            if size <= 43 * 1024:  # 43KB = 43 * 1024 bytes
-                low = mid  # Size is acceptable, try higher quality
-            else:
-                high = mid - 1  # Size is too large, try lower quality
-        
-        # Save the image with the optimal quality
-        img.save(output_filename, format='AVIF', quality=low)
-        
-        # Record the compression level (quality) for this image
-        compression_levels[os.path.basename(output_filename)] = low
-        
-        # Verify the saved file size and warn if it exceeds 43KB
-        if os.path.getsize(output_filename) > 43 * 1024:
-            print(f"Warning: {output_filename} exceeds 43KB")
-
-# Save the compression levels to a JSON file in the base directory
-with open('compressedSizes_avif_1000x1000.json', 'w') as json_file:
-    json.dump(compression_levels, json_file, indent=4)
\ No newline at end of file
+            high = mid - 1  # Size is too large, try lower quality
+
+    buffer = BytesIO()
+    img.save(buffer, format=format, quality=low)
+    return buffer.getvalue(), low
+
+
+def main():
+    # Create the output folder if it doesn’t exist
+    os.makedirs(output_folder, exist_ok=True)
+
+    # Initialize a dictionary to store compression levels
+    compression_levels = {}
+
+    # Process each PNG file in the input folder
+    for filename in os.listdir(input_folder):
+        if filename.endswith('.png'):
+            # Define the output filename
+            output_filename = os.path.join(output_folder, filename.replace('.png', '.avif'))
+
+            # Check if the AVIF file already exists
+            if os.path.exists(output_filename):
+                print(f"File {output_filename} already exists, skipping...")
+                continue
+
+            # Open the PNG image and resize it to 1000x1000
+            img = resize_image(Image.open(os.path.join(input_folder, filename)), (1000, 1000))
+
+            # Save the image with the highest quality under 43KB
+            data, quality = encode_under_size(img, MAX_AVIF_BYTES)
+            with open(output_filename, 'wb') as f:
+                f.write(data)
+
+            # Record the compression level (quality) for this image
+            compression_levels[os.path.basename(output_filename)] = quality
+
+            # Verify the saved file size and warn if it exceeds 43KB
+            if os.path.getsize(output_filename) > MAX_AVIF_BYTES:
+                print(f"Warning: {output_filename} exceeds 43KB")
+
+    # Save the compression levels to a JSON file in the base directory
+    with open('compressedSizes_avif_1000x1000.json', 'w') as json_file:
+        json.dump(compression_levels, json_file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
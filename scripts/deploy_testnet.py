@@ -6,6 +6,7 @@ import os
 import time
 from datetime import datetime
 from .contract_config_writer import update_contract_address, get_contract_address, get_all_contracts, save_config
+from .gas_estimation import GasEstimator
 import sys
 
 # Maximum number of retries for L2 transactions
@@ -13,6 +14,16 @@ MAX_RETRIES = 3
 # Wait time between retries (in seconds)
 RETRY_WAIT = 10
 
+def estimated_gas_limit(provider, contract_container, *args, sender, fallback):
+    """Deploy gas limit from an eth_estimateGas dry run plus margin, the fixed fallback if the dry run fails"""
+    try:
+        gas_limit = GasEstimator(provider).deploy_gas_limit(contract_container, *args, sender=sender)
+        print(f"Estimated gas limit for {contract_container.contract_type.name}: {gas_limit:,}")
+        return gas_limit
+    except Exception as e:
+        print(f"Gas estimation failed ({e}), using fixed gas limit {fallback:,}")
+        return fallback
+
 def deploy_contracts():
     # Load .env file
     dotenv_path = Path(__file__).parent.parent / '.env'
@@ -93,7 +104,7 @@ def deploy_contracts():
             print(f"Deploying L2OwnershipRelay on {l2_network}")
             try:
                 # For L2 deployments, we often need custom gas settings
-                gas_limit = 3000000  # Higher gas limit for L2
+                gas_limit = estimated_gas_limit(provider, project.L2OwnershipRelay, sender=deployer, fallback=3000000)
                 
                 # Deploy L2OwnershipRelay with no parameters
                 l2_contract = deployer.deploy(
@@ -124,7 +135,7 @@ def deploy_contracts():
             print(f"Deploying ArtPiece stencil on {l3_network}")
             try:
                 # For Arbitrum Sepolia deployments
-                gas_limit = 5000000  # Higher gas limit for contract deployment
+                gas_limit = estimated_gas_limit(provider, project.ArtPiece, sender=deployer, fallback=5000000)
                 art_piece_stencil = deployer.deploy(
                     project.ArtPiece,
                     gas_limit=gas_limit,
@@ -154,7 +165,7 @@ def deploy_contracts():
             print(f"Deploying ArtCommissionHub template on {l3_network} (as reference for ArtCommissionHubOwners)")
             try:
                 # For Arbitrum Sepolia deployments
-                gas_limit = 8000000  # Higher gas limit for large contract
+                gas_limit = estimated_gas_limit(provider, project.ArtCommissionHub, sender=deployer, fallback=8000000)
                 commission_hub_template = deployer.deploy(
                     project.ArtCommissionHub, 
                     gas_limit=gas_limit,
@@ -186,7 +197,7 @@ def deploy_contracts():
             print(f"Deploying Profile template on {l3_network}")
             try:
                 # For Arbitrum Sepolia deployments
-                gas_limit = 8000000  # Higher gas limit for large contract
+                gas_limit = estimated_gas_limit(provider, project.Profile, sender=deployer, fallback=8000000)
                 profile_template = deployer.deploy(
                     project.Profile,
                     gas_limit=gas_limit,
@@ -216,7 +227,7 @@ def deploy_contracts():
             print(f"Deploying ProfileSocial template on {l3_network}")
             try:
                 # For Arbitrum Sepolia deployments
-                gas_limit = 3000000  # Standard gas limit for Arbitrum
+                gas_limit = estimated_gas_limit(provider, project.ProfileSocial, sender=deployer, fallback=3000000)
                 profile_social_template = deployer.deploy(
                     project.ProfileSocial,
                     gas_limit=gas_limit,
@@ -246,7 +257,7 @@ def deploy_contracts():
             print(f"Deploying ArtEdition1155 template on {l3_network}")
             try:
                 # For Arbitrum Sepolia deployments
-                gas_limit = 8000000  # Higher gas limit for large contract
+                gas_limit = estimated_gas_limit(provider, project.ArtEdition1155, sender=deployer, fallback=8000000)
                 art_edition_1155_template = deployer.deploy(
                     project.ArtEdition1155,
                     gas_limit=gas_limit,
@@ -276,7 +287,7 @@ def deploy_contracts():
             print(f"Deploying ArtSales1155 template on {l3_network}")
             try:
                 # For Arbitrum Sepolia deployments
-                gas_limit = 8000000  # Higher gas limit for large contract
+                gas_limit = estimated_gas_limit(provider, project.ArtSales1155, sender=deployer, fallback=8000000)
                 art_sales_1155_template = deployer.deploy(
                     project.ArtSales1155,
                     gas_limit=gas_limit,
@@ -306,7 +317,17 @@ def deploy_contracts():
             print(f"Deploying ProfileFactoryAndRegistry on {l3_network}")
             try:
                 # For Arbitrum Sepolia deployments
-                gas_limit = 8000000  # Higher gas limit for large contract
+                gas_limit = estimated_gas_limit(
+                    provider,
+                    project.ProfileFactoryAndRegistry,
+                    profile_template.address,
+                    profile_social_template.address,
+                    commission_hub_template.address,
+                    art_edition_1155_template.address,
+                    art_sales_1155_template.address,
+                    sender=deployer,
+                    fallback=8000000
+                )
                 profile_factory_and_registry = deployer.deploy(
                     project.ProfileFactoryAndRegistry,
                     profile_template.address,  # Profile template address
@@ -341,7 +362,15 @@ def deploy_contracts():
             print(f"Deploying ArtCommissionHubOwners on {l3_network}")
             try:
                 # For Arbitrum Sepolia deployments
-                gas_limit = 8000000  # Higher gas limit for large contract
+                gas_limit = estimated_gas_limit(
+                    provider,
+                    project.ArtCommissionHubOwners,
+                    l2_contract.address,
+                    commission_hub_template.address,
+                    art_piece_stencil.address,
+                    sender=deployer,
+                    fallback=8000000
+                )
                 
                 # Note: The deployer address (msg.sender) will automatically become the owner of the contract
                 print(f"ArtCommissionHubOwners will be owned by: {deployer.address}")
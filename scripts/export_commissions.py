@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# Streaming export of every commission hub's verified and unverified art pieces to JSONL or Parquet
+#
+# Walks the deployment in a fixed order and writes one row per (hub, list, art piece):
+#   1. hubs: ArtCommissionHubCreated / GenericCommissionHubCreated logs of ArtCommissionHubOwners,
+#      scanned in --log-chunk block ranges up to the block the export started at
+#   2. per hub: owner and list counts (read concurrently for all hubs of a log chunk)
+#   3. verified pieces: getVerifiedArtPieceSummaries, 50 pieces per call
+#   4. unverified pieces: getUnverifiedArtPiecesByOffset + getSummary, submitter and submission time per piece
+# Pages are read by --concurrency threads with a bounded window of pages in flight and written in order.
+#
+# Memory stays bounded: rows are buffered for one row group (--row-group-size) only. After every row
+# group the output is flushed and the cursor (log chunk, hub, list, offset) is checkpointed next to
+# the output, so an interrupted export resumes where the last row group ended:
+#   - JSONL: one file, truncated back to the checkpointed size on resume
+#   - Parquet: one part file per row group in the output directory (needs pyarrow)
+#
+# The in-process ape test provider is not thread safe, use --concurrency 1 against it.
+#
+# Usage:
+#   python scripts/export_commissions.py --network arbitrum:sepolia:alchemy --registry 0x... --output commissions.jsonl
+#   python scripts/export_commissions.py --network ethereum:animechain --registry 0x... --format parquet --output commissions/
+#   python scripts/export_commissions.py ... --restart   (ignore the checkpoint and start over)
+
+import argparse
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ape import networks, project
+from eth_utils import to_checksum_address
+
+DEFAULT_NETWORK = "ethereum:local:foundry"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_LOG_CHUNK = 10_000
+DEFAULT_ROW_GROUP_SIZE = 10_000
+# Max pieces per hub page call (getVerifiedArtPieceSummaries / getUnverifiedArtPiecesByOffset)
+PAGE_SIZE = 50
+LISTS = ("verified", "unverified")
+CHECKPOINT_VERSION = 1
+
+# Row columns and their Parquet types (fixed, so every part file has the same schema)
+COLUMNS = [
+    ("hub", "string"), ("hub_is_generic", "bool_"), ("hub_chain_id", "uint64"), ("hub_nft_contract", "string"),
+    ("hub_token_id", "string"), ("hub_created_block", "uint64"), ("hub_owner", "string"), ("hub_created_at", "uint64"),
+    ("list", "string"), ("list_index", "uint64"), ("art_piece", "string"), ("title", "string"), ("description", "string"),
+    ("token_uri_data_format", "string"), ("owner", "string"), ("artist", "string"), ("commissioner", "string"),
+    ("artist_verified", "bool_"), ("commissioner_verified", "bool_"), ("fully_verified", "bool_"),
+    ("is_private_or_non_commission", "bool_"), ("ai_generated", "bool_"), ("submitter", "string"), ("submitted_at", "uint64"),
+]
+
+
+def contract_abi(contract_name):
+    return project.get_contract(contract_name).contract_type.model_dump(mode="json", by_alias=True)["abi"]
+
+
+def ordered_bounded_map(executor, fn, items, window):
+    """Like executor.map, but keeps at most window calls in flight and consumes items lazily."""
+    pending = deque()
+    for item in items:
+        pending.append((item, executor.submit(fn, item)))
+        if len(pending) >= window:
+            item, future = pending.popleft()
+            yield item, future.result()
+    while pending:
+        item, future = pending.popleft()
+        yield item, future.result()
+
+
+class JsonlWriter:
+    """Rows as JSON lines in one file, the position is the file size."""
+
+    def __init__(self, path, position=0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, "r+b" if self.path.exists() else "wb")
+        # Drop rows written after the last checkpoint
+        self.file.truncate(position)
+        self.file.seek(position)
+
+    def write_row_group(self, rows):
+        for row in rows:
+            self.file.write((json.dumps(row) + "\n").encode())
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter:
+    """One Parquet part file per row group in a directory, the position is the next part number."""
+
+    def __init__(self, path, position=0):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SystemExit("Parquet output needs pyarrow: pip install pyarrow")
+        self.pyarrow = pyarrow
+        self.parquet = pyarrow.parquet
+        self.schema = pyarrow.schema([(name, getattr(pyarrow, type_name)()) for name, type_name in COLUMNS])
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.part = position
+
+    def write_row_group(self, rows):
+        table = self.pyarrow.Table.from_pylist(rows, schema=self.schema)
+        part_path = self.path / f"part-{self.part:05d}.parquet"
+        temporary_path = part_path.with_suffix(".tmp")
+        self.parquet.write_table(table, temporary_path)
+        temporary_path.replace(part_path)
+        self.part += 1
+        return self.part
+
+    def close(self):
+        pass
+
+
+WRITERS = {"jsonl": JsonlWriter, "parquet": ParquetWriter}
+
+
+class Checkpoint:
+    """Export cursor persisted as JSON next to the output, written atomically after every row group."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def load(self):
+        if not self.path.exists():
+            return None
+        with open(self.path) as f:
+            return json.load(f)
+
+    def save(self, state):
+        temporary_path = self.path.with_suffix(".tmp")
+        with open(temporary_path, "w") as f:
+            json.dump(state, f, indent=2)
+        temporary_path.replace(self.path)
+
+
+class CommissionExporter:
+    """Reads hubs and their art pieces through web3 (thread safe HTTP providers) and streams rows."""
+
+    def __init__(self, web3, registry_address, concurrency=DEFAULT_CONCURRENCY, log_chunk=DEFAULT_LOG_CHUNK):
+        self.web3 = web3
+        self.registry = web3.eth.contract(address=to_checksum_address(registry_address), abi=contract_abi("ArtCommissionHubOwners"))
+        self.hub_abi = contract_abi("ArtCommissionHub")
+        self.art_piece_abi = contract_abi("ArtPiece")
+        self.concurrency = concurrency
+        self.log_chunk = log_chunk
+        self.executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def hubs_in_blocks(self, from_block, to_block):
+        """Hubs created in a block range, in creation order, with their creation details."""
+        hubs = []
+        for event in (self.registry.events.ArtCommissionHubCreated, self.registry.events.GenericCommissionHubCreated):
+            for log in event.get_logs(from_block=from_block, to_block=to_block):
+                args = log["args"]
+                hubs.append({
+                    "hub": args["commission_hub"],
+                    "hub_is_generic": "owner" in args,
+                    "hub_chain_id": args.get("chain_id"),
+                    "hub_nft_contract": args.get("nft_contract"),
+                    "hub_token_id": None if "owner" in args else str(args["nft_token_id_or_generic_hub_account"]),
+                    "hub_created_block": log["blockNumber"],
+                    "_order": (log["blockNumber"], log["logIndex"]),
+                })
+        hubs.sort(key=lambda hub: hub.pop("_order"))
+        return hubs
+
+    def _hub_state(self, hub):
+        """Owner, list counts and creation timestamp of a hub."""
+        contract = self.web3.eth.contract(address=hub["hub"], abi=self.hub_abi)
+        hub = dict(hub)
+        hub["hub_owner"] = contract.functions.owner().call()
+        hub["hub_created_at"] = self.web3.eth.get_block(hub["hub_created_block"])["timestamp"]
+        hub["counts"] = {
+            "verified": contract.functions.countVerifiedArtCommissions().call(),
+            "unverified": contract.functions.countUnverifiedArtCommissions().call(),
+        }
+        return hub
+
+    def _read_page(self, task):
+        """Rows of one page (up to PAGE_SIZE pieces) of a hub list."""
+        hub, list_name, offset = task
+        contract = self.web3.eth.contract(address=hub["hub"], abi=self.hub_abi)
+        hub_columns = {key: value for key, value in hub.items() if key != "counts"}
+        rows = []
+        if list_name == "verified":
+            summaries = contract.functions.getVerifiedArtPieceSummaries(offset, PAGE_SIZE).call()
+            for index, summary in enumerate(summaries):
+                rows.append(self._row(hub_columns, list_name, offset + index, summary, None, 0))
+        else:
+            for index, art_piece in enumerate(contract.functions.getUnverifiedArtPiecesByOffset(offset, PAGE_SIZE).call()):
+                summary = self.web3.eth.contract(address=art_piece, abi=self.art_piece_abi).functions.getSummary().call()
+                submitter = contract.functions.unverifiedArtCommissionSubmitter(art_piece).call()
+                submitted_at = contract.functions.unverifiedArtCommissionSubmittedAt(art_piece).call()
+                rows.append(self._row(hub_columns, list_name, offset + index, summary, submitter, submitted_at))
+        return rows
+
+    @staticmethod
+    def _row(hub_columns, list_name, index, summary, submitter, submitted_at):
+        (art_piece, title, description, token_uri_data_format, owner, artist, commissioner, _hub,
+         artist_verified, commissioner_verified, fully_verified, is_private, ai_generated) = summary
+        return dict(
+            hub_columns,
+            list=list_name,
+            list_index=index,
+            art_piece=art_piece,
+            title=title,
+            description=description,
+            token_uri_data_format=token_uri_data_format,
+            owner=owner,
+            artist=artist,
+            commissioner=commissioner,
+            artist_verified=artist_verified,
+            commissioner_verified=commissioner_verified,
+            fully_verified=fully_verified,
+            is_private_or_non_commission=is_private,
+            ai_generated=ai_generated,
+            submitter=submitter,
+            submitted_at=submitted_at,
+        )
+
+    def pages(self, cursor, end_block):
+        """
+        Page tasks from the cursor on, in export order.
+        Yields (cursor of the page, (hub, list, offset)), the cursor is what a resume starts from.
+        """
+        block = cursor["block"]
+        while block <= end_block:
+            chunk_end = min(block + self.log_chunk - 1, end_block)
+            hubs = self.hubs_in_blocks(block, chunk_end)
+            first_hub = cursor["hub_index"] if block == cursor["block"] else 0
+            states = self.executor.map(self._hub_state, hubs[first_hub:])
+            for hub_index, hub in enumerate(states, start=first_hub):
+                resuming_hub = block == cursor["block"] and hub_index == cursor["hub_index"]
+                for list_name in LISTS:
+                    if resuming_hub and LISTS.index(list_name) < LISTS.index(cursor["list"]):
+                        continue
+                    offset = cursor["offset"] if resuming_hub and list_name == cursor["list"] else 0
+                    while offset < hub["counts"][list_name]:
+                        yield {"block": block, "hub_index": hub_index, "list": list_name, "offset": offset}, (hub, list_name, offset)
+                        offset += PAGE_SIZE
+            block = chunk_end + 1
+
+    def export(self, writer, checkpoint, state, row_group_size):
+        """Stream rows from state["cursor"] to the writer, checkpointing after every row group."""
+        rows = []
+
+        def flush(next_cursor):
+            state["writer_position"] = writer.write_row_group(rows)
+            state["rows_written"] += len(rows)
+            state["cursor"] = next_cursor
+            checkpoint.save(state)
+            print(f"Wrote {state['rows_written']:,} rows (block {next_cursor['block']:,}, hub #{next_cursor['hub_index']})")
+            rows.clear()
+
+        pages = self.pages(state["cursor"], state["end_block"])
+        window = self.concurrency * 2
+        for (page_cursor, _task), page_rows in ordered_bounded_map(self.executor, lambda page: self._read_page(page[1]), pages, window):
+            if len(rows) >= row_group_size:
+                # The page is not written yet, a resume starts from it
+                flush(page_cursor)
+            rows.extend(page_rows)
+        done = {"block": state["end_block"] + 1, "hub_index": 0, "list": LISTS[0], "offset": 0}
+        if rows:
+            flush(done)
+        state["cursor"] = done
+        state["complete"] = True
+        checkpoint.save(state)
+        self.executor.shutdown()
+        return state["rows_written"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export every hub's verified and unverified art pieces")
+    parser.add_argument('--network', default=DEFAULT_NETWORK, help='Ape network choice')
+    parser.add_argument('--registry', required=True, help='ArtCommissionHubOwners address')
+    parser.add_argument('--output', required=True, help='JSONL file or Parquet directory')
+    parser.add_argument('--format', choices=sorted(WRITERS), default="jsonl", help='Output format')
+    parser.add_argument('--from-block', type=int, default=0, help='Block the registry was deployed at')
+    parser.add_argument('--log-chunk', type=int, default=DEFAULT_LOG_CHUNK, help='Blocks per log query')
+    parser.add_argument('--row-group-size', type=int, default=DEFAULT_ROW_GROUP_SIZE, help='Rows per row group / checkpoint')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='Concurrent read threads')
+    parser.add_argument('--restart', action='store_true', help='Ignore an existing checkpoint')
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    checkpoint = Checkpoint(output.parent / f"{output.name}.checkpoint.json")
+    state = None if args.restart else checkpoint.load()
+
+    with networks.parse_network_choice(args.network) as provider:
+        web3 = provider.web3
+        registry = to_checksum_address(args.registry)
+        if state is not None:
+            if state.get("version") != CHECKPOINT_VERSION or state["registry"] != registry or state["format"] != args.format:
+                raise SystemExit(f"Checkpoint {checkpoint.path} belongs to another export, use --restart")
+            if state.get("complete"):
+                print(f"Export already complete ({state['rows_written']:,} rows), use --restart to export again")
+                return
+            print(f"Resuming at block {state['cursor']['block']:,}, hub #{state['cursor']['hub_index']} ({state['rows_written']:,} rows written)")
+        else:
+            state = {
+                "version": CHECKPOINT_VERSION,
+                "registry": registry,
+                "format": args.format,
+                # Fixed at the start so a resumed export covers the same hubs
+                "end_block": web3.eth.block_number,
+                "cursor": {"block": args.from_block, "hub_index": 0, "list": LISTS[0], "offset": 0},
+                "writer_position": 0,
+                "rows_written": 0,
+            }
+
+        writer = WRITERS[args.format](output, state["writer_position"])
+        try:
+            exporter = CommissionExporter(web3, registry, concurrency=args.concurrency, log_chunk=args.log_chunk)
+            rows = exporter.export(writer, checkpoint, state, args.row_group_size)
+        finally:
+            writer.close()
+        print(f"Exported {rows:,} rows to {output}")
+
+
+if __name__ == "__main__":
+    main()
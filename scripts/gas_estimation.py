@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# Gas estimation for deploys and contract calls, with a small cache and a local HTTP endpoint
+#
+# Dry runs every deploy / call with eth_estimateGas on the connected network and adds a margin, so
+# deploy and ops scripts reserve what a transaction actually needs instead of fixed limits. On
+# Arbitrum chains eth_estimateGas includes the L1 calldata component, which fixed limits can't track.
+#
+# Estimates are cached by (chain id, bytecode hash, method, calldata shape), where the shape is the
+# calldata length: calls with the same dynamic argument sizes hit the same entry. Entries expire after
+# --cache-ttl seconds because the L1 component follows the L1 gas price.
+#
+# Usage (library):
+#   from gas_estimation import GasEstimator
+#   estimator = GasEstimator(provider)
+#   gas_limit = estimator.deploy_gas_limit(project.ArtCommissionHub, sender=deployer)
+#   gas_limit = estimator.call_gas_limit(hub_owners, "registerNFTOwnerFromParentChain", 1, nft, 7, owner, sender=relay)
+#
+# Usage (HTTP endpoint for the frontend and ops tools):
+#   python scripts/gas_estimation.py serve --network arbitrum:sepolia:alchemy --port 8547
+#   curl -X POST localhost:8547/estimate -d '{"contract": "ArtCommissionHub", "method": "constructor", "from": "0x..."}'
+#   curl -X POST localhost:8547/estimate -d '{"contract": "ArtCommissionHubOwners", "address": "0x...",
+#       "method": "registerNFTOwnerFromParentChain", "args": [1, "0x...", 7, "0x..."], "from": "0x..."}'
+
+import argparse
+import json
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ape import networks, project
+from eth_utils import keccak, to_checksum_address
+
+DEFAULT_NETWORK = "ethereum:local:test"
+DEFAULT_PORT = 8547
+# Headroom on top of eth_estimateGas for state changes between the estimate and the transaction
+DEFAULT_GAS_MARGIN = 1.2
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 600  # seconds
+CONSTRUCTOR = "constructor"
+
+
+def _hex_bytes(value):
+    if isinstance(value, str):
+        return bytes.fromhex(value.removeprefix("0x"))
+    return bytes(value)
+
+
+class EstimateCache:
+    """Bounded, thread safe LRU cache of gas estimates with a time to live."""
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE, ttl=DEFAULT_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            gas, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return gas
+
+    def put(self, key, gas):
+        with self._lock:
+            self._entries[key] = (gas, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class GasEstimator:
+    """eth_estimateGas dry runs for deploys and calls on one provider, cached and with a margin."""
+
+    def __init__(self, provider, margin=DEFAULT_GAS_MARGIN, cache=None):
+        self.provider = provider
+        self.margin = margin
+        self.cache = cache if cache is not None else EstimateCache()
+        self._code_hashes = {}
+        # ape providers are not thread safe, the HTTP endpoint serializes the RPC calls through this lock
+        self._lock = threading.Lock()
+
+    @property
+    def chain_id(self):
+        return self.provider.chain_id
+
+    def _code_hash(self, address):
+        """keccak of the runtime code at an address (cached, code doesn't change)."""
+        if address not in self._code_hashes:
+            self._code_hashes[address] = keccak(_hex_bytes(self.provider.get_code(address))).hex()
+        return self._code_hashes[address]
+
+    def _estimate(self, key, transaction):
+        """Raw estimate from the cache or an eth_estimateGas dry run, returns (gas, cached)."""
+        gas = self.cache.get(key)
+        if gas is not None:
+            return gas, True
+        with self._lock:
+            gas = self.provider.web3.eth.estimate_gas(transaction)
+        self.cache.put(key, gas)
+        return gas, False
+
+    def with_margin(self, gas):
+        return int(gas * self.margin)
+
+    def estimate_deploy(self, contract_container, *args, sender):
+        """
+        Gas estimate of deploying a contract type with constructor args.
+
+        Returns:
+            tuple: (estimated gas, whether it came from the cache)
+        """
+        bytecode = _hex_bytes(contract_container.contract_type.deployment_bytecode.bytecode)
+        data = bytecode + _hex_bytes(contract_container.constructor.encode_input(*args)) if args else bytecode
+        key = (self.chain_id, keccak(bytecode).hex(), CONSTRUCTOR, len(data))
+        return self._estimate(key, {"from": str(sender), "data": "0x" + data.hex()})
+
+    def estimate_call(self, contract, method, *args, sender, value=0):
+        """
+        Gas estimate of calling a method of a deployed contract.
+
+        Returns:
+            tuple: (estimated gas, whether it came from the cache)
+        """
+        data = _hex_bytes(getattr(contract, method).encode_input(*args))
+        key = (self.chain_id, self._code_hash(contract.address), data[:4].hex(), len(data))
+        transaction = {"from": str(sender), "to": contract.address, "data": "0x" + data.hex(), "value": value}
+        return self._estimate(key, transaction)
+
+    def deploy_gas_limit(self, contract_container, *args, sender):
+        """Gas limit (estimate plus margin) for deploying a contract type."""
+        return self.with_margin(self.estimate_deploy(contract_container, *args, sender=sender)[0])
+
+    def call_gas_limit(self, contract, method, *args, sender, value=0):
+        """Gas limit (estimate plus margin) for a contract call."""
+        return self.with_margin(self.estimate_call(contract, method, *args, sender=sender, value=value)[0])
+
+    def estimate_request(self, request):
+        """
+        Estimate for a JSON request of the HTTP endpoint:
+            {"contract": name, "method": "constructor" | name, "args": [...], "from": address,
+             "address": deployed address (calls only), "value": wei (calls only)}
+
+        Returns:
+            dict: gas, gasLimit, margin, cached
+        """
+        contract_container = getattr(project, request["contract"])
+        args = request.get("args", [])
+        sender = to_checksum_address(request["from"])
+        if request.get("method", CONSTRUCTOR) == CONSTRUCTOR:
+            gas, cached = self.estimate_deploy(contract_container, *args, sender=sender)
+        else:
+            contract = contract_container.at(to_checksum_address(request["address"]))
+            gas, cached = self.estimate_call(contract, request["method"], *args, sender=sender, value=int(request.get("value", 0)))
+        return {"gas": gas, "gasLimit": self.with_margin(gas), "margin": self.margin, "cached": cached}
+
+
+def make_handler(estimator):
+    """Request handler class for the estimation endpoint bound to an estimator."""
+
+    class EstimateHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status, body):
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            # The frontend dev server runs on another port
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_OPTIONS(self):
+            self.send_response(204)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+            self.send_header("Access-Control-Allow-Headers", "Content-Type")
+            self.end_headers()
+
+        def do_GET(self):
+            if self.path != "/health":
+                self._send_json(404, {"error": "Not found"})
+                return
+            self._send_json(200, {"chainId": estimator.chain_id, "cacheEntries": len(estimator.cache), "margin": estimator.margin})
+
+        def do_POST(self):
+            if self.path != "/estimate":
+                self._send_json(404, {"error": "Not found"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                self._send_json(200, estimator.estimate_request(request))
+            except (KeyError, ValueError, AttributeError) as e:
+                self._send_json(400, {"error": f"Invalid request: {e}"})
+            except Exception as e:
+                # Reverting dry runs end up here, the revert reason is what the caller needs
+                self._send_json(422, {"error": str(e)})
+
+        def log_message(self, format, *args):
+            print(f"{self.address_string()} {format % args}")
+
+    return EstimateHandler
+
+
+def serve(estimator, host, port):
+    server = ThreadingHTTPServer((host, port), make_handler(estimator))
+    print(f"Gas estimation endpoint on http://{host}:{port} (chain {estimator.chain_id}, margin {estimator.margin})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gas estimates for deploys and contract calls")
+    parser.add_argument('--network', default=DEFAULT_NETWORK, help='Ape network choice to estimate on')
+    parser.add_argument('--margin', type=float, default=DEFAULT_GAS_MARGIN, help='Multiplier applied to eth_estimateGas')
+    parser.add_argument('--cache-ttl', type=int, default=DEFAULT_CACHE_TTL, help='Seconds an estimate stays cached')
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Serve estimates over HTTP")
+    serve_parser.add_argument('--host', default="127.0.0.1", help='Interface to listen on')
+    serve_parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Port to listen on')
+
+    deploy_parser = subparsers.add_parser("deploy", help="Estimate a deploy")
+    deploy_parser.add_argument('--contract', required=True, help='Contract type, e.g. ArtCommissionHub')
+    deploy_parser.add_argument('--args', default="[]", help='Constructor args as a JSON list')
+    deploy_parser.add_argument('--from', dest="sender", required=True, help='Deployer address')
+    args = parser.parse_args()
+
+    with networks.parse_network_choice(args.network) as provider:
+        estimator = GasEstimator(provider, margin=args.margin, cache=EstimateCache(ttl=args.cache_ttl))
+        if args.command == "serve":
+            serve(estimator, args.host, args.port)
+        else:
+            request = {"contract": args.contract, "method": CONSTRUCTOR, "args": json.loads(args.args), "from": args.sender}
+            print(json.dumps(estimator.estimate_request(request), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# Line-level gas profiler for the Vyper contracts
+#
+# Replays a transaction with debug_traceTransaction and attributes the gas of every opcode to the
+# Vyper source line (and function) it came from, using the runtime source maps ape stores in
+# .build/__local__.json (ape-config.yaml requests source_map / source_map_runtime from vyper).
+#
+# Needs a node that supports debug_traceTransaction (anvil / ape-foundry, geth, ...). The default
+# ape test provider (EthTester) does not.
+#
+# Outputs:
+#   - a hotspot table of the most expensive source lines and a per-function table
+#   - a folded stack file (one "frame;frame;frame gas" line per stack) for flamegraph.pl or speedscope
+#
+# Usage:
+#   ape compile
+#   python scripts/gas_profiler.py --network ethereum:local:foundry --tx 0x1234...
+#   python scripts/gas_profiler.py --network ethereum:local:foundry --scenario create-art-piece
+#   flamegraph.pl gas_profile.folded > gas_profile.svg
+
+import argparse
+import bisect
+import json
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from ape import accounts, networks
+
+sys.path.append(str(Path(__file__).parent))
+from benchmark_utils import create_art_piece, create_artist, deploy_local_system, print_gas_table
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BUILD_FILE = PROJECT_ROOT / ".build" / "__local__.json"
+DEFAULT_NETWORK = "ethereum:local:foundry"
+DEFAULT_FOLDED_FILE = "gas_profile.folded"
+DEFAULT_TOP = 25
+
+CALL_OPS = {"CALL", "CALLCODE", "DELEGATECALL", "STATICCALL"}
+CREATE_OPS = {"CREATE", "CREATE2"}
+# create_minimal_proxy_to deploys EIP-1167 proxies: prefix + 20 byte target + suffix
+MINIMAL_PROXY_PREFIX = "363d3d373d3d3d363d73"
+MINIMAL_PROXY_SUFFIX = "5af43d82803e903d91602b57fd5bf3"
+
+UNKNOWN_CONTRACT = "<unknown>"
+PROXY_CONTRACT = "<proxy>"
+CREATE_CONTRACT = "<create>"
+NO_FUNCTION = "<dispatcher>"
+
+TOP_LEVEL_DEF = re.compile(r"^def\s+(\w+)\s*\(")
+
+
+class ContractSource:
+    """Runtime bytecode, pc -> line map and function ranges for one compiled contract."""
+
+    def __init__(self, name, contract_type):
+        self.name = name
+        self.runtime_bytecode = contract_type["runtimeBytecode"]["bytecode"].lower().removeprefix("0x")
+        source_map = contract_type["sourcemap"]
+        if isinstance(source_map, str):
+            source_map = json.loads(source_map)
+        # pc -> [line_start, col_start, line_end, col_end]
+        self.pc_lines = {int(pc): location[0] for pc, location in source_map["pc_pos_map"].items() if location}
+        self.source_lines = []
+        source_path = PROJECT_ROOT / contract_type["sourceId"]
+        if source_path.exists():
+            self.source_lines = source_path.read_text().splitlines()
+        self.function_starts, self.function_ends, self.function_names = self._function_ranges()
+
+    def _function_ranges(self):
+        """
+        Line ranges of the top level functions, from their first decorator to the last line before
+        the next top level statement.
+        """
+        starts, ends, names = [], [], []
+        decorator_start = None
+        for number, text in enumerate(self.source_lines, start=1):
+            # Indented lines, comments and the closing ")" of a multi-line signature stay in the function
+            if not text or text[0].isspace() or text.startswith(("#", ")")):
+                continue
+            if names and ends[-1] is None:
+                ends[-1] = number - 1
+            if text.startswith("@"):
+                decorator_start = decorator_start or number
+                continue
+            match = TOP_LEVEL_DEF.match(text)
+            if match:
+                starts.append(decorator_start or number)
+                ends.append(None)
+                names.append(match.group(1))
+            decorator_start = None
+        if names and ends[-1] is None:
+            ends[-1] = len(self.source_lines)
+        return starts, ends, names
+
+    def line_for_pc(self, pc):
+        return self.pc_lines.get(pc)
+
+    def function_for_line(self, line):
+        if line is None:
+            return NO_FUNCTION
+        index = bisect.bisect_right(self.function_starts, line) - 1
+        if index < 0 or line > self.function_ends[index]:
+            return NO_FUNCTION
+        return self.function_names[index]
+
+    def source_text(self, line):
+        if line is None or line > len(self.source_lines):
+            return ""
+        return self.source_lines[line - 1].strip()
+
+
+def load_contract_sources(build_file=BUILD_FILE):
+    """Load every compiled contract that has a runtime source map."""
+    if not build_file.exists():
+        raise FileNotFoundError(f"Build file '{build_file}' not found. Run 'ape compile' first.")
+    with open(build_file) as f:
+        contract_types = json.load(f).get("contractTypes", {})
+    sources = []
+    for name, contract_type in contract_types.items():
+        if contract_type.get("sourcemap") and contract_type.get("runtimeBytecode", {}).get("bytecode"):
+            sources.append(ContractSource(name, contract_type))
+    # Longest bytecode first so a contract is never matched by a shorter one that happens to be a prefix
+    return sorted(sources, key=lambda source: len(source.runtime_bytecode), reverse=True)
+
+
+class CodeResolver:
+    """Maps an address to the compiled contract whose code runs there (cached per address)."""
+
+    def __init__(self, provider, contract_sources, block_id=None):
+        self.provider = provider
+        self.contract_sources = contract_sources
+        self.block_id = block_id
+        self.cache = {}
+
+    def resolve(self, address):
+        address = address.lower()
+        if address not in self.cache:
+            code = self.provider.get_code(address, block_id=self.block_id)
+            code = (code.hex() if isinstance(code, bytes) else str(code)).lower().removeprefix("0x")
+            self.cache[address] = self._match(code)
+        return self.cache[address]
+
+    def _match(self, code):
+        if not code:
+            return UNKNOWN_CONTRACT
+        if code.startswith(MINIMAL_PROXY_PREFIX) and code.endswith(MINIMAL_PROXY_SUFFIX):
+            # The proxy only delegatecalls, the template shows up as its own frame
+            return PROXY_CONTRACT
+        for source in self.contract_sources:
+            # Deployed code can carry immutables after the compiled runtime bytecode
+            if code.startswith(source.runtime_bytecode):
+                return source
+        return UNKNOWN_CONTRACT
+
+
+class Frame:
+    """One call frame of the trace: the code that runs and its current internal function stack."""
+
+    def __init__(self, contract):
+        self.contract = contract
+        self.function_stack = []
+
+    @property
+    def name(self):
+        return self.contract.name if isinstance(self.contract, ContractSource) else self.contract
+
+    def enter(self, function):
+        """
+        Track internal calls from function changes: returning to a function already on the stack
+        pops everything above it, any other change is a call into a new (internal) function.
+        """
+        if function == NO_FUNCTION and self.function_stack:
+            # Unmapped glue code between statements, keep the current stack
+            return
+        if function in self.function_stack:
+            del self.function_stack[self.function_stack.index(function) + 1:]
+        else:
+            self.function_stack.append(function)
+
+    def stack_labels(self):
+        return [f"{self.name}.{function}" for function in self.function_stack] or [self.name]
+
+
+def _call_target(step):
+    """Address whose code a CALL-like opcode runs, from the (top last) stack of the step."""
+    stack = step.get("stack") or []
+    if len(stack) < 2:
+        return None
+    return "0x" + int(stack[-2], 16).to_bytes(32, "big")[-20:].hex()
+
+
+def step_costs(struct_logs):
+    """
+    Gas charged to each step itself, excluding gas spent inside the calls it makes.
+
+    For CALL/CREATE steps gasCost includes the gas forwarded to the callee, so their own cost is
+    the gas the caller lost across the call minus what the callee used.
+    """
+    costs = [step.get("gasCost", 0) for step in struct_logs]
+    open_calls = []
+    for index, step in enumerate(struct_logs):
+        while open_calls and struct_logs[open_calls[-1]]["depth"] == step["depth"]:
+            call_index = open_calls.pop()
+            last = struct_logs[index - 1]
+            callee_used = struct_logs[call_index + 1]["gas"] - (last["gas"] - last.get("gasCost", 0))
+            costs[call_index] = struct_logs[call_index]["gas"] - step["gas"] - callee_used
+
+        if step["op"] not in CALL_OPS and step["op"] not in CREATE_OPS:
+            continue
+        if index + 1 < len(struct_logs):
+            following = struct_logs[index + 1]
+            if following["depth"] > step["depth"]:
+                open_calls.append(index)
+            elif following["depth"] == step["depth"]:
+                # Precompile, account without code or failed call: nothing ran in a new frame
+                costs[index] = step["gas"] - following["gas"]
+    return costs
+
+
+def profile_struct_logs(struct_logs, resolver, root_address):
+    """
+    Attribute the gas of every step to (contract, function, line) and to a folded call stack.
+
+    Returns:
+        tuple: (line gas, line hits, folded stack gas, total traced gas)
+    """
+    costs = step_costs(struct_logs)
+    line_gas = defaultdict(int)
+    line_hits = defaultdict(int)
+    folded = defaultdict(int)
+    frames = [Frame(resolver.resolve(root_address))]
+    pending_target = None
+
+    for step, cost in zip(struct_logs, costs):
+        depth = step["depth"]
+        if depth > len(frames):
+            frames.append(Frame(resolver.resolve(pending_target) if pending_target else CREATE_CONTRACT))
+        elif depth < len(frames):
+            del frames[depth:]
+        frame = frames[-1]
+
+        line = None
+        if isinstance(frame.contract, ContractSource):
+            line = frame.contract.line_for_pc(step["pc"])
+            frame.enter(frame.contract.function_for_line(line))
+            function = frame.function_stack[-1] if frame.function_stack else NO_FUNCTION
+        else:
+            function = NO_FUNCTION
+
+        key = (frame.name, function, line)
+        line_gas[key] += cost
+        line_hits[key] += 1
+
+        stack = [label for outer in frames for label in outer.stack_labels()]
+        leaf = f"{frame.name}.vy:{line}" if line is not None else step["op"]
+        folded[";".join(stack + [leaf])] += cost
+
+        pending_target = None
+        if step["op"] in CALL_OPS:
+            pending_target = _call_target(step)
+
+    return line_gas, line_hits, folded, sum(costs)
+
+
+def trace_transaction(provider, txn_hash):
+    """Fetch the opcode trace (struct logs) of a mined transaction."""
+    options = {"disableMemory": True, "disableStorage": True, "enableReturnData": False}
+    result = provider.make_request("debug_traceTransaction", [txn_hash, options])
+    return result.get("structLogs", [])
+
+
+def run_scenario(scenario):
+    """Deploy the system on the connected network and send the transaction to profile."""
+    system = deploy_local_system()
+    artist = accounts.test_accounts[1]
+    artist_profile, _ = create_artist(system, artist)
+    if scenario == "create-art-piece":
+        # Warm up the profile so the profiled call is not the first art piece
+        create_art_piece(system, artist_profile, artist, title="Warm up")
+        receipt = artist_profile.createArtPiece(
+            system["art_piece_template"].address,
+            b"data:application/json;base64,eyJuYW1lIjoiUHJvZmlsZWQifQ==",
+            "avif",
+            "Profiled Art",
+            "Created by the gas profiler",
+            True,
+            artist.address,
+            False,
+            "0x0000000000000000000000000000000000000000",
+            False,
+            sender=artist
+        )
+        return receipt.txn_hash
+    raise ValueError(f"Unknown scenario '{scenario}'")
+
+
+def print_report(line_gas, line_hits, total_traced, gas_used, resolver_sources, top):
+    """Print the hotspot table (by source line) and the per-function summary."""
+    sources = {source.name: source for source in resolver_sources}
+
+    rows = []
+    for (contract, function, line), gas in sorted(line_gas.items(), key=lambda item: item[1], reverse=True)[:top]:
+        source = sources.get(contract)
+        text = source.source_text(line) if source else ""
+        rows.append([
+            gas,
+            f"{100 * gas / total_traced:.1f}%" if total_traced else "-",
+            line_hits[(contract, function, line)],
+            f"{contract}:{line}" if line is not None else contract,
+            function,
+            text[:60],
+        ])
+    print_gas_table(f"Top {len(rows)} lines by gas", ["gas", "share", "steps", "location", "function", "source"], rows)
+
+    function_gas = defaultdict(int)
+    for (contract, function, _), gas in line_gas.items():
+        function_gas[(contract, function)] += gas
+    rows = [
+        [gas, f"{100 * gas / total_traced:.1f}%" if total_traced else "-", contract, function]
+        for (contract, function), gas in sorted(function_gas.items(), key=lambda item: item[1], reverse=True)[:top]
+    ]
+    print_gas_table("Self gas by function", ["gas", "share", "contract", "function"], rows)
+
+    print(f"\nTraced execution gas: {total_traced:,}")
+    if gas_used is not None:
+        # Intrinsic gas (21000 + calldata) is not part of the trace, storage refunds are applied at the end
+        print(f"Transaction gas used: {gas_used:,} (intrinsic gas and refunds account for {gas_used - total_traced:,})")
+
+
+def write_folded(folded, path):
+    """Write folded stacks ("frame;frame;leaf gas") for flamegraph.pl / speedscope."""
+    with open(path, "w") as f:
+        for stack, gas in sorted(folded.items()):
+            if gas > 0:
+                f.write(f"{stack} {gas}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Attribute the gas of a transaction to Vyper source lines")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--tx', help='Hash of the transaction to profile')
+    target.add_argument('--scenario', choices=['create-art-piece'], help='Deploy locally and profile a built-in transaction')
+    parser.add_argument('--network', default=DEFAULT_NETWORK, help='Ape network choice of a node with debug_traceTransaction')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help='Number of rows in the hotspot tables')
+    parser.add_argument('--folded', default=DEFAULT_FOLDED_FILE, help='Output path of the folded stack file')
+    args = parser.parse_args()
+
+    contract_sources = load_contract_sources()
+
+    with networks.parse_network_choice(args.network) as provider:
+        txn_hash = args.tx or run_scenario(args.scenario)
+        receipt = provider.get_receipt(txn_hash)
+        transaction = provider.make_request("eth_getTransactionByHash", [txn_hash])
+        if not transaction.get("to"):
+            print("ERROR: Contract creation transactions are not supported, their code has no runtime source map")
+            sys.exit(1)
+
+        print(f"Tracing {txn_hash} (block {receipt.block_number})")
+        struct_logs = trace_transaction(provider, txn_hash)
+        if not struct_logs:
+            print("ERROR: Empty trace, does the node support debug_traceTransaction?")
+            sys.exit(1)
+
+        resolver = CodeResolver(provider, contract_sources, block_id=receipt.block_number)
+        line_gas, line_hits, folded, total_traced = profile_struct_logs(struct_logs, resolver, transaction["to"])
+
+    print_report(line_gas, line_hits, total_traced, receipt.gas_used, contract_sources, args.top)
+    write_folded(folded, args.folded)
+    print(f"Wrote folded stacks to {args.folded}")
+
+
+if __name__ == "__main__":
+    main()
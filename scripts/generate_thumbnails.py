@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# Thumbnail / derivative generation for on-chain art (so gallery grids don't decode full 1000x1000 payloads)
+#
+# For every art piece:
+#   1. image bytes from ArtPiece.getImageData, through the local image cache (scripts/image_cache.py)
+#   2. decode once and render every --sizes derivative (longest side, aspect ratio kept, never upscaled)
+#      with the Pillow setup of scripts/compressAzuki.py (LANCZOS, RGB / RGBA), optionally with the
+#      highest quality under --max-kb
+#   3. write <output>/<art piece address>/<size>.<format> and record it in <output>/manifest.json
+# Pieces are rendered in parallel across a process pool (--workers). A piece whose image hash, format and
+# sizes match the manifest is skipped, so reruns only render new pieces.
+#
+# The default output is public/thumbnails, served by the frontend at /thumbnails/<address>/<size>.webp.
+# Needs Pillow (pip install Pillow); AVIF output needs Pillow 11.2+ or pillow-avif-plugin.
+#
+# Usage:
+#   python scripts/generate_thumbnails.py --network arbitrum:sepolia:alchemy --hub 0x...
+#   python scripts/generate_thumbnails.py --network arbitrum:sepolia:alchemy 0x... 0x... --sizes 96 256 --format avif --max-kb 8
+
+import argparse
+import hashlib
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+from ape import networks
+from PIL import Image, UnidentifiedImageError
+
+sys.path.append(str(Path(__file__).parent))
+from compressAzuki import encode_under_size, resize_image
+from image_cache import DEFAULT_CACHE_DIR, DEFAULT_NETWORK, ImageCache, ImageFetcher, hub_art_pieces
+
+DEFAULT_OUTPUT = "public/thumbnails"
+DEFAULT_SIZES = [128, 256, 512]
+DEFAULT_FORMAT = "webp"
+DEFAULT_QUALITY = 80
+# Art pieces fetched (and held in memory) per round of rendering
+DEFAULT_BATCH_SIZE = 200
+MANIFEST_NAME = "manifest.json"
+
+
+def fit_within(width, height, size):
+    """Dimensions with the longest side scaled down to size (never up)."""
+    scale = min(1, size / max(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def render_derivatives(address, data, output, sizes, format, quality, max_bytes):
+    """
+    Decode an image and write its derivatives (runs in a worker process).
+
+    Returns:
+        tuple: (address, manifest entry or None, error or None)
+    """
+    try:
+        source = Image.open(BytesIO(data))
+        source.load()
+    except (UnidentifiedImageError, OSError) as e:
+        return address, None, f"not a decodable image ({e})"
+
+    piece_directory = Path(output) / address
+    piece_directory.mkdir(parents=True, exist_ok=True)
+    files = {}
+    for size in sizes:
+        img = resize_image(source, fit_within(source.width, source.height, size))
+        if format == "jpeg" and img.mode == "RGBA":
+            # JPEG has no alpha channel
+            img = img.convert("RGB")
+        if max_bytes:
+            encoded, _quality = encode_under_size(img, max_bytes, format=format.upper())
+        else:
+            buffer = BytesIO()
+            img.save(buffer, format=format.upper(), quality=quality)
+            encoded = buffer.getvalue()
+        path = piece_directory / f"{size}.{format}"
+        temporary_path = path.with_suffix(".tmp")
+        temporary_path.write_bytes(encoded)
+        temporary_path.replace(path)
+        files[str(size)] = {"path": f"{address}/{size}.{format}", "width": img.width, "height": img.height, "bytes": len(encoded)}
+
+    entry = {
+        "source_sha256": hashlib.sha256(data).hexdigest(),
+        "source_bytes": len(data),
+        "width": source.width,
+        "height": source.height,
+        "format": format,
+        "files": files,
+    }
+    return address, entry, None
+
+
+def load_manifest(output):
+    path = Path(output) / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_manifest(output, manifest):
+    path = Path(output) / MANIFEST_NAME
+    temporary_path = path.with_suffix(".tmp")
+    with open(temporary_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    temporary_path.replace(path)
+
+
+def is_current(entry, data, sizes, format):
+    """Whether the manifest entry was rendered from these bytes with this format and these sizes."""
+    return (
+        entry is not None
+        and entry["source_sha256"] == hashlib.sha256(data).hexdigest()
+        and entry["format"] == format
+        and sorted(entry["files"]) == sorted(str(size) for size in sizes)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate thumbnails of on-chain art pieces")
+    parser.add_argument('art_pieces', nargs="*", help='ArtPiece addresses')
+    parser.add_argument('--hub', action="append", default=[], help='Also render every verified piece of this ArtCommissionHub')
+    parser.add_argument('--network', default=DEFAULT_NETWORK, help='Ape network choice')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='Static directory for the derivatives')
+    parser.add_argument('--sizes', type=int, nargs="+", default=DEFAULT_SIZES, help='Longest side of each derivative (px)')
+    parser.add_argument('--format', choices=["webp", "avif", "jpeg", "png"], default=DEFAULT_FORMAT, help='Derivative format')
+    parser.add_argument('--quality', type=int, default=DEFAULT_QUALITY, help='Encoder quality (ignored with --max-kb)')
+    parser.add_argument('--max-kb', type=float, help='Highest quality that fits in this size per derivative')
+    parser.add_argument('--workers', type=int, help='Render processes (default: CPU count)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Art pieces fetched per round')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Image cache directory')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent image reads')
+    parser.add_argument('--force', action='store_true', help='Render pieces that are already in the manifest')
+    args = parser.parse_args()
+
+    max_bytes = int(args.max_kb * 1024) if args.max_kb else None
+    Path(args.output).mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(args.output)
+    rendered = skipped = failed = 0
+
+    with networks.parse_network_choice(args.network) as provider:
+        web3 = provider.web3
+        art_pieces = list(args.art_pieces)
+        for hub in args.hub:
+            art_pieces.extend(hub_art_pieces(web3, hub))
+        fetcher = ImageFetcher(web3, ImageCache(args.cache_dir), concurrency=args.concurrency)
+
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            for start in range(0, len(art_pieces), args.batch_size):
+                images = fetcher.get_images(art_pieces[start:start + args.batch_size])
+                futures = []
+                for address, data in images.items():
+                    if not args.force and is_current(manifest.get(address), data, args.sizes, args.format):
+                        skipped += 1
+                        continue
+                    futures.append(executor.submit(
+                        render_derivatives, address, data, args.output, args.sizes, args.format, args.quality, max_bytes
+                    ))
+                for future in futures:
+                    address, entry, error = future.result()
+                    if error:
+                        print(f"WARNING: Skipping {address}: {error}")
+                        failed += 1
+                        continue
+                    manifest[address] = entry
+                    rendered += 1
+                save_manifest(args.output, manifest)
+                print(f"Processed {min(start + args.batch_size, len(art_pieces)):,}/{len(art_pieces):,} art pieces")
+
+    print(f"Rendered {rendered}, up to date {skipped}, failed {failed} ({fetcher.hits} images cached, {fetcher.misses} fetched)")
+
+
+if __name__ == "__main__":
+    main()
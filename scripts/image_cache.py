@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# Content-addressed on-disk cache of ArtPiece image data (getImageData, up to 45KB per eth_call)
+#
+# Image bytes are immutable after ArtPiece.initialize, so cached entries never need invalidation:
+#   - blobs: <cache dir>/blobs/<sha256[:2]>/<sha256>, one file per distinct image (identical images share a blob)
+#   - index: <cache dir>/index.json, (chain id, art piece address, code hash) -> blob hash, size, last use
+# The code hash (keccak of the runtime code, the minimal proxy of the ArtPiece template) is remembered per
+# address, so repeat loads are local disk reads without any RPC. --verify-code re-reads it, for local dev
+# chains that reuse addresses after a reset.
+#
+# Misses are fetched concurrently by --concurrency threads. The cache is evicted least recently used
+# first once the blobs exceed --max-mb.
+#
+# Usage (library):
+#   from image_cache import ImageCache, ImageFetcher
+#   fetcher = ImageFetcher(provider.web3, ImageCache(".image_cache"))
+#   images = fetcher.get_images([art_piece_1, art_piece_2])   # {address: bytes}
+#
+# Usage (warm the cache):
+#   python scripts/image_cache.py fetch --network arbitrum:sepolia:alchemy 0x... 0x...
+#   python scripts/image_cache.py fetch --network arbitrum:sepolia:alchemy --hub 0x...
+#   python scripts/image_cache.py stats
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ape import networks
+from eth_utils import keccak, to_checksum_address
+
+DEFAULT_CACHE_DIR = ".image_cache"
+DEFAULT_MAX_MB = 512
+DEFAULT_CONCURRENCY = 8
+DEFAULT_NETWORK = "ethereum:local:foundry"
+# Max pieces per getVerifiedArtPiecesByOffset call
+HUB_PAGE_SIZE = 50
+
+IMAGE_DATA_ABI = [{
+    "name": "getImageData",
+    "type": "function",
+    "stateMutability": "view",
+    "inputs": [],
+    "outputs": [{"name": "", "type": "bytes"}],
+}]
+HUB_PAGE_ABI = [
+    {
+        "name": "countVerifiedArtCommissions",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "uint256"}],
+    },
+    {
+        "name": "getVerifiedArtPiecesByOffset",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [{"name": "_offset", "type": "uint256"}, {"name": "_count", "type": "uint256"}],
+        "outputs": [{"name": "", "type": "address[]"}],
+    },
+]
+
+
+class ImageCache:
+    """Content-addressed blob store with an LRU index bounded by the total blob size, thread safe."""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.directory = Path(directory)
+        self.blob_directory = self.directory / "blobs"
+        self.index_path = self.directory / "index.json"
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.blob_directory.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        self.entries = {}
+        self.code_hashes = {}
+        if self.index_path.exists():
+            with open(self.index_path) as f:
+                index = json.load(f)
+            self.entries = index["entries"]
+            self.code_hashes = index["code_hashes"]
+        # Blob sizes and reference counts, a blob is deleted with its last entry
+        self.blob_sizes = {}
+        self.blob_references = {}
+        for entry in self.entries.values():
+            self.blob_sizes[entry["sha256"]] = entry["size"]
+            self.blob_references[entry["sha256"]] = self.blob_references.get(entry["sha256"], 0) + 1
+        # --max-mb may be lower than when the cache was written
+        self._evict()
+
+    @staticmethod
+    def key(chain_id, address, code_hash):
+        return f"{chain_id}:{to_checksum_address(address)}:{code_hash}"
+
+    @staticmethod
+    def address_key(chain_id, address):
+        return f"{chain_id}:{to_checksum_address(address)}"
+
+    def _blob_path(self, sha256):
+        return self.blob_directory / sha256[:2] / sha256
+
+    @property
+    def total_bytes(self):
+        return sum(self.blob_sizes.values())
+
+    def code_hash(self, chain_id, address):
+        """Remembered code hash of an address, None if it was never fetched."""
+        return self.code_hashes.get(self.address_key(chain_id, address))
+
+    def get(self, key):
+        """Cached image bytes, None on a miss."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            entry["last_used"] = time.time()
+        try:
+            return self._blob_path(entry["sha256"]).read_bytes()
+        except FileNotFoundError:
+            # Blob removed outside the cache, refetch
+            with self._lock:
+                self._remove_entry(key)
+            return None
+
+    def put(self, chain_id, address, code_hash, data):
+        key = self.key(chain_id, address, code_hash)
+        sha256 = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(sha256)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(exist_ok=True)
+            temporary_path = blob_path.with_name(f"{sha256}.{threading.get_ident()}.tmp")
+            temporary_path.write_bytes(data)
+            temporary_path.replace(blob_path)
+        with self._lock:
+            self.code_hashes[self.address_key(chain_id, address)] = code_hash
+            if key in self.entries:
+                self._remove_entry(key)
+            self.entries[key] = {"sha256": sha256, "size": len(data), "last_used": time.time()}
+            self.blob_sizes[sha256] = len(data)
+            self.blob_references[sha256] = self.blob_references.get(sha256, 0) + 1
+            self._evict()
+
+    def _remove_entry(self, key):
+        entry = self.entries.pop(key)
+        sha256 = entry["sha256"]
+        self.blob_references[sha256] -= 1
+        if self.blob_references[sha256] == 0:
+            del self.blob_references[sha256]
+            del self.blob_sizes[sha256]
+            self._blob_path(sha256).unlink(missing_ok=True)
+
+    def _evict(self):
+        """Drop least recently used entries until the blobs fit in max_bytes."""
+        total = self.total_bytes
+        if total <= self.max_bytes:
+            return
+        for key in sorted(self.entries, key=lambda key: self.entries[key]["last_used"]):
+            size = self.blob_sizes[self.entries[key]["sha256"]]
+            shared = self.blob_references[self.entries[key]["sha256"]] > 1
+            self._remove_entry(key)
+            if not shared:
+                total -= size
+            if total <= self.max_bytes:
+                break
+
+    def save(self):
+        """Write the index (atomically), blobs are written as they are added."""
+        with self._lock:
+            index = {"entries": self.entries, "code_hashes": self.code_hashes}
+            temporary_path = self.index_path.with_suffix(".tmp")
+            with open(temporary_path, "w") as f:
+                json.dump(index, f)
+            temporary_path.replace(self.index_path)
+
+    def stats(self):
+        return {"entries": len(self.entries), "blobs": len(self.blob_sizes), "bytes": self.total_bytes, "max_bytes": self.max_bytes}
+
+
+class ImageFetcher:
+    """getImageData through the cache, misses read concurrently over web3."""
+
+    def __init__(self, web3, cache, concurrency=DEFAULT_CONCURRENCY, verify_code=False):
+        self.web3 = web3
+        self.cache = cache
+        self.concurrency = concurrency
+        self.verify_code = verify_code
+        self.chain_id = web3.eth.chain_id
+        self.hits = 0
+        self.misses = 0
+
+    def _code_hash(self, address):
+        code_hash = None if self.verify_code else self.cache.code_hash(self.chain_id, address)
+        if code_hash is None:
+            code_hash = "0x" + keccak(bytes(self.web3.eth.get_code(address))).hex()
+        return code_hash
+
+    def _get_image(self, address):
+        """Image data of one art piece, returns (data, whether it came from the cache)."""
+        code_hash = self._code_hash(address)
+        data = self.cache.get(self.cache.key(self.chain_id, address, code_hash))
+        if data is not None:
+            return data, True
+        data = bytes(self.web3.eth.contract(address=address, abi=IMAGE_DATA_ABI).functions.getImageData().call())
+        self.cache.put(self.chain_id, address, code_hash, data)
+        return data, False
+
+    def get_image(self, address):
+        return self.get_images([address])[to_checksum_address(address)]
+
+    def get_images(self, addresses):
+        """
+        Image data of art pieces, from the cache or read concurrently.
+
+        Returns:
+            dict: checksummed address -> image bytes
+        """
+        addresses = list(dict.fromkeys(to_checksum_address(address) for address in addresses))
+        images = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for address, (data, cached) in zip(addresses, executor.map(self._get_image, addresses)):
+                images[address] = data
+                if cached:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+        self.cache.save()
+        return images
+
+
+def hub_art_pieces(web3, hub_address):
+    """Every verified art piece of a hub, in list order."""
+    hub = web3.eth.contract(address=to_checksum_address(hub_address), abi=HUB_PAGE_ABI)
+    count = hub.functions.countVerifiedArtCommissions().call()
+    art_pieces = []
+    for offset in range(0, count, HUB_PAGE_SIZE):
+        art_pieces.extend(hub.functions.getVerifiedArtPiecesByOffset(offset, HUB_PAGE_SIZE).call())
+    return art_pieces
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed cache of on-chain ArtPiece image data")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Cache directory')
+    parser.add_argument('--max-mb', type=int, default=DEFAULT_MAX_MB, help='Max total size of cached images (MB)')
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    fetch_parser = subparsers.add_parser("fetch", help="Fetch images into the cache")
+    fetch_parser.add_argument('art_pieces', nargs="*", help='ArtPiece addresses')
+    fetch_parser.add_argument('--hub', action="append", default=[], help='Also fetch every verified piece of this ArtCommissionHub')
+    fetch_parser.add_argument('--network', default=DEFAULT_NETWORK, help='Ape network choice')
+    fetch_parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='Concurrent reads')
+    fetch_parser.add_argument('--verify-code', action='store_true', help='Re-read code hashes (dev chains that reset)')
+
+    subparsers.add_parser("stats", help="Print cache statistics")
+    args = parser.parse_args()
+
+    cache = ImageCache(args.cache_dir, max_bytes=args.max_mb * 1024 * 1024)
+    if args.command == "stats":
+        print(json.dumps(cache.stats(), indent=2))
+        return
+
+    with networks.parse_network_choice(args.network) as provider:
+        web3 = provider.web3
+        art_pieces = list(args.art_pieces)
+        for hub in args.hub:
+            art_pieces.extend(hub_art_pieces(web3, hub))
+        fetcher = ImageFetcher(web3, cache, concurrency=args.concurrency, verify_code=args.verify_code)
+        started = time.monotonic()
+        images = fetcher.get_images(art_pieces)
+        elapsed = time.monotonic() - started
+    print(f"{len(images)} images ({sum(map(len, images.values())):,} bytes) in {elapsed:.2f}s: "
+          f"{fetcher.hits} cached, {fetcher.misses} fetched")
+    print(json.dumps(cache.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# Retryable ticket fee estimation for L2 -> L3 messages (Python counterpart of src/utils/l3GasEstimator.ts)
+#
+# Estimates the fee parameters for
+#   L2OwnershipRelay.relayToL3(..., _max_submission_cost, _gas_limit, _max_fee_per_gas)
+#   AnimeTokenL2ToL3MessageSender.sendWithCustomAnimeAmount(..., _gas_limit, _max_fee_per_gas)
+# from the actual cost of the message instead of worst-case constants:
+#   - submission cost: the inbox formula (1400 + 6 * calldata length) * base fee, from the L3 base fee
+#   - gas limit: gas used by the L3 call in a dry run on the local ape test network
+#     (for relays the current L3 owner and the verified art pieces of its hub can be read with
+#     --l3-registry, so the dry run takes the same path as on L3: first registration, owner change
+#     pushed to the hub's verified pieces or unchanged owner)
+#   - max fee per gas: the L3 gas price with headroom for base fee increases
+# Values are clamped to the bounds the contracts accept.
+#
+# Usage:
+#   python scripts/l3_fee_estimator.py relay --nft-contract 0x... --token-id 1 --owner 0x...
+#   python scripts/l3_fee_estimator.py relay --nft-contract 0x... --token-id 1 --owner 0x... --l3-registry 0x...
+#   python scripts/l3_fee_estimator.py relay ... --previous-owner 0x... --verified-pieces 40   (offline owner change)
+#   python scripts/l3_fee_estimator.py anime --user-input-address 0x...
+#   python scripts/l3_fee_estimator.py relay ... --base-fee-gwei 0.1   (offline, skips the L3 RPC)
+
+import argparse
+import sys
+from pathlib import Path
+
+from ape import accounts, networks, project
+from eth_abi import encode
+from eth_utils import function_signature_to_4byte_selector, to_checksum_address
+from web3 import Web3
+
+sys.path.append(str(Path(__file__).parent))
+from benchmark_utils import LOCAL_NETWORK, ZERO_ADDRESS, create_artist, create_verified_commission, deploy_local_system
+
+# Default L3 RPC URL - AnimeChain Mainnet (same as src/utils/l3GasEstimator.ts)
+L3_RPC_URL = "https://rpc-animechain-39xf6m45e3.t.conduit.xyz"
+
+# Inbox.calculateRetryableSubmissionFee: (RETRYABLE_BASE_BYTES + 6 * data length) * base fee
+RETRYABLE_BASE_BYTES = 1400
+RETRYABLE_BYTE_COST = 6
+
+# Headroom: the base fee may rise before the ticket is redeemed, the dry run state may differ slightly from L3
+BASE_FEE_MARGIN = 2
+GAS_LIMIT_MARGIN = 1.2
+
+# Fallback L3 prices when the RPC can't be reached (as in l3GasEstimator.ts)
+FALLBACK_BASE_FEE = Web3.to_wei(0.1, "gwei")
+FALLBACK_GAS_PRICE = Web3.to_wei(0.1, "gwei")
+
+# Must match ArtCommissionHub.vy: an owner change pushes to the first MAX_OWNER_PUSH_PIECES verified pieces
+# while at least OWNER_SYNC_GAS_RESERVE gas is left, the rest wait for continueOwnerFanOut
+MAX_OWNER_PUSH_PIECES = 100
+OWNER_SYNC_GAS_RESERVE = 300_000
+
+RELAY_SIGNATURE = "registerNFTOwnerFromParentChain(uint256,address,uint256,address)"
+ANIME_MESSAGE_SIGNATURE = "crossChainUpdate(address)"
+LOOKUP_OWNER_ABI = [{
+    "name": "lookupRegisteredOwner",
+    "type": "function",
+    "stateMutability": "view",
+    "inputs": [
+        {"name": "_chain_id", "type": "uint256"},
+        {"name": "_nft_contract", "type": "address"},
+        {"name": "_nft_token_id_or_generic_hub_account", "type": "uint256"},
+    ],
+    "outputs": [{"name": "", "type": "address"}],
+}, {
+    "name": "getArtCommissionHubByOwner",
+    "type": "function",
+    "stateMutability": "view",
+    "inputs": [
+        {"name": "_chain_id", "type": "uint256"},
+        {"name": "_nft_contract", "type": "address"},
+        {"name": "_nft_token_id_or_generic_hub_account", "type": "uint256"},
+    ],
+    "outputs": [{"name": "", "type": "address"}],
+}]
+COUNT_VERIFIED_ABI = [{
+    "name": "countVerifiedArtCommissions",
+    "type": "function",
+    "stateMutability": "view",
+    "inputs": [],
+    "outputs": [{"name": "", "type": "uint256"}],
+}]
+
+# Must match the bounds in L2OwnershipRelay.vy / AnimeTokenL2ToL3MessageSender.vy
+FEE_BOUNDS = {
+    "relay": {"min_gas_limit": 100_000, "max_gas_limit": 5_000_000, "max_submission_cost": 10**17, "max_fee_per_gas": 100 * 10**9},
+    "anime": {"min_gas_limit": 21_000, "max_gas_limit": 5_000_000, "max_submission_cost": 10**17, "max_fee_per_gas": 100 * 10**9},
+}
+
+
+def relay_calldata(chain_id, nft_contract, token_id, owner):
+    """Calldata L2OwnershipRelay.relayToL3 sends to the L3 ArtCommissionHubOwners."""
+    return function_signature_to_4byte_selector(RELAY_SIGNATURE) + encode(
+        ["uint256", "address", "uint256", "address"], [chain_id, nft_contract, token_id, owner]
+    )
+
+
+def anime_message_calldata(user_input_address):
+    """Calldata AnimeTokenL2ToL3MessageSender sends to the L3 target contract."""
+    return function_signature_to_4byte_selector(ANIME_MESSAGE_SIGNATURE) + encode(["address"], [user_input_address])
+
+
+def retryable_submission_fee(data_length, base_fee):
+    """Submission fee the inbox charges for a retryable ticket with data_length bytes of calldata."""
+    return (RETRYABLE_BASE_BYTES + RETRYABLE_BYTE_COST * data_length) * base_fee
+
+
+def fetch_l3_fee_data(rpc_url=L3_RPC_URL):
+    """
+    Current base fee and gas price of the L3, fallback values if the RPC fails.
+
+    Returns:
+        tuple: (base fee, gas price) in wei
+    """
+    try:
+        web3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 10}))
+        base_fee = web3.eth.get_block("latest").get("baseFeePerGas") or FALLBACK_BASE_FEE
+        return base_fee, web3.eth.gas_price or base_fee
+    except Exception as e:
+        print(f"WARNING: Could not fetch L3 fee data from {rpc_url} ({e}), using fallback prices")
+        return FALLBACK_BASE_FEE, FALLBACK_GAS_PRICE
+
+
+def lookup_l3_owner(rpc_url, l3_registry, chain_id, nft_contract, token_id):
+    """
+    Owner currently registered on the L3 ArtCommissionHubOwners and the verified art pieces of its hub.
+
+    Returns:
+        tuple: (owner, verified art piece count), zero address and 0 if never registered
+    """
+    web3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 10}))
+    registry = web3.eth.contract(address=to_checksum_address(l3_registry), abi=LOOKUP_OWNER_ABI)
+    nft_contract = to_checksum_address(nft_contract)
+    owner = registry.functions.lookupRegisteredOwner(chain_id, nft_contract, token_id).call()
+    hub = registry.functions.getArtCommissionHubByOwner(chain_id, nft_contract, token_id).call()
+    if hub == ZERO_ADDRESS:
+        return owner, 0
+    return owner, web3.eth.contract(address=hub, abi=COUNT_VERIFIED_ABI).functions.countVerifiedArtCommissions().call()
+
+
+def dry_run_owner_push_gas(system, chain_id, nft_contract, token_id, verified_pieces):
+    """
+    Gas of an owner change of a hub with verified_pieces verified art pieces. Measured with up to three
+    pieces (the refund cap skews one), every further piece the change is pushed to costs the same as the
+    third, plus the gas reserve the hub keeps before each push so the last piece isn't left to
+    continueOwnerFanOut.
+    """
+    deployer = system["deployer"]
+    hub_owner, new_owner, artist, commissioner = accounts.test_accounts[1:5]
+    art_commission_hub_owners = system["art_commission_hub_owners"]
+    art_commission_hub_owners.registerNFTOwnerFromParentChain(chain_id, nft_contract, token_id, hub_owner.address, sender=deployer)
+    commission_hub = project.ArtCommissionHub.at(art_commission_hub_owners.getArtCommissionHubByOwner(chain_id, nft_contract, token_id))
+    commission_hub.updateWhitelistOrBlacklist(artist.address, True, True, sender=hub_owner)
+    create_artist(system, artist)
+    system["profile_factory_and_registry"].createProfile(commissioner.address, sender=deployer)
+
+    gas_used = []
+    for _ in range(3):
+        create_verified_commission(system, commission_hub, artist, commissioner)
+        gas_used.append(art_commission_hub_owners.registerNFTOwnerFromParentChain(
+            chain_id, nft_contract, token_id, new_owner.address, sender=deployer
+        ).gas_used)
+        art_commission_hub_owners.registerNFTOwnerFromParentChain(chain_id, nft_contract, token_id, hub_owner.address, sender=deployer)
+    pieces = min(verified_pieces, MAX_OWNER_PUSH_PIECES)
+    if pieces <= len(gas_used):
+        return gas_used[pieces - 1] + OWNER_SYNC_GAS_RESERVE
+    gas_per_piece = gas_used[-1] - gas_used[-2]
+    return gas_used[-1] + (pieces - len(gas_used)) * gas_per_piece + OWNER_SYNC_GAS_RESERVE
+
+
+def dry_run_relay_gas(chain_id, nft_contract, token_id, owner, previous_owner=ZERO_ADDRESS, verified_pieces=0):
+    """
+    Gas used by ArtCommissionHubOwners.registerNFTOwnerFromParentChain on a fresh local deployment.
+    With a previous owner the token is registered to it first, so the dry run measures an owner
+    change (or an unchanged owner) instead of a first registration that creates the hub. An owner
+    change is pushed to the hub's verified art pieces, sized for verified_pieces of them.
+    """
+    with networks.parse_network_choice(LOCAL_NETWORK):
+        system = deploy_local_system()
+        deployer = system["deployer"]
+        art_commission_hub_owners = system["art_commission_hub_owners"]
+        if previous_owner != ZERO_ADDRESS and previous_owner != owner and verified_pieces > 0:
+            return dry_run_owner_push_gas(system, chain_id, nft_contract, token_id, verified_pieces)
+        if previous_owner != ZERO_ADDRESS:
+            art_commission_hub_owners.registerNFTOwnerFromParentChain(chain_id, nft_contract, token_id, previous_owner, sender=deployer)
+            # An unchanged owner re-registered on L3 outside the refresh interval still writes the timestamp
+            art_commission_hub_owners.setMinOwnerRefreshInterval(0, sender=deployer)
+        receipt = art_commission_hub_owners.registerNFTOwnerFromParentChain(chain_id, nft_contract, token_id, owner, sender=deployer)
+        return receipt.gas_used
+
+
+def dry_run_anime_message_gas(user_input_address):
+    """Gas used by crossChainUpdate on a local ZZ_TestL3ReceiveMessage (the L3 target contract)."""
+    with networks.parse_network_choice(LOCAL_NETWORK):
+        deployer = accounts.test_accounts[0]
+        target = project.ZZ_TestL3ReceiveMessage.deploy(sender=deployer)
+        return target.crossChainUpdate(user_input_address, sender=deployer).gas_used
+
+
+def estimate_fees(kind, calldata, execution_gas, base_fee, gas_price):
+    """
+    Retryable ticket fee parameters for a message, clamped to the contract bounds.
+
+    Returns:
+        dict: maxSubmissionCost, gasLimit, maxFeePerGas, baseFee, l3GasPrice, totalCost (wei, as in l3GasEstimator.ts)
+    """
+    bounds = FEE_BOUNDS[kind]
+    max_submission_cost = retryable_submission_fee(len(calldata), base_fee) * BASE_FEE_MARGIN
+    gas_limit = int(execution_gas * GAS_LIMIT_MARGIN)
+    max_fee_per_gas = max(gas_price, base_fee) * BASE_FEE_MARGIN
+
+    max_submission_cost = max(1, min(max_submission_cost, bounds["max_submission_cost"]))
+    gas_limit = max(bounds["min_gas_limit"], min(gas_limit, bounds["max_gas_limit"]))
+    max_fee_per_gas = max(1, min(max_fee_per_gas, bounds["max_fee_per_gas"]))
+    return {
+        "maxSubmissionCost": max_submission_cost,
+        "gasLimit": gas_limit,
+        "maxFeePerGas": max_fee_per_gas,
+        "baseFee": base_fee,
+        "l3GasPrice": gas_price,
+        "totalCost": max_submission_cost + gas_limit * max_fee_per_gas,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate retryable ticket fees for L2 -> L3 messages")
+    parser.add_argument('--rpc-url', default=L3_RPC_URL, help='L3 RPC URL for the base fee and gas price')
+    parser.add_argument('--base-fee-gwei', type=float, help='Use this L3 base fee (and gas price) instead of querying the RPC')
+    subparsers = parser.add_subparsers(dest="kind", required=True)
+
+    relay = subparsers.add_parser("relay", help="L2OwnershipRelay.relayToL3")
+    relay.add_argument('--chain-id', type=int, default=1, help='Chain ID of the NFT collection')
+    relay.add_argument('--nft-contract', required=True, help='NFT contract address')
+    relay.add_argument('--token-id', type=int, required=True, help='NFT token ID')
+    relay.add_argument('--owner', required=True, help='Owner to relay')
+    relay.add_argument('--previous-owner', default=ZERO_ADDRESS, help='Owner currently registered on L3 (zero for a first registration)')
+    relay.add_argument('--verified-pieces', type=int, default=0, help='Verified art pieces of the hub on L3 (an owner change is pushed to them)')
+    relay.add_argument('--l3-registry', help='L3 ArtCommissionHubOwners address, reads the current owner and verified pieces instead')
+
+    anime = subparsers.add_parser("anime", help="AnimeTokenL2ToL3MessageSender.sendWithCustomAnimeAmount")
+    anime.add_argument('--user-input-address', required=True, help='Address passed to crossChainUpdate')
+    args = parser.parse_args()
+
+    if args.base_fee_gwei is not None:
+        base_fee = gas_price = Web3.to_wei(args.base_fee_gwei, "gwei")
+    else:
+        base_fee, gas_price = fetch_l3_fee_data(args.rpc_url)
+
+    if args.kind == "relay":
+        nft_contract = to_checksum_address(args.nft_contract)
+        owner = to_checksum_address(args.owner)
+        previous_owner = to_checksum_address(args.previous_owner)
+        verified_pieces = args.verified_pieces
+        if args.l3_registry:
+            previous_owner, verified_pieces = lookup_l3_owner(args.rpc_url, args.l3_registry, args.chain_id, nft_contract, args.token_id)
+            print(f"L3 owner {previous_owner}, {verified_pieces} verified art pieces")
+        calldata = relay_calldata(args.chain_id, nft_contract, args.token_id, owner)
+        execution_gas = dry_run_relay_gas(args.chain_id, nft_contract, args.token_id, owner, previous_owner, verified_pieces)
+    else:
+        calldata = anime_message_calldata(to_checksum_address(args.user_input_address))
+        execution_gas = dry_run_anime_message_gas(to_checksum_address(args.user_input_address))
+
+    fees = estimate_fees(args.kind, calldata, execution_gas, base_fee, gas_price)
+    print(f"\n=== Retryable ticket fees ({args.kind}) ===")
+    print(f"calldata bytes:       {len(calldata)}")
+    print(f"dry run gas:          {execution_gas:,}")
+    for key, value in fees.items():
+        print(f"{key + ':':<22}{value:,}")
+    if args.kind == "relay":
+        print(f"\nrelayToL3 fee arguments: {fees['maxSubmissionCost']}, {fees['gasLimit']}, {fees['maxFeePerGas']}")
+        print(f"value to send:           {fees['totalCost']} wei ({Web3.from_wei(fees['totalCost'], 'ether')} ETH)")
+    else:
+        print(f"\nsendWithCustomAnimeAmount fee arguments: _max_submission_cost={fees['maxSubmissionCost']}, "
+              f"_gas_limit={fees['gasLimit']}, _max_fee_per_gas={fees['maxFeePerGas']}")
+        print(f"minimum _anime_token_amount:             {fees['gasLimit'] * fees['maxFeePerGas']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# Synthetic marketplace load generator for a local anvil node
+#
+# Deploys the system, then drives it with populations of artists and commissioners sending
+# transactions concurrently from many accounts:
+#   artist flow:       createNewArtPieceAndRegisterProfileAndAttachToHub -> setIsArtist
+#                      -> createEditionFromArtPiece -> updateProceedsAddress -> startSale
+#   commission flow:   createGenericCommissionHub -> createNewArtPieceAndRegisterProfileAndAttachToHub
+#                      (commissioner side, attached to the hub) -> verifyAsArtist (by the artist)
+#                      -> mint from a random artist's edition
+#
+# Transactions are signed locally and nonces are handed out by a local nonce manager, so one
+# account (an artist verifying many commissions) can have several transactions in flight.
+# Reports sustained TPS, latency percentiles per step and gas per user flow.
+#
+# Usage:
+#   anvil --accounts 15 &   (or let ape-foundry start it)
+#   python scripts/load_generator.py --artists 20 --commissioners 100 --concurrency 16
+#   python scripts/load_generator.py --network ethereum:local:foundry --artists 50 --commissioners 500
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from ape import accounts, networks
+from eth_account import Account
+from web3 import Web3
+from web3.logs import DISCARD
+
+sys.path.append(str(Path(__file__).parent))
+from benchmark_utils import TEST_TOKEN_URI_DATA, TEST_TOKEN_URI_DATA_FORMAT, ZERO_ADDRESS, deploy_local_system, print_gas_table
+
+ABI_DIR = Path(__file__).parent.parent / "src" / "assets" / "abis"
+DEFAULT_NETWORK = "ethereum:local:foundry"
+DEFAULT_ARTISTS = 10
+DEFAULT_COMMISSIONERS = 50
+DEFAULT_CONCURRENCY = 8
+MINT_PRICE = 10**15
+FUNDING_AMOUNT = 10**20
+GAS_MARGIN = 1.2
+RECEIPT_TIMEOUT = 120
+PERCENTILES = [50, 90, 99]
+
+GENERIC_ART_COMMISSION_HUB_CONTRACT = "0x1000000000000000000000000000000000000001"
+GENERIC_ART_COMMISSION_HUB_CHAIN_ID = 1
+
+
+class NonceManager:
+    """
+    Hands out nonces locally so an account can have several transactions in flight.
+    The first nonce of an account comes from the node's pending transaction count.
+    """
+
+    def __init__(self, w3):
+        self.w3 = w3
+        self.lock = threading.Lock()
+        self.next_nonce = {}
+
+    def next(self, address):
+        with self.lock:
+            if address not in self.next_nonce:
+                self.next_nonce[address] = self.w3.eth.get_transaction_count(address, "pending")
+            nonce = self.next_nonce[address]
+            self.next_nonce[address] += 1
+            return nonce
+
+    def resync(self, address):
+        """Forget the local nonce after a rejected send, the next one is read from the node again."""
+        with self.lock:
+            self.next_nonce.pop(address, None)
+
+
+class LoadContext:
+    """Connection, contract ABIs, nonce manager and the collected transaction records."""
+
+    def __init__(self, w3, system):
+        self.w3 = w3
+        self.chain_id = w3.eth.chain_id
+        self.gas_price = w3.eth.gas_price
+        self.nonces = NonceManager(w3)
+        self.abis = {}
+        self.system = {name: Web3.to_checksum_address(contract.address) for name, contract in system.items() if hasattr(contract, "address") and name != "deployer"}
+        self.records = []
+        self.lock = threading.Lock()
+
+    def contract(self, name, address):
+        if name not in self.abis:
+            with open(ABI_DIR / f"{name}.json") as f:
+                self.abis[name] = json.load(f)
+        return self.w3.eth.contract(address=Web3.to_checksum_address(address), abi=self.abis[name])
+
+    def send(self, account, contract_function, flow, step, value=0):
+        """
+        Estimate, sign and send a transaction, wait for its receipt and record latency and gas.
+        Latency is measured from submission to the receipt being available.
+        """
+        params = {"from": account.address, "value": value}
+        gas = int(contract_function.estimate_gas(params) * GAS_MARGIN)
+        nonce = self.nonces.next(account.address)
+        transaction = contract_function.build_transaction(dict(
+            params, nonce=nonce, gas=gas, gasPrice=self.gas_price, chainId=self.chain_id
+        ))
+        signed = account.sign_transaction(transaction)
+
+        sent_at = time.perf_counter()
+        try:
+            txn_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        except Exception:
+            self.nonces.resync(account.address)
+            raise
+        receipt = self.w3.eth.wait_for_transaction_receipt(txn_hash, timeout=RECEIPT_TIMEOUT, poll_latency=0.05)
+        latency = time.perf_counter() - sent_at
+
+        with self.lock:
+            self.records.append({
+                "flow": flow,
+                "step": step,
+                "latency": latency,
+                "gas_used": receipt["gasUsed"],
+                "success": receipt["status"] == 1,
+                "mined_at": time.perf_counter(),
+            })
+        if receipt["status"] != 1:
+            raise RuntimeError(f"{flow}/{step} reverted in {txn_hash.hex()}")
+        return receipt
+
+
+def create_users(prefix, count):
+    """Deterministic local accounts so repeated runs against a fresh node are comparable."""
+    return [Account.from_key(Web3.keccak(text=f"load-generator-{prefix}-{i}")) for i in range(count)]
+
+
+def fund_users(ctx, funder, users):
+    """Fund users with anvil_setBalance, or with transfers from the funder on other nodes."""
+    for user in users:
+        try:
+            response = ctx.w3.provider.make_request("anvil_setBalance", [user.address, hex(FUNDING_AMOUNT)])
+            if not response.get("error"):
+                continue
+        except Exception:
+            pass
+        nonce = ctx.nonces.next(funder.address)
+        signed = funder.sign_transaction({
+            "to": user.address, "value": FUNDING_AMOUNT, "gas": 21000, "gasPrice": ctx.gas_price,
+            "nonce": nonce, "chainId": ctx.chain_id,
+        })
+        ctx.w3.eth.wait_for_transaction_receipt(ctx.w3.eth.send_raw_transaction(signed.raw_transaction))
+
+
+def artist_flow(ctx, artist, index):
+    """Onboard an artist with a first art piece and put an edition of it on sale, return the edition address."""
+    factory = ctx.contract("ProfileFactoryAndRegistry", ctx.system["profile_factory_and_registry"])
+    receipt = ctx.send(artist, factory.functions.createNewArtPieceAndRegisterProfileAndAttachToHub(
+        ctx.system["art_piece_template"], TEST_TOKEN_URI_DATA, TEST_TOKEN_URI_DATA_FORMAT,
+        f"Load Art {index}", "Created by the load generator", True, artist.address, ZERO_ADDRESS, False,
+        GENERIC_ART_COMMISSION_HUB_CHAIN_ID, ZERO_ADDRESS, 0, "",
+    ), "artist", "createNewArtPiece")
+    created = factory.events.ArtPieceCreated().process_receipt(receipt, errors=DISCARD)[0]["args"]
+
+    profile = ctx.contract("Profile", created["profile"])
+    ctx.send(artist, profile.functions.setIsArtist(True), "artist", "setIsArtist")
+    art_sales = ctx.contract("ArtSales1155", profile.functions.artSales1155().call())
+    ctx.send(artist, art_sales.functions.createEditionFromArtPiece(
+        created["art_piece"], f"Load Edition {index}", "LOAD", MINT_PRICE, 10**6, 250,
+    ), "artist", "createEdition")
+
+    edition_address = art_sales.functions.getArtistErc1155AtIndex(art_sales.functions.artistErc1155sToSellCount().call() - 1).call()
+    edition = ctx.contract("ArtEdition1155", edition_address)
+    ctx.send(artist, edition.functions.updateProceedsAddress(artist.address), "artist", "updateProceeds")
+    ctx.send(artist, edition.functions.startSale(), "artist", "startSale")
+    return edition_address
+
+
+def commission_flow(ctx, commissioner, artist, edition_address, index):
+    """Commission an artist through a generic hub, have the artist verify it, then mint an edition."""
+    hub_owners = ctx.contract("ArtCommissionHubOwners", ctx.system["art_commission_hub_owners"])
+    factory = ctx.contract("ProfileFactoryAndRegistry", ctx.system["profile_factory_and_registry"])
+
+    ctx.send(commissioner, hub_owners.functions.createGenericCommissionHub(commissioner.address), "commission", "createGenericHub")
+    hub = hub_owners.functions.getArtCommissionHubByOwner(
+        GENERIC_ART_COMMISSION_HUB_CHAIN_ID, GENERIC_ART_COMMISSION_HUB_CONTRACT, int(commissioner.address, 16)
+    ).call()
+
+    receipt = ctx.send(commissioner, factory.functions.createNewArtPieceAndRegisterProfileAndAttachToHub(
+        ctx.system["art_piece_template"], TEST_TOKEN_URI_DATA, TEST_TOKEN_URI_DATA_FORMAT,
+        f"Load Commission {index}", "Commissioned by the load generator", False, artist.address, hub, False,
+        GENERIC_ART_COMMISSION_HUB_CHAIN_ID, ZERO_ADDRESS, 0, "",
+    ), "commission", "submitCommission")
+    art_piece = ctx.contract("ArtPiece", factory.events.ArtPieceCreated().process_receipt(receipt, errors=DISCARD)[0]["args"]["art_piece"])
+
+    ctx.send(artist, art_piece.functions.verifyAsArtist(), "commission", "verifyAsArtist")
+
+    edition = ctx.contract("ArtEdition1155", edition_address)
+    ctx.send(commissioner, edition.functions.mint(1), "commission", "mint", value=MINT_PRICE)
+
+
+def run_concurrently(jobs, concurrency):
+    """
+    Run (function, args) jobs on a thread pool.
+
+    Returns:
+        tuple: (results in job order, list of errors, elapsed seconds)
+    """
+    results = [None] * len(jobs)
+    errors = []
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {pool.submit(function, *args): index for index, (function, args) in enumerate(jobs)}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                errors.append(str(e))
+    return results, errors, time.perf_counter() - started
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def print_report(records, phases):
+    """Print throughput per phase, latency percentiles per step and gas per user flow."""
+    rows = [[name, count, errors, elapsed, count / elapsed if elapsed else 0.0] for name, count, errors, elapsed in phases]
+    total_count = sum(phase[1] for phase in phases)
+    total_elapsed = sum(phase[3] for phase in phases)
+    rows.append(["total", total_count, sum(phase[2] for phase in phases), total_elapsed, total_count / total_elapsed if total_elapsed else 0.0])
+    print_gas_table("Throughput", ["phase", "transactions", "failed flows", "seconds", "tps"], rows)
+
+    by_step = defaultdict(list)
+    for record in records:
+        by_step[(record["flow"], record["step"])].append(record)
+    rows = []
+    for (flow, step), step_records in by_step.items():
+        latencies = [1000 * r["latency"] for r in step_records]
+        rows.append(
+            [f"{flow}/{step}", len(step_records)]
+            + [percentile(latencies, pct) for pct in PERCENTILES]
+            + [sum(r["gas_used"] for r in step_records) // len(step_records)]
+        )
+    print_gas_table("Latency (ms) and gas per step", ["step", "count"] + [f"p{pct}" for pct in PERCENTILES] + ["avg gas"], rows)
+
+    rows = []
+    for flow in sorted({r["flow"] for r in records}):
+        steps = {r["step"] for r in records if r["flow"] == flow}
+        flow_gas = sum(sum(r["gas_used"] for r in by_step[(flow, step)]) // len(by_step[(flow, step)]) for step in steps)
+        rows.append([flow, len(steps), flow_gas])
+    print_gas_table("Gas per user flow (sum of average step gas)", ["flow", "transactions", "gas"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive a local node with concurrent artist and commissioner flows")
+    parser.add_argument('--network', default=DEFAULT_NETWORK, help='Ape network choice of the local node')
+    parser.add_argument('--artists', type=int, default=DEFAULT_ARTISTS, help='Number of artists')
+    parser.add_argument('--commissioners', type=int, default=DEFAULT_COMMISSIONERS, help='Number of commissioners')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='Number of flows in flight')
+    parser.add_argument('--seed', type=int, default=1, help='Seed for pairing commissioners with artists')
+    args = parser.parse_args()
+
+    with networks.parse_network_choice(args.network) as provider:
+        deployer = accounts.test_accounts[0]
+        system = deploy_local_system(deployer)
+        ctx = LoadContext(provider.web3, system)
+        print(f"Deployed the system, chain id {ctx.chain_id}")
+
+        artists = create_users("artist", args.artists)
+        commissioners = create_users("commissioner", args.commissioners)
+        fund_users(ctx, Account.from_key(deployer.private_key), artists + commissioners)
+        print(f"Funded {len(artists)} artists and {len(commissioners)} commissioners")
+
+        phases = []
+        editions, errors, elapsed = run_concurrently(
+            [(artist_flow, (ctx, artist, i)) for i, artist in enumerate(artists)], args.concurrency
+        )
+        phases.append(("artists", len(ctx.records), len(errors), elapsed))
+        print(f"Artist phase: {len(artists) - len(errors)} flows in {elapsed:.1f}s")
+
+        onboarded = [(artist, edition) for artist, edition in zip(artists, editions) if edition]
+        if not onboarded:
+            print("ERROR: No artist finished onboarding, skipping the commission phase")
+            for error in errors[:5]:
+                print(f"  {error}")
+            return
+
+        rng = random.Random(args.seed)
+        jobs = []
+        for i, commissioner in enumerate(commissioners):
+            artist, edition = rng.choice(onboarded)
+            jobs.append((commission_flow, (ctx, commissioner, artist, edition, i)))
+        before = len(ctx.records)
+        _, commission_errors, elapsed = run_concurrently(jobs, args.concurrency)
+        phases.append(("commissions", len(ctx.records) - before, len(commission_errors), elapsed))
+        print(f"Commission phase: {len(commissioners) - len(commission_errors)} flows in {elapsed:.1f}s")
+
+        for error in (errors + commission_errors)[:5]:
+            print(f"  flow failed: {error}")
+
+    print_report(ctx.records, phases)
+
+
+if __name__ == "__main__":
+    main()
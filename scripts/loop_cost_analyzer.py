@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# Static worst-case loop cost analyzer for the Vyper contracts
+#
+# Parses every contracts/*.vy file with the vyper AST parser, finds every loop, resolves its bound
+# (range(..., bound=N), range(N) or the DynArray[T, N] it iterates) and estimates the worst-case gas
+# of each function from the storage reads/writes, external calls, events and internal calls made
+# per iteration. Functions whose worst case does not fit in a block are flagged.
+#
+# The estimate is deliberately pessimistic: every storage access is priced cold, every write as a
+# zero -> non-zero SSTORE, and both branches of an if are assumed to be the more expensive one.
+# The JSON report has sorted keys so it can be diffed between commits.
+#
+# Usage:
+#   python scripts/loop_cost_analyzer.py
+#   python scripts/loop_cost_analyzer.py --block-gas-limit 32000000 --output /tmp/loop_cost_report.json
+#   python scripts/loop_cost_analyzer.py --fail-on-flagged
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import vyper.ast.nodes as vy_ast
+from vyper.ast import parse_to_ast
+
+CONTRACTS_DIR = Path(__file__).parent.parent / "contracts"
+DEFAULT_OUTPUT = Path(__file__).parent.parent / ".build" / "loop_cost_report.json"
+DEFAULT_BLOCK_GAS_LIMIT = 30_000_000
+
+# Pessimistic per-operation gas (post-Berlin, cold access)
+GAS_MODEL = {
+    "sload": 2_100,
+    "sstore": 22_100,
+    "external_call": 2_600,
+    "create": 41_000,
+    "log": 1_500,
+    "iteration_overhead": 100,
+}
+
+EXTERNAL_CALL_BUILTINS = {"raw_call", "send"}
+CREATE_BUILTINS = {"create_minimal_proxy_to", "create_copy_of", "create_from_blueprint"}
+ARRAY_WRITE_METHODS = {"append": (1, 2), "pop": (2, 1)}  # (sloads, sstores) for length + element
+
+
+class ContractAnalysis:
+    """Storage layout, constants and per-function worst-case gas for one contract."""
+
+    def __init__(self, name, module):
+        self.name = name
+        self.constants = {}
+        self.storage = {}
+        for decl in module.get_children(vy_ast.VariableDecl):
+            if decl.is_constant:
+                value = self.evaluate(decl.value)
+                if value is not None:
+                    self.constants[decl.target.id] = value
+            elif not decl.is_immutable:
+                self.storage[decl.target.id] = decl.annotation
+        self.functions = {fn.name: fn for fn in module.get_children(vy_ast.FunctionDef)}
+        self.results = {}
+
+    def evaluate(self, node):
+        """Fold an integer constant expression (literals, constants and arithmetic), None if unknown."""
+        if isinstance(node, vy_ast.Int):
+            return node.value
+        if isinstance(node, vy_ast.Name):
+            return self.constants.get(node.id)
+        if isinstance(node, vy_ast.BinOp):
+            left, right = self.evaluate(node.left), self.evaluate(node.right)
+            if left is None or right is None:
+                return None
+            operations = {
+                vy_ast.Add: lambda a, b: a + b,
+                vy_ast.Sub: lambda a, b: a - b,
+                vy_ast.Mult: lambda a, b: a * b,
+                vy_ast.Pow: lambda a, b: a ** b,
+                vy_ast.FloorDiv: lambda a, b: a // b,
+                vy_ast.Div: lambda a, b: a // b,
+            }
+            operation = operations.get(type(node.op))
+            return operation(left, right) if operation else None
+        return None
+
+    def is_storage(self, node):
+        return (
+            isinstance(node, vy_ast.Attribute)
+            and isinstance(node.value, vy_ast.Name)
+            and node.value.id == "self"
+            and node.attr in self.storage
+        )
+
+    def dynarray_bound(self, annotation):
+        """N of a DynArray[T, N] annotation."""
+        if (
+            isinstance(annotation, vy_ast.Subscript)
+            and isinstance(annotation.value, vy_ast.Name)
+            and annotation.value.id == "DynArray"
+            and isinstance(annotation.slice, vy_ast.Tuple)
+        ):
+            return self.evaluate(annotation.slice.elements[1])
+        return None
+
+    def loop_bound(self, loop, fn):
+        """
+        Worst-case iteration count of a loop and where it came from.
+
+        Returns:
+            tuple: (bound or None, source description, whether the loop iterates a storage array)
+        """
+        iterable = loop.iter
+        if isinstance(iterable, vy_ast.Call) and isinstance(iterable.func, vy_ast.Name) and iterable.func.id == "range":
+            for keyword in iterable.keywords:
+                if keyword.arg == "bound":
+                    return self.evaluate(keyword.value), "range bound", False
+            args = [self.evaluate(arg) for arg in iterable.args]
+            if len(args) == 1 and args[0] is not None:
+                return args[0], "range", False
+            if len(args) == 2 and None not in args:
+                return args[1] - args[0], "range", False
+            return None, "range", False
+
+        # Iterating an array directly: the bound is the DynArray capacity
+        storage_node = iterable
+        while isinstance(storage_node, vy_ast.Subscript):
+            storage_node = storage_node.value
+        if self.is_storage(storage_node):
+            annotation = self.storage[storage_node.attr]
+            while isinstance(annotation, vy_ast.Subscript) and isinstance(annotation.value, vy_ast.Name) and annotation.value.id == "HashMap":
+                annotation = annotation.slice.elements[1]
+            return self.dynarray_bound(annotation), f"self.{storage_node.attr}", True
+        if isinstance(iterable, vy_ast.List):
+            return len(iterable.elements), "literal list", False
+        if isinstance(iterable, vy_ast.Name):
+            for arg in fn.args.args:
+                if arg.arg == iterable.id:
+                    return self.dynarray_bound(arg.annotation), f"argument {iterable.id}", False
+            for local in fn.get_descendants(vy_ast.AnnAssign):
+                if isinstance(local.target, vy_ast.Name) and local.target.id == iterable.id:
+                    return self.dynarray_bound(local.annotation), f"local {iterable.id}", False
+        return None, "unresolved", False
+
+    def expression_gas(self, nodes, written=(), read_modify_write=False, counts=None):
+        """
+        Gas of the storage accesses, calls and creates in a set of expression nodes.
+        The operation counts are added to counts when given.
+        """
+        local = new_counts()
+        gas = 0
+        for root in nodes:
+            for node in root.get_descendants(include_self=True):
+                if self.is_storage(node):
+                    if id(node) in written:
+                        local["sstores"] += 1
+                        if read_modify_write:
+                            local["sloads"] += 1
+                    elif not self._is_array_method_base(node):
+                        local["sloads"] += 1
+                elif isinstance(node, (vy_ast.ExtCall, vy_ast.StaticCall)):
+                    local["external_calls"] += 1
+                elif isinstance(node, vy_ast.Call):
+                    gas += self._call_gas(node, local)
+        gas += (
+            local["sloads"] * GAS_MODEL["sload"]
+            + local["sstores"] * GAS_MODEL["sstore"]
+            + local["external_calls"] * GAS_MODEL["external_call"]
+        )
+        if counts is not None:
+            for key, value in local.items():
+                counts[key] += value
+        return gas
+
+    def _is_array_method_base(self, node):
+        """Whether the storage node is the base of self.x.append()/pop() (priced by _call_gas)."""
+        parent = node.get_ancestor()
+        return (
+            isinstance(parent, vy_ast.Attribute)
+            and parent.attr in ARRAY_WRITE_METHODS
+            and isinstance(parent.get_ancestor(), vy_ast.Call)
+        )
+
+    def _call_gas(self, call, counts):
+        func = call.func
+        if isinstance(func, vy_ast.Name):
+            if func.id in EXTERNAL_CALL_BUILTINS:
+                counts["external_calls"] += 1
+            elif func.id in CREATE_BUILTINS:
+                return GAS_MODEL["create"]
+            return 0
+        if not isinstance(func, vy_ast.Attribute):
+            return 0
+        if isinstance(func.value, vy_ast.Name) and func.value.id == "self" and func.attr in self.functions:
+            counts["internal_calls"].append(func.attr)
+            return self.function_gas(func.attr)["worst_case_gas"]
+        if func.attr in ARRAY_WRITE_METHODS:
+            base = func.value
+            while isinstance(base, vy_ast.Subscript):
+                base = base.value
+            if self.is_storage(base):
+                sloads, sstores = ARRAY_WRITE_METHODS[func.attr]
+                counts["sloads"] += sloads
+                counts["sstores"] += sstores
+        return 0
+
+    def _storage_targets(self, target):
+        """Storage nodes written by an assignment target (tuples unpack to several)."""
+        targets = target.elements if isinstance(target, vy_ast.Tuple) else [target]
+        written = set()
+        for node in targets:
+            while isinstance(node, (vy_ast.Subscript, vy_ast.Attribute)) and not self.is_storage(node):
+                node = node.value
+            if self.is_storage(node):
+                written.add(id(node))
+        return written
+
+    def block_gas(self, statements, fn, loops, depth=0, counts=None):
+        """
+        Worst-case gas of a statement list, appending a record for every loop found.
+        Operation counts outside nested loops are added to counts when given.
+        """
+        gas = 0
+        for statement in statements:
+            if isinstance(statement, vy_ast.For):
+                gas += self.loop_gas(statement, fn, loops, depth)
+            elif isinstance(statement, vy_ast.If):
+                gas += self.expression_gas([statement.test], counts=counts) + max(
+                    self.block_gas(statement.body, fn, loops, depth, counts),
+                    self.block_gas(statement.orelse, fn, loops, depth, counts),
+                )
+            elif isinstance(statement, vy_ast.Log):
+                gas += self.expression_gas([statement.value], counts=counts) + GAS_MODEL["log"]
+            elif isinstance(statement, (vy_ast.Assign, vy_ast.AugAssign)):
+                gas += self.expression_gas(
+                    [statement.target, statement.value],
+                    self._storage_targets(statement.target),
+                    read_modify_write=isinstance(statement, vy_ast.AugAssign),
+                    counts=counts,
+                )
+            else:
+                gas += self.expression_gas([statement], counts=counts)
+        return gas
+
+    def loop_gas(self, loop, fn, loops, depth):
+        bound, bound_source, iterates_storage = self.loop_bound(loop, fn)
+        # The iterable (e.g. len(self.x)) is evaluated once, before the first iteration
+        header_gas = GAS_MODEL["sload"] if iterates_storage else self.expression_gas([loop.iter])
+
+        nested = []
+        counts = new_counts()
+        body_gas = self.block_gas(loop.body, fn, nested, depth + 1, counts)
+        if iterates_storage:
+            # Every iteration loads the next element
+            counts["sloads"] += 1
+            body_gas += GAS_MODEL["sload"]
+        per_iteration = GAS_MODEL["iteration_overhead"] + body_gas
+        worst_case = header_gas + per_iteration * (bound or 0)
+
+        loops.append({
+            "line": loop.lineno,
+            "depth": depth,
+            "bound": bound,
+            "bound_source": bound_source,
+            "iterates_storage": iterates_storage,
+            "sloads_per_iteration": counts["sloads"],
+            "sstores_per_iteration": counts["sstores"],
+            "external_calls_per_iteration": counts["external_calls"],
+            "internal_calls": sorted(set(counts["internal_calls"])),
+            "per_iteration_gas": per_iteration,
+            "worst_case_gas": worst_case,
+        })
+        loops.extend(nested)
+        return worst_case
+
+    def function_gas(self, name):
+        """Worst-case gas and loop records of a function (internal callees are memoized)."""
+        if name not in self.results:
+            fn = self.functions[name]
+            loops = []
+            worst_case = self.block_gas(fn.body, fn, loops)
+            self.results[name] = {
+                "decorators": [d.id for d in fn.decorator_list if isinstance(d, vy_ast.Name)],
+                "line": fn.lineno,
+                "loops": sorted(loops, key=lambda loop: loop["line"]),
+                "worst_case_gas": worst_case,
+            }
+        return self.results[name]
+
+
+def new_counts():
+    return {"sloads": 0, "sstores": 0, "external_calls": 0, "internal_calls": []}
+
+
+def analyze_contract(path, block_gas_limit=DEFAULT_BLOCK_GAS_LIMIT):
+    """
+    Analyze one .vy file.
+
+    Returns:
+        dict: Function name -> worst-case report, only functions that contain or call a loop
+    """
+    analysis = ContractAnalysis(path.stem, parse_to_ast(path.read_text()))
+    functions = {}
+    for name in analysis.functions:
+        result = analysis.function_gas(name)
+        if not result["loops"] and not _calls_loop(analysis, name):
+            continue
+        functions[name] = dict(result, exceeds_block_gas_limit=result["worst_case_gas"] > block_gas_limit)
+    return functions
+
+
+def _calls_loop(analysis, name, seen=None):
+    seen = seen or set()
+    seen.add(name)
+    for call in analysis.functions[name].get_descendants(vy_ast.Call):
+        func = call.func
+        if isinstance(func, vy_ast.Attribute) and isinstance(func.value, vy_ast.Name) and func.value.id == "self":
+            callee = func.attr
+            if callee in analysis.functions and callee not in seen:
+                if analysis.function_gas(callee)["loops"] or _calls_loop(analysis, callee, seen):
+                    return True
+    return False
+
+
+def analyze_contracts(contracts_dir=CONTRACTS_DIR, block_gas_limit=DEFAULT_BLOCK_GAS_LIMIT):
+    """
+    Analyze every contract in contracts_dir.
+
+    Returns:
+        dict: The full report (gas model, per-contract functions and the flagged function list)
+    """
+    contracts = {}
+    flagged = []
+    for path in sorted(Path(contracts_dir).glob("*.vy")):
+        functions = analyze_contract(path, block_gas_limit)
+        contracts[path.stem] = functions
+        flagged.extend(f"{path.stem}.{name}" for name, result in functions.items() if result["exceeds_block_gas_limit"])
+    return {
+        "block_gas_limit": block_gas_limit,
+        "gas_model": GAS_MODEL,
+        "contracts": contracts,
+        "flagged": sorted(flagged),
+    }
+
+
+def write_report(report, output=DEFAULT_OUTPUT):
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def print_summary(report):
+    """Print the flagged functions with their worst case and the loop that dominates it."""
+    limit = report["block_gas_limit"]
+    print(f"[{datetime.now()}] {len(report['flagged'])} functions can exceed the {limit:,} block gas limit")
+    for qualified_name in report["flagged"]:
+        contract, function = qualified_name.split(".", 1)
+        result = report["contracts"][contract][function]
+        worst_loop = max(result["loops"], key=lambda loop: loop["worst_case_gas"], default=None)
+        detail = ""
+        if worst_loop:
+            detail = f" (line {worst_loop['line']}: {worst_loop['bound']:,} x {worst_loop['per_iteration_gas']:,} gas)" if worst_loop["bound"] else f" (line {worst_loop['line']})"
+        print(f"  {qualified_name}: {result['worst_case_gas']:,} gas{detail}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate worst-case loop gas of the Vyper contracts")
+    parser.add_argument('--contracts-dir', default=str(CONTRACTS_DIR), help='Directory with the .vy files')
+    parser.add_argument('--output', default=str(DEFAULT_OUTPUT), help='Path of the JSON report')
+    parser.add_argument('--block-gas-limit', type=int, default=DEFAULT_BLOCK_GAS_LIMIT, help='Gas limit to flag functions against')
+    parser.add_argument('--fail-on-flagged', action='store_true', help='Exit with status 1 if any function is flagged')
+    args = parser.parse_args()
+
+    report = analyze_contracts(args.contracts_dir, args.block_gas_limit)
+    write_report(report, args.output)
+    print(f"[{datetime.now()}] Wrote loop cost report to {args.output}")
+    print_summary(report)
+    if args.fail_on_flagged and report["flagged"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# Bulk state seeding through direct storage writes (anvil_setStorageAt)
+#
+# Building 10k+ entry lists with real transactions takes far too long for tests and benchmarks.
+# This utility reads the vyper storage layout of a contract and writes the storage words of its
+# lists directly: the DynArray length and elements, the count variable and the
+# ExistsAndPositionOffsetByOne map (or registry) that the contracts keep next to each list.
+#
+# Seeded entries are plain addresses: views that only read the lists (pagination, counts,
+# position lookups) work on them, anything that calls into an entry needs a real contract there.
+#
+# Storage rules (vyper 0.4):
+#   - a variable starts at its layout slot, a DynArray keeps its length there and element i at slot + 1 + i
+#   - HashMap[k, v] at slot p keeps the value for key k at keccak256(p ++ k)
+#
+# Usage (from a test or benchmark connected to anvil or the in-process ape test provider):
+#   from storage_seeder import StorageSeeder, seed_addresses
+#   seeder = StorageSeeder(provider, hub.address, "ArtCommissionHub")
+#   seeder.seed_list("verifiedArtCommissions", seed_addresses(100_000))
+#
+#   python scripts/storage_seeder.py --network ethereum:local:foundry --contract ArtCommissionHub \
+#       --address 0x... --list verifiedArtCommissions --count 100000
+
+import argparse
+import json
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+
+from ape import networks
+from eth_utils import keccak, to_bytes, to_checksum_address
+
+CONTRACTS_DIR = Path(__file__).parent.parent / "contracts"
+DEFAULT_NETWORK = "ethereum:local:foundry"
+BATCH_SIZE = 1000
+
+# Bookkeeping the contracts keep next to each list: the count variable, the 1-based position map
+# and/or the membership registry. Keyed lists (HashMap[key, DynArray]) take the key as well.
+LIST_LAYOUTS = {
+    "Profile": {
+        "myArt": {"count": "myArtCount", "positions": "myArtExistsAndPositionOffsetByOne"},
+        "myCommissions": {"count": "myCommissionCount", "positions": "myCommissionExistsAndPositionOffsetByOne"},
+        "myUnverifiedCommissions": {
+            "count": "myUnverifiedCommissionCount",
+            "positions": "myUnverifiedCommissionsExistsAndPositionOffsetByOne",
+        },
+    },
+    "ArtSales1155": {
+        "artistErc1155sToSell": {
+            "count": "artistErc1155sToSellCount",
+            "positions": "artistErc1155sToSellExistsAndPositionOffsetByOne",
+        },
+        "collectorErc1155s": {"count": "collectorErc1155Count", "positions": "collectorErc1155sExistsAndPositionOffsetByOne"},
+    },
+    "ArtCommissionHub": {
+        "verifiedArtCommissions": {"count": "countVerifiedArtCommissions", "registry": "verifiedArtCommissionsRegistry"},
+        "unverifiedArtCommissions": {"count": "countUnverifiedArtCommissions", "registry": "unverifiedArtCommissionsRegistry"},
+    },
+    "ArtCommissionHubOwners": {
+        "artCommissionHubsByOwner": {
+            "count": "artCommissionHubsByOwnerCount",
+            "positions": "artCommissionHubsByOwnerIndexOffsetByOne",
+        },
+    },
+    "ProfileFactoryAndRegistry": {
+        "allUserProfiles": {"count": "allUserProfilesCount"},
+        "activeUsersWithCommissions": {"count": "activeUsersWithCommissionsCount"},
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def storage_layout(contract_name):
+    """
+    Storage layout of a contract from the vyper compiler.
+
+    Returns:
+        dict: Variable name -> {"type", "slot", "n_slots"}
+    """
+    result = subprocess.run(
+        ["vyper", "-f", "layout", str(CONTRACTS_DIR / f"{contract_name}.vy")],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(result.stdout)["storage_layout"]
+
+
+def encode_word(value):
+    """32-byte big endian encoding of an address, int, bool or bytes value."""
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, str):
+        value = int(value, 16)
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value).rjust(32, b"\0")
+    return value.to_bytes(32, "big")
+
+
+def hashmap_slot(slot, key):
+    """Slot of HashMap[key] for a HashMap whose base slot is slot."""
+    return int.from_bytes(keccak(encode_word(slot) + encode_word(key)), "big")
+
+
+def variable_slot(contract_name, variable, keys=()):
+    """Base slot of a variable, following HashMap keys for keyed variables."""
+    layout = storage_layout(contract_name)
+    if variable not in layout:
+        raise KeyError(f"{contract_name} has no storage variable '{variable}'")
+    slot = layout[variable]["slot"]
+    for key in keys:
+        slot = hashmap_slot(slot, key)
+    return slot
+
+
+def list_storage_words(contract_name, list_name, values, keys=(), start_index=0):
+    """
+    Storage words that make values the contents of a list, starting at start_index.
+
+    Writes the DynArray length and elements, the count variable and the position map or
+    registry of the list (see LIST_LAYOUTS).
+
+    Returns:
+        dict: Slot -> 32-byte word
+    """
+    spec = LIST_LAYOUTS.get(contract_name, {}).get(list_name)
+    if spec is None:
+        raise KeyError(f"No list layout for {contract_name}.{list_name}, add it to LIST_LAYOUTS")
+
+    length = start_index + len(values)
+    base = variable_slot(contract_name, list_name, keys)
+    words = {base: encode_word(length)}
+    for offset, value in enumerate(values):
+        words[base + 1 + start_index + offset] = encode_word(value)
+
+    if "count" in spec:
+        words[variable_slot(contract_name, spec["count"], keys)] = encode_word(length)
+    if "positions" in spec:
+        positions = variable_slot(contract_name, spec["positions"], keys)
+        for offset, value in enumerate(values):
+            words[hashmap_slot(positions, value)] = encode_word(start_index + offset + 1)
+    if "registry" in spec:
+        registry = variable_slot(contract_name, spec["registry"], keys)
+        for value in values:
+            words[hashmap_slot(registry, value)] = encode_word(True)
+    return words
+
+
+def seed_addresses(count, seed=1):
+    """Deterministic distinct non-zero addresses for seeded entries."""
+    return [to_checksum_address(f"0x{(seed << 128) + i + 1:040x}") for i in range(count)]
+
+
+class StorageSeeder:
+    """
+    Writes storage words of one deployed contract through anvil_setStorageAt, in JSON-RPC batches.
+    On the in-process ape test provider (no anvil RPCs) the words go straight into the py-evm state.
+    """
+
+    def __init__(self, provider, address, contract_name, batch_size=BATCH_SIZE):
+        self.provider = provider
+        self.address = to_checksum_address(str(address))
+        self.contract_name = contract_name
+        self.batch_size = batch_size
+
+    def _write_words_to_evm_backend(self, words):
+        """Write slot -> word pairs into the py-evm state of the ape test provider and mine them in."""
+        backend = self.provider.evm_backend
+        state = backend.chain.get_vm().state
+        address = to_bytes(hexstr=self.address)
+        for slot, word in words.items():
+            state.set_storage(address, slot, int.from_bytes(word, "big"))
+        state.persist()
+        backend.chain.header = backend.chain.header.copy(state_root=state.state_root)
+        backend.mine_blocks()
+        return len(words)
+
+    def write_words(self, words):
+        """Write slot -> word pairs, batched when the underlying web3 provider supports it."""
+        if getattr(self.provider, "evm_backend", None) is not None:
+            return self._write_words_to_evm_backend(words)
+        requests = [
+            ("anvil_setStorageAt", [self.address, hex(slot), "0x" + word.hex()])
+            for slot, word in sorted(words.items())
+        ]
+        web3_provider = self.provider.web3.provider
+        if hasattr(web3_provider, "make_batch_request"):
+            for i in range(0, len(requests), self.batch_size):
+                responses = web3_provider.make_batch_request(requests[i:i + self.batch_size])
+                errors = [r["error"] for r in responses if isinstance(r, dict) and r.get("error")]
+                if errors:
+                    raise RuntimeError(f"anvil_setStorageAt failed: {errors[0]}")
+        else:
+            for method, params in requests:
+                self.provider.make_request(method, params)
+        return len(requests)
+
+    def set_variable(self, variable, value, keys=()):
+        """Overwrite a single word variable (or a HashMap entry with keys)."""
+        return self.write_words({variable_slot(self.contract_name, variable, keys): encode_word(value)})
+
+    def seed_list(self, list_name, values, keys=(), start_index=0):
+        """
+        Make values the contents of a list (from start_index on) with its count and position map.
+        Pass keys for keyed lists, e.g. keys=[owner] for ArtCommissionHubOwners.artCommissionHubsByOwner.
+
+        Returns:
+            int: Number of storage words written
+        """
+        return self.write_words(list_storage_words(self.contract_name, list_name, values, keys, start_index))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed a contract list through direct storage writes on anvil")
+    parser.add_argument('--network', default=DEFAULT_NETWORK, help='Ape network choice of the anvil node')
+    parser.add_argument('--contract', required=True, choices=sorted(LIST_LAYOUTS), help='Contract type')
+    parser.add_argument('--address', required=True, help='Deployed contract address')
+    parser.add_argument('--list', required=True, help='List variable to seed, e.g. verifiedArtCommissions')
+    parser.add_argument('--count', type=int, required=True, help='Number of entries to seed')
+    parser.add_argument('--key', help='HashMap key for keyed lists (e.g. the owner address)')
+    parser.add_argument('--seed', type=int, default=1, help='Seed of the generated entry addresses')
+    args = parser.parse_args()
+
+    with networks.parse_network_choice(args.network) as provider:
+        seeder = StorageSeeder(provider, args.address, args.contract)
+        keys = [args.key] if args.key else []
+        written = seeder.seed_list(args.list, seed_addresses(args.count, args.seed), keys)
+        print(f"Seeded {args.count:,} entries into {args.contract}.{args.list} ({written:,} storage words)")
+
+
+if __name__ == "__main__":
+    main()
@@ -259,7 +259,7 @@ const MintArtEdition: React.FC<MintArtEditionProps> = ({
       }
 
       // Load ArtSales1155 ABI
-      const artSalesAbi = abiLoader.loadABI('ArtSales1155');
+      const artSalesAbi = await abiLoader.loadABIAsync('ArtSales1155');
       if (!artSalesAbi) {
         throw new Error("ArtSales1155 ABI not found");
       }
@@ -291,7 +291,7 @@ const MintArtEdition: React.FC<MintArtEditionProps> = ({
       console.log('[MintArtEdition] Sale info from ArtSales1155:', {saleType, mintPrice: mintPrice.toString(), currentSupply, maxSupply, isPaused, currentPhase});
 
       // Load ArtEdition1155 ABI to get edition details
-      const artEditionAbi = abiLoader.loadABI('ArtEdition1155');
+      const artEditionAbi = await abiLoader.loadABIAsync('ArtEdition1155');
       if (!artEditionAbi) {
         throw new Error("ArtEdition1155 ABI not found");
       }
@@ -385,7 +385,7 @@ const MintArtEdition: React.FC<MintArtEditionProps> = ({
         throw new Error("No provider available");
       }
 
-      const artEditionAbi = abiLoader.loadABI('ArtEdition1155');
+      const artEditionAbi = await abiLoader.loadABIAsync('ArtEdition1155');
       if (!artEditionAbi) {
         throw new Error("ArtEdition1155 ABI not found");
       }
@@ -429,7 +429,7 @@ const MintArtEdition: React.FC<MintArtEditionProps> = ({
       const provider = ethersService.getProvider();
       if (!provider) throw new Error("No provider available");
 
-      const artEditionAbi = abiLoader.loadABI('ArtEdition1155');
+      const artEditionAbi = await abiLoader.loadABIAsync('ArtEdition1155');
       if (!artEditionAbi) throw new Error("ArtEdition1155 ABI not found");
 
       const editionContract = new ethers.Contract(erc1155Address, artEditionAbi, provider);
@@ -552,7 +552,7 @@ const MintArtEdition: React.FC<MintArtEditionProps> = ({
       }
 
       // Load ArtEdition1155 ABI for minting
-      const artEditionAbi = abiLoader.loadABI('ArtEdition1155');
+      const artEditionAbi = await abiLoader.loadABIAsync('ArtEdition1155');
       if (!artEditionAbi) {
         throw new Error("ArtEdition1155 ABI not found");
       }
@@ -941,7 +941,7 @@ const MintArtEdition: React.FC<MintArtEditionProps> = ({
       console.log('[MintArtEdition] Signer network:', signerChainId, signerNetwork.name);
 
       // Load ArtSales1155 ABI for sale management
-      const artSalesAbi = abiLoader.loadABI('ArtSales1155');
+      const artSalesAbi = await abiLoader.loadABIAsync('ArtSales1155');
       if (!artSalesAbi) {
         throw new Error("ArtSales1155 ABI not found");
       }
@@ -365,7 +365,7 @@ const Account: React.FC = () => {
           // Create contract instance for the profile image art piece
           const artPieceContract = new ethers.Contract(
             profileImageAddress,
-            abiLoader.loadABI('ArtPiece'),
+            await abiLoader.loadABIAsync('ArtPiece'),
             ethersService.getProvider()
           );
           
@@ -482,7 +482,7 @@ const Account: React.FC = () => {
           // Create contract instance
           const contract = new ethers.Contract(
             address,
-            abiLoader.loadABI('ArtPiece'),
+            await abiLoader.loadABIAsync('ArtPiece'),
             ethersService.getProvider()
           );
           
@@ -594,7 +594,7 @@ const Account: React.FC = () => {
       }
 
       // Load ArtSales1155 ABI
-      const artSalesAbi = abiLoader.loadABI('ArtSales1155');
+      const artSalesAbi = await abiLoader.loadABIAsync('ArtSales1155');
       if (!artSalesAbi) {
         console.error("checkActiveSales: ArtSales1155 ABI not found");
         return;
@@ -218,7 +218,7 @@ const L1OwnerUpdateRequest: React.FC<L1OwnerUpdateRequestProps> = ({
 
       // Use the ABI name from the config
       const abiName = contractConfig.abiFiles.l1;
-      const abi = abiLoader.loadABI(abiName);
+      const abi = await abiLoader.loadABIAsync(abiName);
       if (!abi) {
         setBridgeStatus(`Failed to load ABI: ${abiName}`);
         return null;
@@ -89,7 +89,7 @@ const L2OwnershipRelayManager: React.FC<L2OwnershipRelayManagerProps> = ({ setBr
       console.log(`[L2OwnershipRelayManager] Fetching contract data for chain ID ${chainId}...`);
       if (isConnected && l2OwnershipRelayAddress && ethers.isAddress(l2OwnershipRelayAddress) && window.ethereum) {
         const provider = new ethers.BrowserProvider(window.ethereum);
-        const L2OwnershipRelayABI = abiLoader.loadABI('L2OwnershipRelay');
+        const L2OwnershipRelayABI = await abiLoader.loadABIAsync('L2OwnershipRelay');
         if (!L2OwnershipRelayABI) {
           throw new Error('Failed to load L2OwnershipRelay ABI');
         }
@@ -172,7 +172,7 @@ const L2OwnershipRelayManager: React.FC<L2OwnershipRelayManagerProps> = ({ setBr
           const network = await provider.getNetwork();
           console.log(`[L2OwnershipRelayManager] Connected to network: ${network.name} (chainId: ${network.chainId})`);
           
-          const L2OwnershipRelayABI = abiLoader.loadABI('L2OwnershipRelay');
+          const L2OwnershipRelayABI = await abiLoader.loadABIAsync('L2OwnershipRelay');
           if (!L2OwnershipRelayABI) {
             throw new Error('Failed to load L2OwnershipRelay ABI');
           }
@@ -309,7 +309,7 @@ const L2OwnershipRelayManager: React.FC<L2OwnershipRelayManagerProps> = ({ setBr
         const signer = await provider.getSigner();
 
         // Load ABI and create contract instance
-        const L2OwnershipRelayABI = abiLoader.loadABI('L2OwnershipRelay');
+        const L2OwnershipRelayABI = await abiLoader.loadABIAsync('L2OwnershipRelay');
         if (!L2OwnershipRelayABI) {
           throw new Error('Failed to load L2OwnershipRelay ABI');
         }
@@ -419,7 +419,7 @@ const L2OwnershipRelayManager: React.FC<L2OwnershipRelayManagerProps> = ({ setBr
         const signer = await provider.getSigner();
 
         // Load ABI and create contract instance
-        const L2OwnershipRelayABI = abiLoader.loadABI('L2OwnershipRelay');
+        const L2OwnershipRelayABI = await abiLoader.loadABIAsync('L2OwnershipRelay');
         if (!L2OwnershipRelayABI) {
           throw new Error('Failed to load L2OwnershipRelay ABI');
         }
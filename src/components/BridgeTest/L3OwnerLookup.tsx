@@ -219,7 +219,7 @@ const L3OwnerLookup: React.FC<L3OwnerLookupProps> = ({
       }
       
       // Load ABI from JSON file
-      const artCommissionHubOwnersABI = abiLoader.loadABI('ArtCommissionHubOwners');
+      const artCommissionHubOwnersABI = await abiLoader.loadABIAsync('ArtCommissionHubOwners');
       if (!artCommissionHubOwnersABI) {
         throw new Error('Failed to load ArtCommissionHubOwners ABI');
       }
@@ -325,7 +325,7 @@ const L3OwnerLookup: React.FC<L3OwnerLookupProps> = ({
       }
       
       // Load ABI from JSON file
-      const artCommissionHubOwnersABI = abiLoader.loadABI('ArtCommissionHubOwners');
+      const artCommissionHubOwnersABI = await abiLoader.loadABIAsync('ArtCommissionHubOwners');
       if (!artCommissionHubOwnersABI) {
         throw new Error('Failed to load ArtCommissionHubOwners ABI');
       }
@@ -513,7 +513,7 @@ const L3OwnerLookup: React.FC<L3OwnerLookupProps> = ({
       // Load ABI for ArtCommissionHubOwners
       let artCommissionHubOwnersABI;
       try {
-        artCommissionHubOwnersABI = abiLoader.loadABI('ArtCommissionHubOwners');
+        artCommissionHubOwnersABI = await abiLoader.loadABIAsync('ArtCommissionHubOwners');
       } catch (error) {
         console.log('Could not load ArtCommissionHubOwners ABI, using minimal ABI with setL2OwnershipRelay');
         artCommissionHubOwnersABI = [
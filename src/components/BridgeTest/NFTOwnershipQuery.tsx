@@ -121,7 +121,7 @@ const NFTOwnershipQuery: React.FC<NFTOwnershipQueryProps> = ({
       }
       
       // Load the L2OwnershipRelay ABI
-      const l2OwnershipRelayABI = abiLoader.loadABI('L2OwnershipRelay');
+      const l2OwnershipRelayABI = await abiLoader.loadABIAsync('L2OwnershipRelay');
       if (!l2OwnershipRelayABI) {
         setBridgeStatus('Error: Could not load L2OwnershipRelay ABI');
         return;
@@ -267,7 +267,7 @@ const NFTOwnershipQuery: React.FC<NFTOwnershipQueryProps> = ({
       const signer = await provider.getSigner();
       
       // Load the L2OwnershipRelay ABI
-      const l2OwnershipRelayABI = abiLoader.loadABI('L2OwnershipRelay');
+      const l2OwnershipRelayABI = await abiLoader.loadABIAsync('L2OwnershipRelay');
       if (!l2OwnershipRelayABI) {
         setBridgeStatus('Error: Could not load L2OwnershipRelay ABI');
         setNftQuery(prev => ({ ...prev, isSubmitting: false }));
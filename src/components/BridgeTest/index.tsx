@@ -235,7 +235,7 @@ const BridgeTestContainer: React.FC = () => {
   });
   
   // Selected ABI objects based on contract type
-  const [selectedABI, setSelectedABI] = useState<any>(abiLoader.loadABI('L1QueryOwnership'));
+  const [selectedABI, setSelectedABI] = useState<any>(null);
   
   // Available ABI names
   const [availableAbis, setAvailableAbis] = useState<string[]>(abiLoader.getAvailableABIs());
@@ -348,47 +348,51 @@ const BridgeTestContainer: React.FC = () => {
   
   // Update selected ABI when layer or ABI file changes
   useEffect(() => {
-    try {
-      // Safely access the ABI file name with fallbacks
-      const abiFileName = contractConfig?.abiFiles?.[layer] || 'L1QueryOwnership';
+    const loadSelectedABI = async () => {
+      try {
+        // Safely access the ABI file name with fallbacks
+        const abiFileName = contractConfig?.abiFiles?.[layer] || 'L1QueryOwnership';
       
-      console.log(`Loading ABI for ${layer}: ${abiFileName}`);
-      const abi = abiLoader.loadABI(abiFileName);
+        console.log(`Loading ABI for ${layer}: ${abiFileName}`);
+        const abi = await abiLoader.loadABIAsync(abiFileName);
       
-      if (abi) {
-        setSelectedABI(abi);
+        if (abi) {
+          setSelectedABI(abi);
         
-        // Get method names for this ABI
-        const methods = abiLoader.getMethodNames(abiFileName);
-        setMethodNames(methods);
+          // Get method names for this ABI
+          const methods = abiLoader.getMethodNames(abiFileName);
+          setMethodNames(methods);
         
-        // Show available methods
-        const methodsStr = methods.join(', ');
-        setBridgeStatus(prev => {
-          // Keep connection status if it exists
-          if (prev.includes('Connected to')) {
-            return `${prev}\n\nSelected ABI: ${abiFileName}\nAvailable methods: ${methodsStr}`;
-          }
-          return `Selected ABI: ${abiFileName}\nAvailable methods: ${methodsStr}`;
-        });
-      } else {
+          // Show available methods
+          const methodsStr = methods.join(', ');
+          setBridgeStatus(prev => {
+            // Keep connection status if it exists
+            if (prev.includes('Connected to')) {
+              return `${prev}\n\nSelected ABI: ${abiFileName}\nAvailable methods: ${methodsStr}`;
+            }
+            return `Selected ABI: ${abiFileName}\nAvailable methods: ${methodsStr}`;
+          });
+        } else {
+          setBridgeStatus(prev => {
+            // Keep connection status if it exists
+            if (prev.includes('Connected to')) {
+              return `${prev}\n\nError: Could not load ABI for ${abiFileName}`;
+            }
+            return `Error: Could not load ABI for ${abiFileName}`;
+          });
+        }
+      } catch (error) {
+        console.error("Error loading ABI:", error);
         setBridgeStatus(prev => {
-          // Keep connection status if it exists
           if (prev.includes('Connected to')) {
-            return `${prev}\n\nError: Could not load ABI for ${abiFileName}`;
+            return `${prev}\n\nError loading ABI: ${error instanceof Error ? error.message : String(error)}`;
           }
-          return `Error: Could not load ABI for ${abiFileName}`;
+          return `Error loading ABI: ${error instanceof Error ? error.message : String(error)}`;
         });
       }
-    } catch (error) {
-      console.error("Error loading ABI:", error);
-      setBridgeStatus(prev => {
-        if (prev.includes('Connected to')) {
-          return `${prev}\n\nError loading ABI: ${error instanceof Error ? error.message : String(error)}`;
-        }
-        return `Error loading ABI: ${error instanceof Error ? error.message : String(error)}`;
-      });
-    }
+    };
+    
+    loadSelectedABI();
   }, [layer, contractConfig.abiFiles]);
   
   // Handle contract address changes
@@ -42,7 +42,7 @@ const L2OwnershipRelayTester: React.FC = () => {
   const [relayContractAddress, setRelayContractAddress] = useState<string>(CONTRACT_ADDRESSES.testnet.l2OwnershipRelay);
   const [txStatus, setTxStatus] = useState<string>("");
   const [txHash, setTxHash] = useState<string>("");
-  const [ethValue, setEthValue] = useState<string>("0.01"); // Default ETH value for relayToL3
+  const [ethValue, setEthValue] = useState<string>("0.0112"); // Default fees of relayToL3: 0.01 ETH + 600k gas at 2 gwei
   const [activeTab, setActiveTab] = useState<'receive' | 'relay'>('receive');
   const [gasEstimates, setGasEstimates] = useState<L3GasEstimates | null>(null);
   const [useEstimatedGas, setUseEstimatedGas] = useState<boolean>(true);
@@ -38,13 +38,7 @@ const abiMap: { [key: string]: any } = {
   'ZZ_TestL3ReceiveMessage': ZZ_TestL3ReceiveMessageABI,
 };
 
-/**
- * Get the list of available ABI names
- * @returns Array of available ABI names
- */
-export const getAvailableABIs = (): string[] => {
-  return Object.keys(abiMap);
-};
+const abiNames = Object.keys(abiMap);
 
 /**
  * Load an ABI by name
@@ -60,6 +54,29 @@ export const loadABI = (abiName: string): any => {
   return abiMap[abiName];
 };
 
+/**
+ * Load an ABI by name (same API as the lazy loader, the ABIs are already imported)
+ * @param abiName Name of the ABI to load
+ * @returns The ABI object or null if not found
+ */
+export const loadABIAsync = async (abiName: string): Promise<any> => loadABI(abiName);
+
+/**
+ * Get the list of available ABI names
+ * @returns Array of available ABI names
+ */
+export const getAvailableABIs = (): string[] => {
+  return [...abiNames];
+};
+
+/**
+ * Load the ABIs a screen needs ahead of synchronous loadABI / getMethodNames calls
+ * @param names Names of the ABIs to load
+ */
+export const preloadABIs = async (names: string[]): Promise<void> => {
+  await Promise.all(names.map(loadABIAsync));
+};
+
 /**
  * Get the human-readable method names from an ABI
  * @param abiName Name of the ABI to analyze
@@ -77,7 +94,7 @@ export const getMethodNames = (abiName: string): string[] => {
 /**
  * Find ABIs that have a specific method
  * @param methodName Method name to search for
- * @returns Array of ABI names that contain the method
+ * @returns Array of (loaded) ABI names that contain the method
  */
 export const findABIsWithMethod = (methodName: string): string[] => {
   return Object.keys(abiMap).filter(abiName => {
@@ -91,6 +108,8 @@ export const findABIsWithMethod = (methodName: string): string[] => {
 export default {
   getAvailableABIs,
   loadABI,
+  loadABIAsync,
+  preloadABIs,
   getMethodNames,
   findABIsWithMethod
 }; 
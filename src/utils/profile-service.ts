@@ -23,7 +23,7 @@ class ProfileService {
         return false;
       }
       
-      const hubAbi = abiLoader.loadABI('ProfileFactoryAndRegistry');
+      const hubAbi = await abiLoader.loadABIAsync('ProfileFactoryAndRegistry');
       
       if (!hubAbi) {
         console.error("ProfileFactoryAndRegistry ABI not found");
@@ -56,7 +56,7 @@ class ProfileService {
         throw new Error("ProfileFactoryAndRegistry address not configured in contract_config.json");
       }
       
-      const hubAbi = abiLoader.loadABI('ProfileFactoryAndRegistry');
+      const hubAbi = await abiLoader.loadABIAsync('ProfileFactoryAndRegistry');
       
       if (!hubAbi) {
         throw new Error("ProfileFactoryAndRegistry ABI not found");
@@ -115,7 +115,7 @@ class ProfileService {
         return null;
       }
       
-      const hubAbi = abiLoader.loadABI('ProfileFactoryAndRegistry');
+      const hubAbi = await abiLoader.loadABIAsync('ProfileFactoryAndRegistry');
       
       if (!hubAbi) {
         console.error("ProfileFactoryAndRegistry ABI not found");
@@ -158,7 +158,7 @@ class ProfileService {
         return null;
       }
 
-      const profileAbi = abiLoader.loadABI('Profile');
+      const profileAbi = await abiLoader.loadABIAsync('Profile');
       if (!profileAbi) {
         throw new Error("Profile ABI not found");
       }
@@ -176,7 +176,7 @@ class ProfileService {
    */
   public async getArtPieceAbi(): Promise<any> {
     try {
-      const artPieceAbi = abiLoader.loadABI('ArtPiece');
+      const artPieceAbi = await abiLoader.loadABIAsync('ArtPiece');
       if (!artPieceAbi) {
         throw new Error("ArtPiece ABI not found");
       }
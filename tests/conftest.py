@@ -0,0 +1,131 @@
+import gzip
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from ape import accounts, chain, project
+
+sys.path.append(str(Path(__file__).parent.parent / "scripts"))
+from benchmark_utils import deploy_local_system
+
+# Persisted chain state of the full-system deployment, keyed by a hash of all compiled bytecode.
+# On a node that supports anvil_dumpState / anvil_loadState (ape-foundry) the first run deploys
+# the system and dumps the node state; later runs with unchanged bytecode load it and skip the
+# deployment entirely. Other providers (the default EthTester) deploy once per session.
+CHAIN_STATE_DIR = Path(__file__).parent.parent / ".build" / "chain_state"
+# Bump when the deployment below changes without a bytecode change
+CHAIN_STATE_VERSION = 1
+
+# Node pool for pytest-xdist: every worker (gw0, gw1, ...) gets its own anvil process on its own port,
+# started by ape-foundry when the worker connects and reused by all modules the worker runs.
+# Each chain has its own funded copies of the test accounts, so workers never share nonces or state.
+NODE_POOL_BASE_PORT = int(os.environ.get("NODE_POOL_BASE_PORT", "8600"))
+
+# Contract type of every contract deploy_local_system returns, to reload them from a persisted state
+SYSTEM_CONTRACT_TYPES = {
+    "profile_template": "Profile",
+    "profile_social_template": "ProfileSocial",
+    "commission_hub_template": "ArtCommissionHub",
+    "art_edition_1155_template": "ArtEdition1155",
+    "art_sales_1155_template": "ArtSales1155",
+    "art_piece_template": "ArtPiece",
+    "profile_factory_and_registry": "ProfileFactoryAndRegistry",
+    "art_commission_hub_owners": "ArtCommissionHubOwners",
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-chain-state-cache",
+        action="store_true",
+        default=False,
+        help="Always deploy the system instead of loading a persisted chain state",
+    )
+
+
+def pytest_configure(config):
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    # An explicit APE_FOUNDRY_HOST wins (for example a node started by hand)
+    if worker and "APE_FOUNDRY_HOST" not in os.environ:
+        os.environ["APE_FOUNDRY_HOST"] = f"http://127.0.0.1:{worker_node_port(worker)}"
+
+
+def worker_node_port(worker):
+    """Port of the node owned by an xdist worker ("gw3" -> NODE_POOL_BASE_PORT + 3)."""
+    return NODE_POOL_BASE_PORT + int(worker.removeprefix("gw"))
+
+
+def chain_state_key(deployer):
+    """Hash of every compiled contract's bytecode, the deployer and the cache version."""
+    digest = hashlib.sha256(f"{CHAIN_STATE_VERSION}:{deployer.address}".encode())
+    for name in sorted(project.contracts.keys()):
+        contract_type = project.contracts[name]
+        for bytecode in (contract_type.deployment_bytecode, contract_type.runtime_bytecode):
+            digest.update(name.encode())
+            digest.update((bytecode.bytecode if bytecode and bytecode.bytecode else "").encode())
+    return digest.hexdigest()
+
+
+def _rpc(method, params):
+    """Call a node RPC method, None when the provider does not support it."""
+    try:
+        response = chain.provider.make_request(method, params)
+    except Exception:
+        return None
+    if isinstance(response, dict) and response.get("error"):
+        return None
+    return response
+
+
+def _load_chain_state(path):
+    """Load a dumped node state and return the deployed addresses, None if it can't be used."""
+    if not path.exists():
+        return None
+    with gzip.open(path, "rt") as f:
+        cached = json.load(f)
+    if _rpc("anvil_loadState", [cached["state"]]) is None:
+        return None
+    # The loaded accounts must have code, otherwise the node is not the one the state belongs to
+    if not chain.provider.get_code(cached["addresses"]["art_commission_hub_owners"]):
+        return None
+    return cached["addresses"]
+
+
+def _dump_chain_state(path, addresses):
+    state = _rpc("anvil_dumpState", [])
+    if state is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Several xdist workers can dump the same state at once, write to a worker file and rename
+    temporary_path = path.with_suffix(f".{os.environ.get('PYTEST_XDIST_WORKER', 'main')}.tmp")
+    with gzip.open(temporary_path, "wt") as f:
+        json.dump({"addresses": addresses, "state": state}, f)
+    temporary_path.replace(path)
+
+
+@pytest.fixture(scope="session")
+def deployed_system(request):
+    """
+    Full system deployed once per session by scripts/benchmark_utils.deploy_local_system (deployer is
+    test account 0, also the L2OwnershipRelay). Tests get a clean copy through ape's per-test chain
+    isolation. Only modules whose fixtures build on this one skip the deployment, the others still
+    deploy in their own fixtures.
+    """
+    deployer = accounts.test_accounts[0]
+    use_cache = not request.config.getoption("--no-chain-state-cache")
+    state_path = CHAIN_STATE_DIR / f"{chain_state_key(deployer)}.json.gz"
+
+    addresses = _load_chain_state(state_path) if use_cache else None
+    if addresses is not None:
+        return dict(
+            {key: getattr(project, SYSTEM_CONTRACT_TYPES[key]).at(address) for key, address in addresses.items()},
+            deployer=deployer,
+        )
+
+    system = deploy_local_system(deployer)
+    if use_cache:
+        _dump_chain_state(state_path, {key: system[key].address for key in SYSTEM_CONTRACT_TYPES})
+    return system
@@ -1,5 +1,5 @@
 import pytest
-from ape import accounts, project
+from ape import accounts, chain, project
 import time
 from eth_utils import to_checksum_address
 from eth_account import Account
@@ -533,4 +533,139 @@ def test_method_consistency(setup):
     # Test getArtPieceByIndex consistency
     for i in range(5):
         indexed_piece = commission_hub.getArtPieceByIndex(True, i)
-        assert indexed_piece == verified_pieces[i] 
\ No newline at end of file
+        assert indexed_piece == verified_pieces[i] 
+
+
+def test_verified_art_piece_summaries(setup):
+    """Test getVerifiedArtPieceSummaries returns ArtPiece.getSummary for a page of verified pieces"""
+    commission_hub = setup["commission_hub"]
+    assert len(commission_hub.getVerifiedArtPieceSummaries(0, 10)) == 0
+
+    art_pieces = [create_verified_art_piece(setup, setup["owner"], setup["artist"], f" Summary {i}") for i in range(3)]
+
+    # Summary matches the individual getters
+    art_piece = art_pieces[0]
+    summary = art_piece.getSummary()
+    assert summary.artPiece == art_piece.address
+    assert summary.title == art_piece.getTitle() == f"{TEST_TITLE} Summary 0"
+    assert summary.description == art_piece.getDescription()
+    assert summary.tokenURIDataFormat == art_piece.tokenURI_data_format()
+    assert summary.owner == art_piece.getOwner()
+    assert summary.artist == art_piece.getArtist()
+    assert summary.commissioner == art_piece.getCommissioner()
+    assert summary.artCommissionHub == commission_hub.address
+    assert summary.artistVerified == art_piece.artistVerified()
+    assert summary.commissionerVerified == art_piece.commissionerVerified()
+    assert summary.fullyVerifiedCommission == art_piece.fullyVerifiedCommission()
+    assert summary.isPrivateOrNonCommissionPiece == art_piece.isPrivateOrNonCommissionPiece()
+    assert summary.aiGenerated == art_piece.aiGenerated()
+
+    # Hub pages follow getVerifiedArtPiecesByOffset
+    summaries = commission_hub.getVerifiedArtPieceSummaries(1, 10)
+    assert [s.artPiece for s in summaries] == list(commission_hub.getVerifiedArtPiecesByOffset(1, 10))
+    assert [s.title for s in summaries] == [f"{TEST_TITLE} Summary 1", f"{TEST_TITLE} Summary 2"]
+    assert len(commission_hub.getVerifiedArtPieceSummaries(3, 10)) == 0
+
+
+def test_global_latest_verified_commissions(setup):
+    """Test hubs report verifications to the site-wide feed in ArtCommissionHubOwners"""
+    art_commission_hub_owners = setup["art_commission_hub_owners"]
+    commission_hub = setup["commission_hub"]
+    assert art_commission_hub_owners.isArtCommissionHub(commission_hub.address)
+    assert len(art_commission_hub_owners.getLatestVerifiedCommissions(0, 10)) == 0
+
+    # Auto-submitted (whitelisted) verification
+    verified = [create_verified_art_piece(setup, setup["owner"], setup["artist"], f" Feed {i}") for i in range(2)]
+    # Verification by the hub owner of an unverified submission
+    unverified = create_unverified_art_piece(setup, setup["owner"], setup["artist"], " Feed Unverified")
+    commission_hub.verifyCommission(unverified.address, sender=setup["owner"])
+
+    assert art_commission_hub_owners.latestVerifiedCommissionsCount() == 3
+    feed = art_commission_hub_owners.getLatestVerifiedCommissions(0, 10)
+    assert [entry.artPiece for entry in feed] == [unverified.address, verified[1].address, verified[0].address]
+    assert all(entry.hub == commission_hub.address for entry in feed)
+    assert feed[0].timestamp >= feed[1].timestamp >= feed[2].timestamp > 0
+
+    # Paging skips the newest entries
+    page = art_commission_hub_owners.getLatestVerifiedCommissions(1, 1)
+    assert [entry.artPiece for entry in page] == [verified[1].address]
+    assert len(art_commission_hub_owners.getLatestVerifiedCommissions(3, 10)) == 0
+
+    # Reports from anything other than a registered hub are ignored
+    art_commission_hub_owners.recordVerifiedCommission(verified[0].address, sender=setup["user"])
+    assert art_commission_hub_owners.latestVerifiedCommissionsCount() == 3
+
+
+def test_unverified_per_user_limit(setup):
+    """Test the hub owner can lower the per-submitter quota for the unverified queue"""
+    commission_hub = setup["commission_hub"]
+    artist = setup["artist"]
+    assert commission_hub.getUnverifiedPerUserLimit() == 500
+
+    with pytest.raises(Exception) as exc_info:
+        commission_hub.setUnverifiedPerUserLimit(2, sender=setup["user"])
+    assert "Not allowed to update" in str(exc_info.value)
+    with pytest.raises(Exception) as exc_info:
+        commission_hub.setUnverifiedPerUserLimit(501, sender=setup["owner"])
+    assert "Invalid limit" in str(exc_info.value)
+
+    commission_hub.setUnverifiedPerUserLimit(2, sender=setup["owner"])
+    assert commission_hub.getUnverifiedPerUserLimit() == 2
+
+    # Art pieces that submit themselves are charged to their artist
+    first = create_unverified_art_piece(setup, setup["user"], artist, " Quota 0")
+    create_unverified_art_piece(setup, setup["user"], artist, " Quota 1")
+    assert commission_hub.getUnverifiedCount(artist.address) == 2
+    assert commission_hub.unverifiedArtCommissionSubmitter(first.address) == artist.address
+
+    # Over quota, the hub rejects the submission (the art piece records the failure)
+    over_quota = create_unverified_art_piece(setup, setup["user"], artist, " Quota 2")
+    assert over_quota.getSubmissionStatus() == (True, False)
+    assert commission_hub.countUnverifiedArtCommissions() == 2
+
+    # Verifying frees the submitter's quota
+    commission_hub.verifyCommission(first.address, sender=setup["owner"])
+    assert commission_hub.getUnverifiedCount(artist.address) == 1
+    accepted = create_unverified_art_piece(setup, setup["user"], artist, " Quota 3")
+    assert accepted.getSubmissionStatus() == (True, True)
+    assert commission_hub.getUnverifiedCount(artist.address) == 2
+
+
+def test_prune_unverified_art_commissions(setup):
+    """Test resumable chunked pruning and age-based eviction of the unverified queue"""
+    commission_hub = setup["commission_hub"]
+    artist = setup["artist"]
+
+    old_pieces = [create_unverified_art_piece(setup, setup["user"], artist, f" Old {i}") for i in range(3)]
+    chain.mine(timestamp=chain.pending_timestamp + 3600)
+    new_pieces = [create_unverified_art_piece(setup, setup["user"], artist, f" New {i}") for i in range(2)]
+    assert commission_hub.countUnverifiedArtCommissions() == 5
+
+    with pytest.raises(Exception) as exc_info:
+        commission_hub.pruneUnverifiedArtCommissions(10, 0, sender=setup["user"])
+    assert "Not allowed to update" in str(exc_info.value)
+
+    # Age-based eviction in chunks of 2, resuming from the stored cursor
+    tx = commission_hub.pruneUnverifiedArtCommissions(2, 1800, sender=setup["owner"])
+    event = [e for e in tx.events if e.event_name == "UnverifiedCommissionsPruned"][0]
+    assert event.pruned == 0  # The two newest entries were checked first
+    assert event.passComplete == False
+    assert commission_hub.unverifiedPruneCursorOffsetByOne() == 3
+
+    tx = commission_hub.pruneUnverifiedArtCommissions(2, 1800, sender=setup["owner"])
+    assert [e for e in tx.events if e.event_name == "UnverifiedCommissionsPruned"][0].pruned == 2
+    tx = commission_hub.pruneUnverifiedArtCommissions(2, 1800, sender=setup["owner"])
+    event = [e for e in tx.events if e.event_name == "UnverifiedCommissionsPruned"][0]
+    assert event.pruned == 1
+    assert event.passComplete == True
+    assert commission_hub.unverifiedPruneCursorOffsetByOne() == 0
+
+    remaining = commission_hub.getUnverifiedArtPiecesByOffset(0, 10)
+    assert sorted(remaining) == sorted(p.address for p in new_pieces)
+    assert not any(commission_hub.unverifiedArtCommissionsRegistry(p.address) for p in old_pieces)
+    assert commission_hub.getUnverifiedCount(artist.address) == 2
+
+    # _min_age of 0 evicts everything
+    commission_hub.pruneUnverifiedArtCommissions(10, 0, sender=setup["owner"])
+    assert commission_hub.countUnverifiedArtCommissions() == 0
+    assert commission_hub.getUnverifiedCount(artist.address) == 0
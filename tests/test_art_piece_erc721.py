@@ -1,3 +1,6 @@
+import base64
+import json
+
 import pytest
 from ape import accounts, project
 from eth_utils import to_checksum_address
@@ -274,6 +277,87 @@ def test_tokenURI(setup):
     error_message = str(excinfo.value).lower()
     assert "single id" in error_message or "only" in error_message
 
+
+def decode_token_uri(token_uri):
+    """Mirror of decodeTokenURI in src/utils/TokenURIDecoder.ts, None where the frontend gets null"""
+    prefix = "data:application/json;base64,"
+    if not token_uri.startswith(prefix):
+        return None
+    metadata = json.loads(base64.b64decode(token_uri[len(prefix):]))
+    if not metadata.get("name") or not metadata.get("image"):
+        return None
+    return {"name": metadata["name"], "description": metadata.get("description", ""), "image": metadata["image"]}
+
+
+def _initialize_art_piece(setup, token_uri_data, token_uri_data_format, title, description, token_uri_json=""):
+    art_piece = project.ArtPiece.deploy(sender=setup["deployer"])
+    art_piece.initialize(
+        token_uri_data,
+        token_uri_data_format,
+        title,
+        description,
+        setup["owner"].address,
+        setup["artist"].address,
+        ZERO_ADDRESS,
+        TEST_AI_GENERATED,
+        setup["artist"].address,
+        setup["profile_factory"].address,
+        token_uri_json,
+        sender=setup["deployer"]
+    )
+    return art_piece
+
+
+def test_tokenURI_returns_stored_json_data_uri(setup):
+    """tokenURI_data that already is a JSON data URI is returned unchanged"""
+    token_uri = setup["art_piece"].tokenURI(TOKEN_ID)
+    assert token_uri == TEST_TOKEN_URI_DATA.decode()
+    assert decode_token_uri(token_uri)["name"] == "Test Artwork"
+
+
+@pytest.mark.parametrize("image_length", [1, 2, 3, 23, 24, 25, 47, 1000])
+def test_tokenURI_composed_from_raw_image(setup, image_length):
+    """Without a stored JSON, tokenURI builds the metadata the frontend decoder expects"""
+    image = bytes((i * 37 + 11) % 256 for i in range(image_length))
+    art_piece = _initialize_art_piece(setup, image, "webp", TEST_TITLE, TEST_DESCRIPTION)
+
+    decoded = decode_token_uri(art_piece.tokenURI(TOKEN_ID))
+    assert decoded == {
+        "name": TEST_TITLE,
+        "description": TEST_DESCRIPTION,
+        "image": "data:image/webp;base64," + base64.b64encode(image).decode(),
+    }
+
+
+def test_tokenURI_composed_escapes_title_and_description(setup):
+    """Quotes and backslashes survive the JSON round trip, control characters become spaces"""
+    title = 'The "Quoted" \\ Title'
+    description = 'Line one\nLine two with a "quote"'
+    art_piece = _initialize_art_piece(setup, b"\x00\x01\x02", "png", title, description)
+
+    decoded = decode_token_uri(art_piece.tokenURI(TOKEN_ID))
+    assert decoded["name"] == title
+    assert decoded["description"] == description.replace("\n", " ")
+
+
+def test_tokenURI_composed_keeps_image_data_uri_and_urls(setup):
+    """Data URIs and arweave URLs in tokenURI_data are used as the image without encoding"""
+    image_uri = "data:image/avif;base64,AAAAIGZ0eXBhdmlm"
+    art_piece = _initialize_art_piece(setup, image_uri.encode(), "avif", TEST_TITLE, "")
+    assert decode_token_uri(art_piece.tokenURI(TOKEN_ID))["image"] == image_uri
+
+    arweave_url = "https://arweave.net/abc123"
+    art_piece = _initialize_art_piece(setup, arweave_url.encode(), "arweave", TEST_TITLE, "")
+    assert decode_token_uri(art_piece.tokenURI(TOKEN_ID))["image"] == arweave_url
+
+
+def test_tokenURI_prefers_stored_json(setup):
+    """A tokenURIJson given at initialize is still returned as is"""
+    token_uri_json = '{"name":"Stored","image":"ipfs://stored"}'
+    art_piece = _initialize_art_piece(setup, b"\x01\x02", "webp", TEST_TITLE, TEST_DESCRIPTION, token_uri_json)
+    assert art_piece.tokenURI(TOKEN_ID) == token_uri_json
+
+
 def test_name_and_symbol(setup):
     """Test name and symbol methods"""
     art_piece = setup["art_piece"]
@@ -1524,6 +1524,85 @@ def test_complete_phase_lifecycle_quantity(setup):
     assert final_sale_info[1] == 5000000000000000000  # Final price is correct (5 ETH)
     assert final_sale_info[5] == 3  # Final phase (array index 3)
 
+
+def test_phase_schedule_cache_time_phases(setup):
+    """Test the cached next phase threshold tracks time phases, including skipping several phases at once"""
+    artist = setup["artist"]
+    artist_profile = setup["artist_profile"]
+    artist_sales = setup["artist_sales"]
+    art_piece_template = setup["art_piece_template"]
+    user1 = setup["user1"]
+    
+    artist_profile.createArtPiece(
+        art_piece_template.address,
+        TEST_TOKEN_URI_DATA,
+        TEST_TOKEN_URI_DATA_FORMAT,
+        "Phase Cache Test",
+        "Testing cached phase schedule",
+        True,
+        artist.address,
+        TEST_AI_GENERATED,
+        ZERO_ADDRESS,
+        False,
+        sender=artist
+    )
+    art_piece_address = artist_profile.getArtPiecesByOffset(0, 10, False)[-1]
+    initial_count = artist_sales.artistErc1155sToSellCount()
+    
+    current_time = chain.pending_timestamp
+    phases = [
+        (current_time + 3600, 2000000000000000000),    # After 1 hour: 2 ETH
+        (current_time + 7200, 3000000000000000000),    # After 2 hours: 3 ETH
+        (current_time + 10800, 5000000000000000000),   # After 3 hours: 5 ETH
+    ]
+    SALE_TYPE_TIME_PHASES = 3
+    edition_tx = artist_sales.createEditionFromArtPiece(
+        art_piece_address,
+        "Phase Cache Edition",
+        "PCE",
+        1000000000000000000,  # Initial: 1 ETH
+        100,
+        250,
+        ZERO_ADDRESS,
+        SALE_TYPE_TIME_PHASES,
+        phases,
+        sender=artist
+    )
+    edition_address = get_edition_address_reliable(artist_sales, edition_tx, initial_count)
+    edition = project.ArtEdition1155.at(edition_address)
+    artist_sales.setArtistProceedsAddress(artist.address, sender=artist)
+    edition.updateProceedsAddress(artist.address, sender=artist)
+    edition.startSale(sender=artist)
+    
+    # Before the first phase only the first threshold is cached
+    assert edition.nextPhaseThreshold() == phases[0][0]
+    edition.mint(1, value=1000000000000000000, sender=user1)
+    assert edition.currentPhase() == 0
+    assert edition.nextPhaseThreshold() == phases[0][0]
+    
+    # Jump past the first two phases, the view resolves the price without a mint
+    chain.mine(timestamp=phases[1][0] + 1)
+    assert edition.getSaleInfo()[1] == 3000000000000000000
+    assert edition.currentPhase() == 0
+    
+    # The next mint crosses both boundaries at once and caches the last phase threshold
+    edition.mint(1, value=3000000000000000000, sender=user1)
+    assert edition.currentPhase() == 2
+    assert edition.currentPrice() == 3000000000000000000
+    assert edition.nextPhaseThreshold() == phases[2][0]
+    
+    # After the final phase there is no next threshold
+    chain.mine(timestamp=phases[2][0] + 1)
+    edition.mint(1, value=5000000000000000000, sender=user1)
+    assert edition.currentPhase() == 3
+    assert edition.currentPrice() == 5000000000000000000
+    assert edition.nextPhaseThreshold() == 2**256 - 1
+    
+    # Paying the old price after a boundary is crossed fails
+    with pytest.raises(Exception) as exc_info:
+        edition.mint(1, value=3000000000000000000, sender=user1)
+    assert "Insufficient ETH payment" in str(exc_info.value)
+
 def test_mixed_phase_creation_methods(setup):
     """Test that both createEditionFromArtPiece and createArtEdition work identically with phases"""
     artist = setup["artist"]
@@ -2906,6 +2985,212 @@ def test_edition_sale_management_batch_operations(setup):
     
     print("✅ All batch operations work correctly with the permission fix!")
 
+
+def test_edition_sale_management_large_batch_and_reprice(setup):
+    """
+    Test batch start/pause/resume/reprice work past the old 10 edition cap.
+    """
+    artist = setup["artist"]
+    artist_profile = setup["artist_profile"]
+    artist_sales = setup["artist_sales"]
+    art_piece_template = setup["art_piece_template"]
+    
+    edition_addresses = []
+    for i in range(12):
+        artist_profile.createArtPiece(
+            art_piece_template.address,
+            TEST_TOKEN_URI_DATA,
+            TEST_TOKEN_URI_DATA_FORMAT,
+            f"Drop Art {i+1}",
+            f"Timed drop piece {i+1}",
+            True,  # as artist
+            artist.address,
+            TEST_AI_GENERATED,
+            ZERO_ADDRESS,
+            False,
+            sender=artist
+        )
+        art_piece_address = artist_profile.getArtPiecesByOffset(0, 20, False)[-1]
+        initial_count = artist_sales.artistErc1155sToSellCount()
+        edition_tx = artist_sales.createEditionFromArtPiece(
+            art_piece_address,
+            f"Drop Edition {i+1}",
+            f"DE{i+1}",
+            1000000000000000000,  # 1 ETH
+            100,  # max supply
+            250,  # 2.5% royalty
+            sender=artist
+        )
+        edition_addresses.append(get_edition_address_reliable(artist_sales, edition_tx, initial_count))
+    
+    # Start all 12 in one transaction, sale types come from startSale without extra calls
+    tx = artist_sales.batchStartSales(edition_addresses, sender=artist)
+    started = [e for e in tx.events if e.event_name == "SaleStarted" and "erc1155" in e.event_arguments]
+    assert len(started) == 12
+    assert all(e.saleType == 1 for e in started)
+    for edition_addr in edition_addresses:
+        assert project.ArtEdition1155.at(edition_addr).getSaleInfo()[4] == False
+    
+    # Reprice every edition in one transaction
+    new_prices = [(i + 2) * 10**17 for i in range(12)]
+    artist_sales.batchSetCurrentPrices(edition_addresses, new_prices, sender=artist)
+    for edition_addr, price in zip(edition_addresses, new_prices):
+        assert project.ArtEdition1155.at(edition_addr).currentPrice() == price
+    
+    artist_sales.batchPauseSales(edition_addresses, sender=artist)
+    for edition_addr in edition_addresses:
+        assert project.ArtEdition1155.at(edition_addr).getSaleInfo()[4] == True
+    artist_sales.batchResumeSales(edition_addresses, sender=artist)
+    for edition_addr in edition_addresses:
+        assert project.ArtEdition1155.at(edition_addr).getSaleInfo()[4] == False
+    
+    # Single edition reprice
+    artist_sales.setCurrentPriceForEdition(edition_addresses[0], 5 * 10**17, sender=artist)
+    assert project.ArtEdition1155.at(edition_addresses[0]).currentPrice() == 5 * 10**17
+    
+    # Mismatched lengths, non-owner callers and unmanaged editions are rejected
+    with pytest.raises(Exception) as exc_info:
+        artist_sales.batchSetCurrentPrices(edition_addresses, new_prices[:-1], sender=artist)
+    assert "Length mismatch" in str(exc_info.value)
+    
+    with pytest.raises(Exception) as exc_info:
+        artist_sales.batchSetCurrentPrices(edition_addresses, new_prices, sender=setup["user1"])
+    assert "Only owner can set prices" in str(exc_info.value)
+    
+    with pytest.raises(Exception) as exc_info:
+        artist_sales.batchPauseSales(edition_addresses + [setup["user1"].address], sender=artist)
+    assert "Edition not managed by this contract" in str(exc_info.value)
+    # The failed batch reverted as a whole
+    assert project.ArtEdition1155.at(edition_addresses[0]).getSaleInfo()[4] == False
+
+
+def test_edition_airdrop_multiple_recipients(setup):
+    """Test the owner can airdrop editions to many recipients in one transaction"""
+    artist = setup["artist"]
+    artist_profile = setup["artist_profile"]
+    artist_sales = setup["artist_sales"]
+    art_piece_template = setup["art_piece_template"]
+    user1 = setup["user1"]
+    user2 = setup["user2"]
+    user3 = setup["user3"]
+    
+    artist_profile.createArtPiece(
+        art_piece_template.address,
+        TEST_TOKEN_URI_DATA,
+        TEST_TOKEN_URI_DATA_FORMAT,
+        "Airdrop Test",
+        "Testing edition airdrops",
+        True,
+        artist.address,
+        TEST_AI_GENERATED,
+        ZERO_ADDRESS,
+        False,
+        sender=artist
+    )
+    art_piece_address = artist_profile.getArtPiecesByOffset(0, 10, False)[-1]
+    initial_count = artist_sales.artistErc1155sToSellCount()
+    edition_tx = artist_sales.createEditionFromArtPiece(
+        art_piece_address,
+        "Airdrop Edition",
+        "AE",
+        1000000000000000000,  # 1 ETH
+        10,  # max supply
+        250,
+        sender=artist
+    )
+    edition_address = get_edition_address_reliable(artist_sales, edition_tx, initial_count)
+    edition = project.ArtEdition1155.at(edition_address)
+    
+    # Airdrop works while the sale is still paused
+    recipients = [user1.address, user2.address, user3.address]
+    amounts = [1, 2, 3]
+    tx = edition.airdrop(recipients, amounts, sender=artist)
+    
+    for recipient, amount in zip(recipients, amounts):
+        assert edition.balanceOf(recipient, 1) == amount
+    assert edition.currentSupply() == 6
+    
+    transfers = [e for e in tx.events if e.event_name == "TransferSingle"]
+    assert [e.receiver for e in transfers] == recipients
+    assert [e.value for e in transfers] == amounts
+    assert all(e.sender == ZERO_ADDRESS for e in transfers)
+    airdropped = [e for e in tx.events if e.event_name == "EditionAirdropped"]
+    assert len(airdropped) == 1
+    assert airdropped[0].recipientCount == 3
+    assert airdropped[0].amount == 6
+    
+    # Max supply is checked against the whole batch
+    with pytest.raises(Exception) as exc_info:
+        edition.airdrop([user1.address, user2.address], [2, 3], sender=artist)
+    assert "Exceeds max supply" in str(exc_info.value)
+    assert edition.currentSupply() == 6
+    
+    # Only the owner can airdrop
+    with pytest.raises(Exception) as exc_info:
+        edition.airdrop([user1.address], [1], sender=user1)
+    assert "Only owner or ArtSales1155" in str(exc_info.value)
+    
+    # Mismatched arrays and the zero address are rejected
+    with pytest.raises(Exception) as exc_info:
+        edition.airdrop([user1.address, user2.address], [1], sender=artist)
+    assert "Length mismatch" in str(exc_info.value)
+    with pytest.raises(Exception) as exc_info:
+        edition.airdrop([ZERO_ADDRESS], [1], sender=artist)
+    assert "Invalid recipient" in str(exc_info.value)
+
+
+def test_edition_airdrop_advances_quantity_phase(setup):
+    """Test an airdrop counts toward quantity phases and hard stops once per batch"""
+    artist = setup["artist"]
+    artist_profile = setup["artist_profile"]
+    artist_sales = setup["artist_sales"]
+    art_piece_template = setup["art_piece_template"]
+    user1 = setup["user1"]
+    user2 = setup["user2"]
+    
+    artist_profile.createArtPiece(
+        art_piece_template.address,
+        TEST_TOKEN_URI_DATA,
+        TEST_TOKEN_URI_DATA_FORMAT,
+        "Airdrop Phase Test",
+        "Testing airdrops with quantity phases",
+        True,
+        artist.address,
+        TEST_AI_GENERATED,
+        ZERO_ADDRESS,
+        False,
+        sender=artist
+    )
+    art_piece_address = artist_profile.getArtPiecesByOffset(0, 10, False)[-1]
+    initial_count = artist_sales.artistErc1155sToSellCount()
+    SALE_TYPE_QUANTITY_PHASES = 2
+    edition_tx = artist_sales.createEditionFromArtPiece(
+        art_piece_address,
+        "Airdrop Phase Edition",
+        "APE",
+        1000000000000000000,  # Initial: 1 ETH
+        100,
+        250,
+        ZERO_ADDRESS,
+        SALE_TYPE_QUANTITY_PHASES,
+        [(5, 2000000000000000000)],  # At 5 sold: 2 ETH
+        0,  # no time cap
+        8,  # mint cap hard stop
+        sender=artist
+    )
+    edition_address = get_edition_address_reliable(artist_sales, edition_tx, initial_count)
+    edition = project.ArtEdition1155.at(edition_address)
+    
+    edition.airdrop([user1.address, user2.address], [3, 3], sender=artist)
+    assert edition.currentSupply() == 6
+    assert edition.currentPhase() == 1
+    assert edition.currentPrice() == 2000000000000000000
+    
+    # The mint cap hard stop applies to the batch total
+    with pytest.raises(Exception) as exc_info:
+        edition.airdrop([user1.address, user2.address], [2, 1], sender=artist)
+    assert "Mint cap hard stop reached" in str(exc_info.value)
+
 # ================================================================================================
 # HARD STOP FUNCTIONALITY TESTS
 # ================================================================================================
@@ -1,4 +1,5 @@
 import pytest
+import ape
 from ape import accounts, project
 
 # Test data
@@ -10,42 +11,18 @@ TEST_AI_GENERATED = False
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
 @pytest.fixture
-def setup():
-    """Setup function that deploys and initializes all contracts needed for testing"""
-    deployer = accounts.test_accounts[0]
+def setup(deployed_system):
+    """Setup function that creates the profiles and hub used by the tests on the deployed system"""
+    deployer = deployed_system["deployer"]
     artist = accounts.test_accounts[1]
     commissioner = accounts.test_accounts[2]
     hub_owner = accounts.test_accounts[3]
     
-    # Deploy all templates
-    profile_template = project.Profile.deploy(sender=deployer)
-    profile_social_template = project.ProfileSocial.deploy(sender=deployer)
-    commission_hub_template = project.ArtCommissionHub.deploy(sender=deployer)
-
-    # Deploy ArtEdition1155 template
-    art_edition_1155_template = project.ArtEdition1155.deploy(sender=deployer)
-    
-    # Deploy ArtSales1155 template
-    art_sales_1155_template = project.ArtSales1155.deploy(sender=deployer)
-    art_piece_template = project.ArtPiece.deploy(sender=deployer)
-    
-    # Deploy factory registry
-    profile_factory = project.ProfileFactoryAndRegistry.deploy(
-        profile_template.address, profile_social_template.address, commission_hub_template.address, art_edition_1155_template.address, art_sales_1155_template.address,
-        sender=deployer
-    )
-    
-    # Deploy ArtCommissionHubOwners
-    art_commission_hub_owners = project.ArtCommissionHubOwners.deploy(
-        deployer.address,  # L2OwnershipRelay
-        commission_hub_template.address,
-        art_piece_template.address,
-        sender=deployer
-    )
-    
-    # Link factory and hub owners
-    profile_factory.linkArtCommissionHubOwnersContract(art_commission_hub_owners.address, sender=deployer)
-    art_commission_hub_owners.linkProfileFactoryAndRegistry(profile_factory.address, sender=deployer)
+    art_edition_1155_template = deployed_system["art_edition_1155_template"]
+    art_sales_1155_template = deployed_system["art_sales_1155_template"]
+    art_piece_template = deployed_system["art_piece_template"]
+    profile_factory = deployed_system["profile_factory_and_registry"]
+    art_commission_hub_owners = deployed_system["art_commission_hub_owners"]
     
     # Create profiles for test accounts
     profile_factory.createProfile(artist.address, sender=deployer)
@@ -351,4 +328,201 @@ def test_verification_requires_commission_hub(setup):
     # Art piece should remain unverified
     assert not art_piece.artistVerified(), "Artist should not be verified"
     assert not art_piece.commissionerVerified(), "Commissioner should not be verified"
-    assert not art_piece.isFullyVerifiedCommission(), "Should not be fully verified" 
\ No newline at end of file
+    assert not art_piece.isFullyVerifiedCommission(), "Should not be fully verified" 
+
+
+def _create_verified_commission(setup, hub_address):
+    """Create an art piece attached to hub_address and verify it as artist and commissioner"""
+    art_piece = project.ArtPiece.deploy(sender=setup["deployer"])
+    art_piece.initialize(
+        TEST_TOKEN_URI_DATA,
+        TEST_TOKEN_URI_DATA_FORMAT,
+        TEST_TITLE,
+        TEST_DESCRIPTION,
+        setup["commissioner"].address,
+        setup["artist"].address,
+        hub_address,
+        TEST_AI_GENERATED,
+        setup["artist"].address,  # original uploader
+        setup["profile_factory"].address,
+        sender=setup["deployer"]
+    )
+    setup["art_commission_hub_owners"].setApprovedArtPiece(art_piece.address, True, sender=setup["deployer"])
+    art_piece.verifyAsArtist(sender=setup["artist"])
+    art_piece.verifyAsCommissioner(sender=setup["commissioner"])
+    return art_piece
+
+
+def test_cached_owner_follows_hub_verification(setup):
+    """The hub owner is cached only while the hub pushes owner changes to the piece (verified list)"""
+    artist = setup["artist"]
+    hub_owner = setup["hub_owner"]
+    commission_hub = setup["commission_hub"]
+
+    # Before verification the original uploader is cached
+    art_piece = project.ArtPiece.deploy(sender=setup["deployer"])
+    art_piece.initialize(
+        TEST_TOKEN_URI_DATA, TEST_TOKEN_URI_DATA_FORMAT, TEST_TITLE, TEST_DESCRIPTION,
+        setup["commissioner"].address, artist.address, setup["hub_address"], TEST_AI_GENERATED,
+        artist.address, setup["profile_factory"].address,
+        sender=setup["deployer"]
+    )
+    assert art_piece.cachedEffectiveOwner() == artist.address
+
+    # Fully verified but only in the hub's unverified list: resolved live from the hub
+    art_piece = _create_verified_commission(setup, setup["hub_address"])
+    assert commission_hub.unverifiedArtCommissionsRegistry(art_piece.address)
+    assert art_piece.cachedEffectiveOwner() == ZERO_ADDRESS
+    assert art_piece.ownerOf(1) == hub_owner.address
+
+    # Verified by the hub owner: the hub pushes and the owner is cached
+    commission_hub.verifyCommission(art_piece.address, sender=hub_owner)
+    assert commission_hub.pushesOwnerUpdates(art_piece.address)
+    assert art_piece.cachedEffectiveOwner() == hub_owner.address
+    assert art_piece.ownerOf(1) == hub_owner.address
+    assert art_piece.balanceOf(hub_owner.address) == 1
+
+    # Unverified again: back to live resolution
+    commission_hub.unverifyCommission(art_piece.address, sender=hub_owner)
+    assert art_piece.cachedEffectiveOwner() == ZERO_ADDRESS
+    assert art_piece.ownerOf(1) == hub_owner.address
+
+
+def test_cached_owner_pushed_on_hub_owner_change(setup):
+    """Syncing a new NFT owner into a hub refreshes the cached owner of its verified pieces"""
+    deployer = setup["deployer"]
+    hub_owner = setup["hub_owner"]
+    new_owner = accounts.test_accounts[4]
+    art_commission_hub_owners = setup["art_commission_hub_owners"]
+    nft_contract = "0x2000000000000000000000000000000000000002"
+
+    art_commission_hub_owners.registerNFTOwnerFromParentChain(1, nft_contract, 7, hub_owner.address, sender=deployer)
+    nft_hub = project.ArtCommissionHub.at(art_commission_hub_owners.getArtCommissionHubByOwner(1, nft_contract, 7))
+    art_piece = _create_verified_commission(setup, nft_hub.address)
+    nft_hub.verifyCommission(art_piece.address, sender=hub_owner)
+    assert art_piece.cachedEffectiveOwner() == hub_owner.address
+
+    art_commission_hub_owners.registerNFTOwnerFromParentChain(1, nft_contract, 7, new_owner.address, sender=deployer)
+    assert art_piece.cachedEffectiveOwner() == new_owner.address
+    assert art_piece.ownerOf(1) == new_owner.address
+    assert art_piece.balanceOf(hub_owner.address) == 0
+
+
+def test_cached_owner_pushed_on_license_owner_change(setup):
+    """ArtPieceLicense.setLicenseOwner refreshes the cached owner of its art piece"""
+    deployer = setup["deployer"]
+    artist = setup["artist"]
+    licensee = accounts.test_accounts[5]
+    new_licensee = accounts.test_accounts[6]
+
+    art_piece = _create_verified_commission(setup, setup["hub_address"])
+    license = project.ArtPieceLicense.deploy(sender=deployer)
+    license.initialize(art_piece.address, licensee.address, sender=deployer)
+    art_piece.setArtPieceLicense(license.address, sender=artist)
+    assert art_piece.cachedEffectiveOwner() == licensee.address
+
+    # A gas limit too low for the push reverts the license change instead of leaving a stale cached owner
+    with ape.reverts("Not enough gas to push the owner"):
+        license.setLicenseOwner(new_licensee.address, sender=licensee, gas_limit=100000)
+    assert license.licenseOwner() == licensee.address
+
+    license.setLicenseOwner(new_licensee.address, sender=licensee)
+    assert art_piece.cachedEffectiveOwner() == new_licensee.address
+    assert art_piece.ownerOf(1) == new_licensee.address
+
+    # A license issued for another piece doesn't push here, so its owner is resolved live
+    other_license = project.ArtPieceLicense.deploy(sender=deployer)
+    other_license.initialize(setup["hub_address"], licensee.address, sender=deployer)
+    art_piece.setArtPieceLicense(other_license.address, sender=artist)
+    assert art_piece.cachedEffectiveOwner() == ZERO_ADDRESS
+    assert art_piece.ownerOf(1) == licensee.address
+
+
+def test_cached_hub_owner_invalidated_by_partial_owner_sync(setup):
+    """An owner sync that runs out of push gas still moves every piece to the new owner (hub owner epoch)"""
+    deployer = setup["deployer"]
+    artist = setup["artist"]
+    hub_owner = setup["hub_owner"]
+    new_owner = accounts.test_accounts[4]
+    art_commission_hub_owners = setup["art_commission_hub_owners"]
+    nft_contract = "0x2000000000000000000000000000000000000002"
+
+    art_commission_hub_owners.registerNFTOwnerFromParentChain(1, nft_contract, 9, hub_owner.address, sender=deployer)
+    nft_hub = project.ArtCommissionHub.at(art_commission_hub_owners.getArtCommissionHubByOwner(1, nft_contract, 9))
+    nft_hub.updateWhitelistOrBlacklist(artist.address, True, True, sender=hub_owner)
+    art_pieces = [_create_verified_commission(setup, nft_hub.address) for _ in range(12)]
+    assert all(art_piece.cachedEffectiveOwner() == hub_owner.address for art_piece in art_pieces)
+
+    tx = art_commission_hub_owners.registerNFTOwnerFromParentChain(1, nft_contract, 9, new_owner.address, sender=deployer, gas_limit=400000)
+    refreshed = len([log for log in tx.events if log.event_name == "Transfer"])
+    assert refreshed < 12
+    assert nft_hub.owner() == new_owner.address
+
+    # Pieces the sync didn't reach keep the stale cache but don't trust it
+    stale = art_pieces[refreshed]
+    assert stale.cachedEffectiveOwner() == hub_owner.address
+    assert all(art_piece.getOwner() == new_owner.address for art_piece in art_pieces)
+    license = project.ArtPieceLicense.deploy(sender=hub_owner)
+    license.initialize(stale.address, hub_owner.address, sender=hub_owner)
+    with ape.reverts("Only owner, artist, or commissioner can set license"):
+        stale.setArtPieceLicense(license.address, sender=hub_owner)
+
+    nft_hub.continueOwnerFanOut(500, sender=deployer)
+    assert stale.cachedEffectiveOwner() == new_owner.address
+    assert stale.getOwner() == new_owner.address
+
+
+def test_owner_change_fan_out_logs_transfers(setup):
+    """An owner change beyond MAX_OWNER_PUSH_PIECES verified pieces is fanned out in resumable chunks with Transfer logs"""
+    deployer = setup["deployer"]
+    hub_owner = setup["hub_owner"]
+    new_owner = accounts.test_accounts[4]
+    art_commission_hub_owners = setup["art_commission_hub_owners"]
+    nft_contract = "0x2000000000000000000000000000000000000002"
+
+    art_commission_hub_owners.registerNFTOwnerFromParentChain(1, nft_contract, 8, hub_owner.address, sender=deployer)
+    nft_hub = project.ArtCommissionHub.at(art_commission_hub_owners.getArtCommissionHubByOwner(1, nft_contract, 8))
+    nft_hub.updateWhitelistOrBlacklist(setup["artist"].address, True, True, sender=hub_owner)
+    art_pieces = [_create_verified_commission(setup, nft_hub.address) for _ in range(103)]
+    assert nft_hub.countVerifiedArtCommissions() == 103
+    assert nft_hub.ownerFanOutCursorOffsetByOne() == 0
+    owner_epoch = nft_hub.ownerEpoch()
+
+    # The sync refreshes the first 100 pieces and leaves the rest to the fan-out
+    tx = art_commission_hub_owners.registerNFTOwnerFromParentChain(1, nft_contract, 8, new_owner.address, sender=deployer)
+    assert nft_hub.ownerEpoch() == owner_epoch + 1
+    transfers = [log for log in tx.events if log.event_name == "Transfer"]
+    assert len(transfers) == 100
+    assert all(log.sender == hub_owner.address and log.receiver == new_owner.address for log in transfers)
+    assert nft_hub.ownerFanOutCursorOffsetByOne() == 101
+    # Pieces beyond the pushed range resolve the owner live, so reads are correct before the fan-out
+    assert art_pieces[102].cachedEffectiveOwner() == ZERO_ADDRESS
+    assert art_pieces[102].ownerOf(1) == new_owner.address
+    assert art_pieces[102].announcedOwner() == hub_owner.address
+
+    # Anyone can continue the fan-out, in chunks
+    tx = nft_hub.continueOwnerFanOut(2, sender=accounts.test_accounts[5])
+    assert [log.event_name for log in tx.events] == ["Transfer", "Transfer", "OwnerFanOutProgressed"]
+    assert tx.events[0].contract_address == art_pieces[100].address
+    assert tx.events[2].refreshed == 2 and tx.events[2].nextIndex == 102 and not tx.events[2].passComplete
+
+    tx = nft_hub.continueOwnerFanOut(10, sender=accounts.test_accounts[5])
+    assert tx.events[-1].refreshed == 1 and tx.events[-1].passComplete
+    assert art_pieces[102].announcedOwner() == new_owner.address
+    assert nft_hub.ownerFanOutCursorOffsetByOne() == 0
+
+    # No pass in progress: nothing to refresh, and refreshing an unchanged owner logs nothing
+    assert nft_hub.continueOwnerFanOut(10, sender=deployer).events == []
+    assert art_pieces[0].refreshCachedOwner(sender=deployer).events == []
+
+    # A sync with less gas stops at the gas reserve and leaves the fan-out at the first piece it didn't refresh
+    tx = art_commission_hub_owners.registerNFTOwnerFromParentChain(1, nft_contract, 8, hub_owner.address, sender=deployer, gas_limit=1000000)
+    refreshed = len([log for log in tx.events if log.event_name == "Transfer"])
+    assert 0 < refreshed < 100
+    assert nft_hub.ownerFanOutCursorOffsetByOne() == refreshed + 1
+    assert art_pieces[refreshed].announcedOwner() == new_owner.address
+
+    tx = nft_hub.continueOwnerFanOut(500, sender=accounts.test_accounts[5])
+    assert tx.events[-1].refreshed == 103 - refreshed and tx.events[-1].passComplete
+    assert all(art_piece.announcedOwner() == hub_owner.address for art_piece in art_pieces)
+    assert art_pieces[refreshed].ownerOf(1) == hub_owner.address
@@ -0,0 +1,62 @@
+import pytest
+from ape import accounts, project
+
+TEST_NFT_CONTRACT = "0x1111111111111111111111111111111111111111"
+L3_CONTRACT = "0x2222222222222222222222222222222222222222"
+
+
+@pytest.fixture
+def setup():
+    """Deploy the L2 -> L3 senders (their inboxes don't exist locally, so only the fee checks are exercised)"""
+    deployer = accounts.test_accounts[0]
+    relay = project.L2OwnershipRelay.deploy(sender=deployer)
+    relay.setL3Contract(L3_CONTRACT, sender=deployer)
+    anime_sender = project.AnimeTokenL2ToL3MessageSender.deploy(sender=deployer)
+    return {"deployer": deployer, "user": accounts.test_accounts[1], "relay": relay, "anime_sender": anime_sender}
+
+
+@pytest.mark.parametrize("fees, value, message", [
+    ((0, 300000, 10**9), 10**16, "Invalid max submission cost"),
+    ((10**17 + 1, 300000, 10**9), 10**18, "Invalid max submission cost"),
+    ((10**15, 99999, 10**9), 10**16, "Invalid L3 gas limit"),
+    ((10**15, 5000001, 10**9), 10**17, "Invalid L3 gas limit"),
+    ((10**15, 300000, 0), 10**16, "Invalid L3 max fee per gas"),
+    ((10**15, 300000, 100 * 10**9 + 1), 10**18, "Invalid L3 max fee per gas"),
+    ((10**15, 300000, 10**9), 10**15 + 300000 * 10**9 - 1, "Insufficient value for retryable ticket fees"),
+])
+
+
+def test_relay_to_l3_fee_bounds(setup, fees, value, message):
+    """relayToL3 rejects caller supplied fees outside the bounds and values that don't cover them"""
+    with pytest.raises(Exception) as excinfo:
+        setup["relay"].relayToL3(1, TEST_NFT_CONTRACT, 1, setup["user"].address, *fees, sender=setup["user"], value=value)
+    assert message in str(excinfo.value)
+
+
+def test_relay_to_l3_default_fees_need_value(setup):
+    """Without fee arguments the default fees apply (0.01 ETH + 600k gas at 2 gwei)"""
+    with pytest.raises(Exception) as excinfo:
+        setup["relay"].relayToL3(1, TEST_NFT_CONTRACT, 1, setup["user"].address, sender=setup["user"], value=10**16 + 600000 * 2 * 10**9 - 1)
+    assert "Insufficient value for retryable ticket fees" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("args, message", [
+    ((10**18, 0), "Invalid max submission cost"),
+    ((10**18, 10**15, 20999, 36000000), "Invalid gas limit"),
+    ((10**18, 10**15, 300000, 100 * 10**9 + 1), "Invalid max fee per gas"),
+    ((300000 * 36000000 - 1, 10**15, 300000, 36000000), "ANIME amount below the L3 gas cost"),
+    ((100 * 10**18 + 1, 10**15), "ANIME amount too high"),
+])
+
+
+def test_anime_sender_fee_bounds(setup, args, message):
+    """sendWithCustomAnimeAmount checks caller supplied fees before taking any ANIME"""
+    with pytest.raises(Exception) as excinfo:
+        setup["anime_sender"].sendWithCustomAnimeAmount(setup["user"].address, *args, sender=setup["user"], value=10**15)
+    assert message in str(excinfo.value)
+
+
+def test_anime_sender_default_fees(setup):
+    """The default fee views return the fees of sendToMainnetContractWithAnime"""
+    assert setup["anime_sender"].getRequiredAnimeApproval() == 1001400000000000000
+    assert setup["anime_sender"].getMinimumETHForSubmission() == 95 * 10**14
@@ -1,7 +1,13 @@
+import sys
+from pathlib import Path
+
 import pytest
-from ape import accounts, project
+from ape import accounts, chain, project
 from eth_utils import to_checksum_address
 
+sys.path.append(str(Path(__file__).parent.parent / "scripts"))
+from storage_seeder import StorageSeeder, seed_addresses
+
 # Define constant for zero address
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 CHAIN_ID = 1  # Ethereum mainnet
@@ -156,6 +162,113 @@ def test_update_nft_owner(setup):
     assert len(hubs) == 1
     assert hubs[0] == hub_address
 
+
+def test_reregister_unchanged_owner_fast_path(setup):
+    """Re-registering an unchanged owner is skipped until minOwnerRefreshInterval has passed"""
+    deployer = setup["deployer"]
+    user1 = setup["user1"]
+    art_commission_hub_owners = setup["art_commission_hub_owners"]
+    assert art_commission_hub_owners.minOwnerRefreshInterval() == 86400
+
+    art_commission_hub_owners.registerNFTOwnerFromParentChain(
+        CHAIN_ID, TEST_NFT_CONTRACT, TEST_TOKEN_ID, user1.address, sender=deployer
+    )
+    last_updated = art_commission_hub_owners.getArtCommissionHubLastUpdated(CHAIN_ID, TEST_NFT_CONTRACT, TEST_TOKEN_ID)
+
+    # Within the interval: no writes and no Registered event
+    tx = art_commission_hub_owners.registerNFTOwnerFromParentChain(
+        CHAIN_ID, TEST_NFT_CONTRACT, TEST_TOKEN_ID, user1.address, sender=deployer
+    )
+    assert len(tx.events) == 0
+    assert art_commission_hub_owners.getArtCommissionHubLastUpdated(CHAIN_ID, TEST_NFT_CONTRACT, TEST_TOKEN_ID) == last_updated
+
+    # After the interval only the timestamp is refreshed
+    chain.pending_timestamp += 86400
+    tx = art_commission_hub_owners.registerNFTOwnerFromParentChain(
+        CHAIN_ID, TEST_NFT_CONTRACT, TEST_TOKEN_ID, user1.address, sender=deployer
+    )
+    assert [log.event_name for log in tx.events] == ["Registered"]
+    assert art_commission_hub_owners.getArtCommissionHubLastUpdated(CHAIN_ID, TEST_NFT_CONTRACT, TEST_TOKEN_ID) > last_updated
+    assert art_commission_hub_owners.getCommissionHubCountByOwner(user1.address) == 1
+
+    # An interval of 0 refreshes the timestamp on every registration
+    with pytest.raises(Exception) as excinfo:
+        art_commission_hub_owners.setMinOwnerRefreshInterval(0, sender=user1)
+    assert "Only owner can set the minimum owner refresh interval" in str(excinfo.value)
+    art_commission_hub_owners.setMinOwnerRefreshInterval(0, sender=deployer)
+    tx = art_commission_hub_owners.registerNFTOwnerFromParentChain(
+        CHAIN_ID, TEST_NFT_CONTRACT, TEST_TOKEN_ID, user1.address, sender=deployer
+    )
+    assert [log.event_name for log in tx.events] == ["Registered"]
+
+
+def test_register_nft_owners_batch(setup):
+    """Batch registration creates, updates and skips unchanged owners"""
+    deployer = setup["deployer"]
+    user1 = setup["user1"]
+    user2 = setup["user2"]
+    art_commission_hub_owners = setup["art_commission_hub_owners"]
+    token_ids = [1, 2, 3]
+
+    tx = art_commission_hub_owners.registerNFTOwnersFromParentChain(
+        CHAIN_ID, TEST_NFT_CONTRACT, token_ids, [user1.address] * 3, sender=deployer
+    )
+    assert len([log for log in tx.events if log.event_name == "Registered"]) == 3
+    assert art_commission_hub_owners.getCommissionHubCountByOwner(user1.address) == 3
+
+    # Re-sync where only token 2 changed owner
+    tx = art_commission_hub_owners.registerNFTOwnersFromParentChain(
+        CHAIN_ID, TEST_NFT_CONTRACT, token_ids, [user1.address, user2.address, user1.address], sender=deployer
+    )
+    registered = [log for log in tx.events if log.event_name == "Registered"]
+    assert len(registered) == 1 and registered[0].nft_token_id_or_generic_hub_account == 2
+    assert art_commission_hub_owners.lookupRegisteredOwner(CHAIN_ID, TEST_NFT_CONTRACT, 2) == user2.address
+    assert art_commission_hub_owners.getCommissionHubCountByOwner(user1.address) == 2
+    assert art_commission_hub_owners.getCommissionHubCountByOwner(user2.address) == 1
+
+    with pytest.raises(Exception) as excinfo:
+        art_commission_hub_owners.registerNFTOwnersFromParentChain(
+            CHAIN_ID, TEST_NFT_CONTRACT, token_ids, [user1.address], sender=deployer
+        )
+    assert "Token IDs and owners length mismatch" in str(excinfo.value)
+    with pytest.raises(Exception) as excinfo:
+        art_commission_hub_owners.registerNFTOwnersFromParentChain(
+            CHAIN_ID, TEST_NFT_CONTRACT, token_ids, [user1.address] * 3, sender=user1
+        )
+    assert "Only system allowed addresses can register artCommissionHubOwners" in str(excinfo.value)
+
+
+def test_seeded_owner_hub_list_unlink_and_relink(chain, setup):
+    """A seeded artCommissionHubsByOwner list keeps positions, so owner changes unlink and re-link hubs"""
+    deployer = setup["deployer"]
+    user1 = setup["user1"]
+    user2 = setup["user2"]
+    art_commission_hub_owners = setup["art_commission_hub_owners"]
+
+    art_commission_hub_owners.registerNFTOwnerFromParentChain(CHAIN_ID, TEST_NFT_CONTRACT, TEST_TOKEN_ID, user1.address, sender=deployer)
+    hub = art_commission_hub_owners.getArtCommissionHubByOwner(CHAIN_ID, TEST_NFT_CONTRACT, TEST_TOKEN_ID)
+
+    # Seed user1's list with the real hub in the middle of seeded entries
+    seeded = seed_addresses(4)
+    owner_hubs = seeded[:2] + [hub] + seeded[2:]
+    seeder = StorageSeeder(chain.provider, art_commission_hub_owners.address, "ArtCommissionHubOwners")
+    seeder.seed_list("artCommissionHubsByOwner", owner_hubs, keys=[user1.address])
+    assert art_commission_hub_owners.getCommissionHubsByOwnerWithOffset(user1.address, 0, 10, False) == owner_hubs
+    assert art_commission_hub_owners.artCommissionHubsByOwnerIndexOffsetByOne(user1.address, hub) == 3
+
+    # Owner change: the hub is swap-removed from the seeded list
+    art_commission_hub_owners.registerNFTOwnerFromParentChain(CHAIN_ID, TEST_NFT_CONTRACT, TEST_TOKEN_ID, user2.address, sender=deployer)
+    expected = seeded[:2] + [seeded[3], seeded[2]]
+    assert art_commission_hub_owners.getCommissionHubsByOwnerWithOffset(user1.address, 0, 10, False) == expected
+    assert art_commission_hub_owners.getCommissionHubCountByOwner(user1.address) == 4
+    assert art_commission_hub_owners.artCommissionHubsByOwnerIndexOffsetByOne(user1.address, seeded[3]) == 3
+    assert art_commission_hub_owners.artCommissionHubsByOwnerIndexOffsetByOne(user1.address, hub) == 0
+
+    # Back to user1: re-linked once, at the end
+    art_commission_hub_owners.registerNFTOwnerFromParentChain(CHAIN_ID, TEST_NFT_CONTRACT, TEST_TOKEN_ID, user1.address, sender=deployer)
+    assert art_commission_hub_owners.getCommissionHubsByOwnerWithOffset(user1.address, 0, 10, False) == expected + [hub]
+    assert art_commission_hub_owners.getCommissionHubCountByOwner(user1.address) == 5
+
 def test_create_generic_commission_hub(setup):
     """Test creating a generic commission hub"""
     user1 = setup["user1"]
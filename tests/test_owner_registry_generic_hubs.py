@@ -511,4 +511,51 @@ def test_create_generic_commission_hub_permission_denial(setup):
     assert "Only the owner can create their own generic commission hub" in str(excinfo.value), "Incorrect error message"
     
     # Verify no hub was created
-    assert art_commission_hub_owners.getCommissionHubCountByOwner(user1.address) == 0 
\ No newline at end of file
+    assert art_commission_hub_owners.getCommissionHubCountByOwner(user1.address) == 0 
+
+
+def test_create_generic_commission_hubs_batch(setup):
+    """Test batch onboarding creates profiles and generic hubs, skipping existing ones"""
+    art_commission_hub_owners = setup["art_commission_hub_owners"]
+    profile_factory = setup["profile_factory"]
+    deployer = setup["deployer"]
+    user1 = setup["user1"]
+    user2 = setup["user2"]
+    user3 = accounts.test_accounts[3]
+
+    # user1 already has a profile and a generic hub, user2 only has a profile
+    existing_hub = art_commission_hub_owners.createGenericCommissionHub(user1.address, sender=user1).return_value
+    profile_factory.createProfile(user2.address, sender=deployer)
+    user2_profile = profile_factory.getProfile(user2.address)
+    profile_count_before = profile_factory.allUserProfilesCount()
+
+    tx = art_commission_hub_owners.createGenericCommissionHubs(
+        [user1.address, user2.address, user3.address], sender=deployer
+    )
+    created_hubs = [e.commission_hub for e in tx.events if e.event_name == "GenericCommissionHubCreated"]
+
+    # Only user2 and user3 get new hubs, user1 keeps the original one
+    assert len(created_hubs) == 2
+    assert art_commission_hub_owners.getCommissionHubCountByOwner(user1.address) == 1
+    assert art_commission_hub_owners.getArtCommissionHubByOwner(1, "0x1000000000000000000000000000000000000001", int(user1.address, 16)) == existing_hub
+    for user, hub in zip([user2, user3], created_hubs):
+        assert art_commission_hub_owners.isGeneric(hub) is True
+        assert art_commission_hub_owners.getCommissionHubsByOwnerWithOffset(user.address, 0, 10, False) == [hub]
+        assert project.ArtCommissionHub.at(hub).owner() == user.address
+
+    # Only user3 needed a profile and user2's profile was left alone
+    assert profile_factory.allUserProfilesCount() == profile_count_before + 1
+    assert profile_factory.getProfile(user2.address) == user2_profile
+    assert profile_factory.hasProfile(user3.address) is True
+    assert project.Profile.at(profile_factory.getProfile(user3.address)).getCommissionHubCount() == 1
+
+
+def test_create_generic_commission_hubs_batch_permission_denial(setup):
+    """Test that only the contract owner can batch create generic hubs"""
+    art_commission_hub_owners = setup["art_commission_hub_owners"]
+    user1 = setup["user1"]
+
+    with pytest.raises(Exception) as excinfo:
+        art_commission_hub_owners.createGenericCommissionHubs([user1.address], sender=user1)
+    assert "Only the owner can batch create generic commission hubs" in str(excinfo.value)
+    assert art_commission_hub_owners.getCommissionHubCountByOwner(user1.address) == 0
@@ -270,4 +270,103 @@ def test_cross_profile_verification_sync(setup):
     artist_unverified = artist_profile.getUnverifiedCommissionsByOffset(0, 10, False)
     commissioner_unverified = commissioner_profile.getUnverifiedCommissionsByOffset(0, 10, False)
     assert art_piece.address not in artist_unverified, "Should not be in artist's unverified list"
-    assert art_piece.address not in commissioner_unverified, "Should not be in commissioner's unverified list" 
\ No newline at end of file
+    assert art_piece.address not in commissioner_unverified, "Should not be in commissioner's unverified list" 
+
+
+def _create_art_piece(setup, other_party, title):
+    """Create an art piece on the artist's profile and return it"""
+    artist = setup["artist"]
+    artist_profile = setup["artist_profile"]
+    artist_profile.createArtPiece(
+        setup["art_piece_template"].address,
+        TEST_TOKEN_URI_DATA,
+        TEST_TOKEN_URI_DATA_FORMAT,
+        title,
+        TEST_DESCRIPTION,
+        True,  # is_artist
+        other_party.address,
+        False,  # ai_generated
+        setup["commission_hub"].address,
+        False,  # is_profile_art
+        sender=artist
+    )
+    return project.ArtPiece.at(artist_profile.getArtPiecesByOffset(0, 1, True)[0])
+
+
+def test_link_art_pieces_as_my_commissions_batch(setup):
+    """Test batch linking reports per-piece outcomes instead of reverting"""
+    commissioner = setup["commissioner"]
+    commissioner_profile = setup["commissioner_profile"]
+    art_piece = setup["art_piece"]
+    second_piece = _create_art_piece(setup, commissioner, "Second Commission")
+    private_piece = _create_art_piece(setup, setup["artist"], "Private Piece")
+
+    batch = [art_piece.address, second_piece.address, private_piece.address, art_piece.address]
+
+    # Outcomes: linked, linked, not a commission, already added (unverified)
+    assert commissioner_profile.linkArtPiecesAsMyCommissions.call(batch, sender=commissioner) == [0, 0, 2, 6]
+
+    tx = commissioner_profile.linkArtPiecesAsMyCommissions(batch, sender=commissioner)
+    failed = [e.reason for e in tx.events if e.event_name == "CommissionFailedLink"]
+    assert failed == ["Not a commission art piece", "Commission already added, but unverified.  Please verify."]
+
+    unverified = commissioner_profile.getUnverifiedCommissionsByOffset(0, 10, False)
+    assert art_piece.address in unverified
+    assert second_piece.address in unverified
+    assert private_piece.address not in unverified
+    assert commissioner_profile.myUnverifiedCommissionCount() == 2
+    # Commissioner role is recorded without re-reading the artist
+    assert commissioner_profile.myCommissionRole(second_piece.address) == False
+
+    # Blacklisted parties are reported, whitelisted parties go straight to the verified list
+    commissioner_profile.addToBlacklist(setup["artist"].address, sender=commissioner)
+    third_piece = _create_art_piece(setup, commissioner, "Third Commission")
+    assert commissioner_profile.linkArtPiecesAsMyCommissions.call([third_piece.address], sender=commissioner) == [3]
+    commissioner_profile.removeFromBlacklist(setup["artist"].address, sender=commissioner)
+    commissioner_profile.addToWhitelist(setup["artist"].address, sender=commissioner)
+    commissioner_profile.linkArtPiecesAsMyCommissions([third_piece.address], sender=commissioner)
+    assert third_piece.address in commissioner_profile.getCommissionsByOffset(0, 10, False)
+
+
+def test_link_art_pieces_as_my_commissions_batch_permissions(setup):
+    """Test only the profile owner (or the factory) can batch link"""
+    with pytest.raises(Exception) as exc_info:
+        setup["commissioner_profile"].linkArtPiecesAsMyCommissions([setup["art_piece"].address], sender=setup["artist"])
+    assert "No permission to add commission" in str(exc_info.value)
+
+
+def test_get_profile_summary(setup):
+    """Test getProfileSummary returns the counters, flags and newest pages in one call"""
+    artist = setup["artist"]
+    artist_profile = setup["artist_profile"]
+    art_piece = setup["art_piece"]
+    second_piece = _create_art_piece(setup, setup["commissioner"], "Second Commission")
+    third_piece = _create_art_piece(setup, setup["commissioner"], "Third Commission")
+
+    summary = artist_profile.getProfileSummary(2)
+    assert summary.owner == artist.address
+    assert summary.isArtist == True
+    assert summary.allowUnverifiedCommissions == True
+    assert summary.artSales1155 == artist_profile.artSales1155()
+    assert summary.profileSocial == artist_profile.profileSocial()
+    assert summary.myArtCount == artist_profile.myArtCount() == 3
+    assert summary.myCommissionCount == artist_profile.myCommissionCount()
+    assert summary.myUnverifiedCommissionCount == artist_profile.myUnverifiedCommissionCount()
+
+    # First page of each list matches the reverse offset getters
+    assert summary.latestArtPieces == [third_piece.address, second_piece.address]
+    assert summary.latestArtPieces == artist_profile.getArtPiecesByOffset(0, 2, True)
+    assert summary.latestCommissions == artist_profile.getCommissionsByOffset(0, 2, True)
+    assert summary.latestUnverifiedCommissions == artist_profile.getUnverifiedCommissionsByOffset(0, 2, True)
+    assert art_piece.address not in summary.latestArtPieces
+
+    # Commission hubs come from ArtCommissionHubOwners
+    hub_owner_profile = project.Profile.at(setup["profile_factory"].getProfile(setup["hub_owner"].address))
+    hub_summary = hub_owner_profile.getProfileSummary(10)
+    assert hub_summary.commissionHubCount == hub_owner_profile.getCommissionHubCount() == 1
+    assert hub_summary.latestCommissionHubs == [setup["commission_hub"].address]
+    assert hub_summary.isArtist == False
+    assert len(hub_summary.latestArtPieces) == 0
+
+    # Page size is capped like the offset getters
+    assert len(artist_profile.getProfileSummary(1000).latestArtPieces) == 3
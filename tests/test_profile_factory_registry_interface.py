@@ -235,4 +235,50 @@ def test_profile_factory_registry_cross_profile_updates(setup):
     user1_verified = user1_profile_contract.getCommissionsByOffset(0, 10, False)
     user2_verified = user2_profile_contract.getCommissionsByOffset(0, 10, False)
     assert art_piece.address in user1_verified, "Should be in user1's verified list due to whitelisting"
-    assert art_piece.address in user2_verified, "Should be in user2's verified list due to whitelisting" 
\ No newline at end of file
+    assert art_piece.address in user2_verified, "Should be in user2's verified list due to whitelisting" 
+
+
+def test_create_profiles_batch(setup):
+    """Test that createProfiles creates many profiles at once and skips existing users"""
+    deployer = setup["deployer"]
+    user1 = setup["user1"]
+    profile_factory = setup["profile_factory"]
+    user1_profile = setup["user1_profile"]
+    new_users = [accounts.test_accounts[i] for i in range(3, 6)]
+
+    count_before = profile_factory.allUserProfilesCount()
+    latest_before = profile_factory.getLatestUserProfiles()
+
+    # user1 already has a profile and new_users[0] is listed twice
+    owners = [user1.address, new_users[0].address] + [u.address for u in new_users]
+    tx = profile_factory.createProfiles(owners, True, sender=deployer)
+    created_events = [e for e in tx.events if e.event_name == "ProfileCreated"]
+    assert [e.user for e in created_events] == [u.address for u in new_users]
+    created_profiles = [e.profile for e in created_events]
+
+    assert len(created_profiles) == len(new_users)
+    assert profile_factory.getProfile(user1.address) == user1_profile
+    for user, profile_address in zip(new_users, created_profiles):
+        assert profile_factory.getProfile(user.address) == profile_address
+        assert profile_factory.getProfileSocial(user.address) != ZERO_ADDRESS
+        profile = project.Profile.at(profile_address)
+        assert profile.owner() == user.address
+        assert profile.isArtist() is True
+
+    # Registry bookkeeping matches what one createProfile per user would have done
+    assert profile_factory.allUserProfilesCount() == count_before + len(new_users)
+    assert profile_factory.getAllUsersByOffset(count_before, 10, False) == [u.address for u in new_users]
+    latest = profile_factory.getLatestUserProfiles()
+    assert list(latest[:count_before]) == list(latest_before[:count_before])
+    assert list(latest[count_before:count_before + len(new_users)]) == [u.address for u in new_users]
+
+
+def test_create_profiles_batch_rejects_empty_address(setup):
+    """Test that a batch containing the zero address reverts"""
+    deployer = setup["deployer"]
+    profile_factory = setup["profile_factory"]
+
+    with pytest.raises(Exception) as excinfo:
+        profile_factory.createProfiles([accounts.test_accounts[3].address, ZERO_ADDRESS], False, sender=deployer)
+    assert "Invalid profile address" in str(excinfo.value)
+    assert profile_factory.hasProfile(accounts.test_accounts[3].address) is False